@@ -0,0 +1,52 @@
+"""
+Measure how fast treasure budgets are worked out for many parties and ranges of levels.
+
+Run from the repository root with `python -m benchmarks.bench_budget`.
+"""
+
+from pf2e_wealth_calculator.budget import get_treasure_table
+from pf2e_wealth_calculator.dataframes import tbl
+
+import random
+import time
+
+PARTY_SIZES = list(range(1, 9))
+
+
+def make_ranges(n_ranges: int) -> list[tuple[int, int]]:
+    rng = random.Random(0)
+    return [tuple(sorted(rng.sample(range(1, 21), 2))) for _ in range(n_ranges)]
+
+
+def main(n_ranges: int = 10_000):
+    table = get_treasure_table()
+    ranges = make_ranges(n_ranges)
+    n_budgets = len(PARTY_SIZES) * n_ranges
+
+    print(f"Budgets of {len(PARTY_SIZES)} party sizes over {n_ranges} ranges (seconds)")
+    total = tbl["Total Value"]
+    start = time.perf_counter()
+    # Like the table was read before, without the party size
+    for low, high in ranges:
+        total[low - 1 : high].sum()
+    print(f"  Slicing the table:   {time.perf_counter() - start:7.3f} (4 PCs only)")
+
+    start = time.perf_counter()
+    for size in PARTY_SIZES:
+        for low, high in ranges:
+            table.budget(low, high, size)
+    print(f"  Prefix sums:         {time.perf_counter() - start:7.3f}")
+
+    table.budgets(PARTY_SIZES, ranges[:1])
+    start = time.perf_counter()
+    budgets = table.budgets(PARTY_SIZES, ranges)
+    print(f"  Vectorized:          {time.perf_counter() - start:7.3f}")
+
+    start = time.perf_counter()
+    table.compare(budgets // 2, PARTY_SIZES, ranges)
+    print(f"  Vectorized compare:  {time.perf_counter() - start:7.3f}")
+    print(f"  ({n_budgets} budgets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Time the currency path of parse_database and the pricing of catalog items against the
+regexes they used to run.
+
+Run from the repository root with `python -m benchmarks.bench_currency`.
+"""
+
+from pf2e_wealth_calculator.structs import ItemInfo, Money, Origins
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import random
+import re
+import timeit
+
+
+def legacy_get_price(price_str: str, amount: int, origin: Origins) -> Money:
+    price_match = re.search(r"\d*(,\d*)?", price_str)
+    type_match = re.search(r"cp|sp|gp", price_str)
+    value = int(price_match.group().replace(",", "")) * amount
+    coin_type = type_match.group()
+    if coin_type == "cp":
+        return Money(value, 0, 0, origin=origin)
+    elif coin_type == "sp":
+        return Money(0, value, 0, origin=origin)
+    return Money(0, 0, value, origin=origin)
+
+
+def legacy_currency(item_name: str, amount: int) -> ItemInfo:
+    item_name = item_name.strip()
+    if re.match(r"\*?\ *\d+([,\.]\d*)?\ *(cp|sp|gp)", item_name) is not None:
+        if item_name.find("*") == 0:
+            item_name = item_name.replace("*", "", 1)
+            value = legacy_get_price(item_name, amount, Origins.ART_OBJECT)
+            return ItemInfo(item_name, value, "art objects", "none")
+        else:
+            value = legacy_get_price(item_name, amount, Origins.CURRENCY)
+            return ItemInfo(item_name, value, "currency", "none")
+
+
+def make_lines(n_lines: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{'*' if rng.random() < 0.3 else ''}{rng.randint(1, 2000)}"
+        f"{' ' if rng.random() < 0.5 else ''}{rng.choice(['cp', 'sp', 'gp'])}"
+        for _ in range(n_lines)
+    ]
+
+
+def main(n_lines: int = 10_000, repeat: int = 5):
+    pf.get_catalog()
+    lines = make_lines(n_lines)
+
+    def run_legacy():
+        for line in lines:
+            legacy_currency(line, 2)
+
+    def run_current():
+        for line in lines:
+            pf.parse_database(line, 2)
+
+    for line in lines[:100]:
+        assert pf.parse_database(line, 2) == legacy_currency(line, 2)
+
+    legacy = min(timeit.repeat(run_legacy, number=1, repeat=repeat))
+    current = min(timeit.repeat(run_current, number=1, repeat=repeat))
+    print(f"Parsing {n_lines} currency lines")
+    print(f"  Uncompiled regexes: {legacy * 1e6 / n_lines:.2f} us per line")
+    print(
+        f"  Compiled tokenizer: {current * 1e6 / n_lines:.2f} us per line"
+        f" ({legacy / current:.2f}x)"
+    )
+
+    catalog = pf.get_catalog()
+    records = [record for record in catalog.records if record.price[0].isdigit()]
+
+    def run_legacy_prices():
+        for record in records:
+            legacy_get_price(record.price, 2, Origins.ITEM)
+
+    def run_catalog_prices():
+        for record in records:
+            catalog.price(record, 2)
+
+    legacy = min(timeit.repeat(run_legacy_prices, number=1, repeat=repeat))
+    current = min(timeit.repeat(run_catalog_prices, number=1, repeat=repeat))
+    print(f"Pricing {len(records)} catalog items")
+    print(f"  Parsed on every lookup: {legacy * 1e6 / len(records):.2f} us per item")
+    print(
+        f"  Parsed at load time: {current * 1e6 / len(records):.2f} us per item"
+        f" ({legacy / current:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare CLI runs with the on-disk item cache empty, warm and turned off.
+
+Every run is a fresh interpreter using a temporary cache directory, so the catalog
+snapshot is built once up front and only the item cache differs between runs.
+
+Run from the repository root with `python -m benchmarks.bench_disk_cache`.
+"""
+
+from benchmarks.bench_startup import SAMPLE_LOOT, time_command
+
+import os
+import statistics
+import tempfile
+
+
+def main(repeat: int = 5):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PF2EWC_CACHE_DIR"] = tmpdir
+        loot_file = os.path.join(tmpdir, "loot.txt")
+        with open(loot_file, "w") as file:
+            file.write(SAMPLE_LOOT)
+        items_db = os.path.join(tmpdir, "items.sqlite3")
+
+        # Build the catalog snapshot, which every mode shares
+        time_command(["-i", "longsword", "--no-cache"])
+
+        modes = {
+            "-i": ["-i", "+1 striking cold iron longsword (low)"],
+            "file": [loot_file, "-l", "5"],
+        }
+
+        print(f"Time to exit (median of {repeat} runs)")
+        for mode, args in modes.items():
+            cold = []
+            for _ in range(repeat):
+                if os.path.exists(items_db):
+                    os.remove(items_db)
+                cold.append(time_command(args)[1])
+            warm = [time_command(args)[1] for _ in range(repeat)]
+            off = [time_command([*args, "--no-cache"])[1] for _ in range(repeat)]
+
+            print(
+                f"  {mode:<6} empty {statistics.median(cold) * 1000:7.1f} ms"
+                f" / warm {statistics.median(warm) * 1000:7.1f} ms"
+                f" / off {statistics.median(off) * 1000:7.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure how the item cache speeds up pricing loot lists that repeat runed items.
+
+Run from the repository root with `python -m benchmarks.bench_item_cache`.
+"""
+
+from pf2e_wealth_calculator.cache import LRUCache
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import contextlib
+import io
+import random
+import time
+
+RUNED_ITEMS = [
+    "+1 striking longsword",
+    "+1 resilient invisibility padded armor",
+    "+2 greater striking greater extending frost whip",
+    "+3 major striking greater shock ancestral echoing vorpal glaive",
+    "+2 greater resilient bitter greater shadow djezet scale mail standard",
+    "+1 striking mithral warhammer (standard)",
+    "+1 striking frost handwraps of mighty blows",
+]
+
+
+def main(n_items: int = 300):
+    rng = random.Random(0)
+    names = [rng.choice(RUNED_ITEMS) for _ in range(n_items)]
+    cache = LRUCache(maxsize=64)
+
+    print(f"Pricing {n_items} runed items drawn from {len(RUNED_ITEMS)} names")
+    for label, item_cache in (("no cache", None), ("LRU cache", cache)):
+        # Rune parsing prints warnings for multi-word base items, keep them quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for name in names:
+                pf.price_item(name, rng.randint(1, 3), cache=item_cache)
+            elapsed = time.perf_counter() - start
+
+        print(f"  {label:<10} {elapsed * 1000:10.1f} ms")
+
+    print(f"  {cache.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare pricing a large loot file in full with updating its ledger after a small edit.
+
+Run from the repository root with `python -m benchmarks.bench_ledger`.
+"""
+
+from benchmarks.bench_pricing import make_ledger
+from pf2e_wealth_calculator.catalog import get_catalog
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        function(*args)
+    return time.perf_counter() - start
+
+
+def main(n_rows: int = 100_000, edited: float = 0.01):
+    get_catalog()
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PF2EWC_CACHE_DIR"] = tmpdir
+        loot_file = os.path.join(tmpdir, "loot.txt")
+        ledger = make_ledger(n_rows)
+        ledger.to_csv(loot_file, header=False, index=False)
+
+        print(f"Pricing {n_rows} rows (seconds)")
+        print(f"  Full pricing:        {timed(pf.get_file_stats, loot_file):7.3f}")
+        print(f"  First ledger run:    {timed(pf.get_ledger_stats, loot_file):7.3f}")
+        print(f"  Unchanged file:      {timed(pf.get_ledger_stats, loot_file):7.3f}")
+
+        # Change the amount of some lines, which makes them new lines to price
+        rows = rng.sample(range(n_rows), int(n_rows * edited))
+        ledger.loc[rows, "amount"] += 1
+        ledger.to_csv(loot_file, header=False, index=False)
+        print(
+            f"  {edited:.0%} of lines edited: "
+            f"{timed(pf.get_ledger_stats, loot_file):7.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
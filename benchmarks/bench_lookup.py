@@ -0,0 +1,48 @@
+"""
+Compare exact name lookups through a DataFrame scan and through the ItemCatalog.
+
+Run from the repository root with `python -m benchmarks.bench_lookup`.
+"""
+
+from pf2e_wealth_calculator.dataframes import itemlist
+from pf2e_wealth_calculator.catalog import get_catalog
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import random
+import timeit
+
+
+def main(n_names: int = 1000, repeat: int = 5):
+    catalog = get_catalog()
+    rng = random.Random(0)
+    names = rng.sample(catalog.names, n_names)
+
+    def scan():
+        for name in names:
+            itemlist[itemlist["name"] == name]
+
+    def hashed():
+        for name in names:
+            catalog.get(name)
+
+    def parse():
+        for name in names:
+            pf.parse_database(name, 1, quiet=True)
+
+    print(f"{n_names} lookups over {len(catalog)} items (best of {repeat})")
+    results = {}
+    for label, func in (
+        ("DataFrame scan", scan),
+        ("ItemCatalog.get", hashed),
+        ("parse_database", parse),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        results[label] = best / n_names
+        print(f"  {label:<16} {results[label] * 1e6:10.2f} µs/lookup")
+
+    speedup = results["DataFrame scan"] / results["ItemCatalog.get"]
+    print(f"  speedup: {speedup:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Time pricing a large loot file with each output format.
+
+Text output only prints the totals, so the difference with the structured formats is
+the cost of writing every priced item.
+
+Run from the repository root with `python -m benchmarks.bench_output`.
+"""
+
+from benchmarks.bench_pricing import make_ledger
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.output import OUTPUT_FORMATS
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import contextlib
+import os
+import tempfile
+import time
+
+
+def main(n_rows: int = 100_000):
+    get_catalog()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        loot_file = os.path.join(tmpdir, "loot.txt")
+        make_ledger(n_rows).to_csv(loot_file, header=False, index=False)
+
+        print(f"Pricing {n_rows} rows")
+        for output in OUTPUT_FORMATS:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+                devnull
+            ), contextlib.redirect_stderr(devnull):
+                start = time.perf_counter()
+                pf.console_entry_point([loot_file], "5", 0, True, False, output=output)
+                elapsed = time.perf_counter() - start
+
+            print(f"  {output:<6} {elapsed:7.3f} s ({n_rows / elapsed:9.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
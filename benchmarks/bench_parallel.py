@@ -0,0 +1,52 @@
+"""
+Time pricing several loot files with an increasing number of worker processes.
+
+Every run must print exactly the same report as the serial one. Run from the
+repository root with `python -m benchmarks.bench_parallel`.
+"""
+
+from benchmarks.bench_pricing import make_ledger
+from pf2e_wealth_calculator.catalog import get_catalog
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+
+def write_loot_files(directory: str, n_files: int, n_rows: int) -> list[str]:
+    files = []
+    for i in range(n_files):
+        path = os.path.join(directory, f"loot{i}.txt")
+        make_ledger(n_rows, seed=i).to_csv(path, header=False, index=False)
+        files.append(path)
+    return files
+
+
+def run(files: list[str], jobs: int) -> tuple[float, str]:
+    # Start every run from a cold item cache, like a fresh invocation would
+    pf.item_cache.clear()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        pf.console_entry_point(files, "1-5", 0, True, False, jobs)
+    return time.perf_counter() - start, output.getvalue()
+
+
+def main(n_files: int = 8, n_rows: int = 20_000, jobs=(1, 2, 4, 8)):
+    get_catalog()
+    print(f"Pricing {n_files} files of {n_rows} rows on {os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = write_loot_files(directory, n_files, n_rows)
+        serial_time, serial_output = run(files, 1)
+
+        for n_jobs in jobs:
+            elapsed, output = run(files, n_jobs)
+            assert output == serial_output, f"--jobs {n_jobs} changed the report"
+            print(f"  --jobs {n_jobs}: {elapsed:7.3f} s ({serial_time / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
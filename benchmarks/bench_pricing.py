@@ -0,0 +1,74 @@
+"""
+Compare pricing a loot ledger row by row with the batch price_loot API.
+
+Run from the repository root with `python -m benchmarks.bench_pricing`.
+"""
+
+from pf2e_wealth_calculator.catalog import get_catalog
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pandas as pd
+
+import random
+import time
+
+
+def make_ledger(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Make a ledger of mostly plain items with some currency, art objects, runes and materials."""
+
+    rng = random.Random(seed)
+    catalog = get_catalog()
+    # Skip names that only look like runed or precious items and can't be priced
+    plain = [
+        name
+        for name in catalog.names
+        if "+" not in name
+        and pf.parse_database(name, 1, catalog=catalog, quiet=True).category != "error"
+    ]
+    special = [
+        "25 gp",
+        "*200 gp",
+        "12 sp",
+        "+1 striking longsword",
+        "+2 greater striking flaming composite longbow",
+        "silver dagger low",
+    ]
+
+    names = [
+        rng.choice(special) if rng.random() < 0.1 else rng.choice(plain)
+        for _ in range(n_rows)
+    ]
+    amounts = [rng.randint(1, 5) for _ in range(n_rows)]
+    return pd.DataFrame({"name": names, "amount": amounts})
+
+
+def price_rows(loot: pd.DataFrame):
+    for _, row in loot.iterrows():
+        name, amount = row.tolist()
+        pf.price_item(name, amount)
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000, 50_000)):
+    get_catalog()
+    pf.price_loot(make_ledger(10))  # Warm up the item table
+
+    print("Pricing loot ledgers (seconds)")
+    for n_rows in sizes:
+        loot = make_ledger(n_rows)
+
+        start = time.perf_counter()
+        price_rows(loot)
+        row_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pf.price_loot(loot)
+        batch_time = time.perf_counter() - start
+
+        print(
+            f"  {n_rows:>7} rows: row by row {row_time:8.3f}"
+            f" / price_loot {batch_time:8.3f} ({row_time / batch_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Compare lookups restricted to a category through a filtered DataFrame, like
+parse_database used to do, and through the catalog's category partitions.
+
+Run from the repository root with `python -m benchmarks.bench_restricted`.
+"""
+
+from pf2e_wealth_calculator.dataframes import itemlist
+from pf2e_wealth_calculator.catalog import get_catalog
+
+import random
+import timeit
+
+
+def main(n_names: int = 200, repeat: int = 5):
+    catalog = get_catalog()
+    rng = random.Random(0)
+
+    print(f"{n_names} restricted lookups per category (best of {repeat})")
+    for category in ("runes", "weapons", "armor", "shields", "materials"):
+        names = [rng.choice(catalog.names) for _ in range(n_names)]
+
+        def filtered():
+            for name in names:
+                filtered_list = itemlist.set_index("category")
+                filtered_list = filtered_list.filter(like=category, axis=0)
+                filtered_list[filtered_list["name"] == name]
+
+        def partitioned():
+            for name in names:
+                catalog.get(name, category=category)
+
+        before = min(timeit.repeat(filtered, number=1, repeat=repeat)) / n_names
+        after = min(timeit.repeat(partitioned, number=1, repeat=repeat)) / n_names
+        print(
+            f"  {category:<10} DataFrame filter {before * 1e6:9.1f} µs"
+            f" / partition {after * 1e6:6.2f} µs ({before / after:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
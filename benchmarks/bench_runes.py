@@ -0,0 +1,64 @@
+"""
+Time pricing every combination of a rune from runes.csv with a base weapon or armor.
+
+Run from the repository root with `python -m benchmarks.bench_runes`.
+"""
+
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.dataframes import _pathfinder
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import contextlib
+import csv
+import io
+import time
+
+GRADES = ("lesser", "moderate", "greater", "major", "true")
+
+
+def written_name(rune: str) -> str:
+    """Write a rune the way it appears in an item name, like "greater striking"."""
+
+    if rune.endswith(")") and "(" in rune:
+        base, qualifier = rune[:-1].split(" (", 1)
+        return f"{qualifier} {base}" if qualifier in GRADES else base
+    return rune
+
+
+def make_names() -> list[str]:
+    with open(_pathfinder("tables/runes.csv"), encoding="utf-8-sig") as file:
+        runes = [row["Name"].lower() for row in csv.DictReader(file)]
+
+    catalog = get_catalog()
+    bases = [
+        record.name
+        for record in catalog.records
+        if record.subcategory in ("base weapons", "base armor")
+        and "+" not in record.name
+    ]
+
+    return [
+        f"+1 {written_name(rune)} {base}"
+        for rune in runes
+        if "potency" not in rune
+        for base in bases
+    ]
+
+
+def main():
+    get_catalog()
+    names = make_names()
+
+    # Warnings for the odd base item that can't be found aren't part of the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for name in names:
+            pf.rune_calculator(name, 1)
+        elapsed = time.perf_counter() - start
+
+    print(f"Pricing {len(names)} rune/base combinations")
+    print(f"  {elapsed:.3f} s, {elapsed * 1e6 / len(names):.1f} us per item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measure how fast random items and treasure parcels are generated.
+
+Run from the repository root with `python -m benchmarks.bench_sampling`.
+"""
+
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.sampling import get_sampler, treasure_parcel
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import random
+import time
+
+
+def per_second(function, n_runs: int) -> float:
+    start = time.perf_counter()
+    for i in range(n_runs):
+        function(i)
+    return n_runs / (time.perf_counter() - start)
+
+
+def main(n_items: int = 1_000_000, n_parcels: int = 5_000):
+    catalog = get_catalog()
+    sampler = get_sampler(catalog)
+
+    print(f"Picking {n_items} random items of levels 2-8 (seconds)")
+    start = time.perf_counter()
+    random.Random(0).choices(catalog.in_level_range(2, 8), k=n_items)
+    print(f"  random.choices:      {time.perf_counter() - start:7.3f}")
+    start = time.perf_counter()
+    sampler.sample_indices(n_items, 2, 8, seed=0)
+    print(f"  Sampler:             {time.perf_counter() - start:7.3f}")
+    start = time.perf_counter()
+    sampler.sample_indices(n_items, 2, 8, seed=0, rarity_weights={"rare": 0.2})
+    print(f"  Sampler, weighted:   {time.perf_counter() - start:7.3f}")
+
+    print("Treasure parcels per second")
+    for level in (1, 10, 20):
+        rate = per_second(lambda seed: treasure_parcel(level, seed=seed), n_parcels)
+        print(f"  Level {level:2}:            {rate:7.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Load test the pricing server, in requests per second.
+
+Starts `pf2ewc serve` on a temporary Unix socket, then has several clients send item
+lookups at once, both over a connection kept open and with a new connection per request
+like `pf2ewc --remote` does. Running a new pf2ewc process per lookup is timed for
+comparison.
+
+Run from the repository root with `python -m benchmarks.bench_server`.
+"""
+
+from benchmarks.bench_startup import time_command
+
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ITEMS = [
+    "longsword",
+    "+1 striking longsword",
+    "+2 greater striking flaming cold iron warhammer (standard)",
+    "oil of potency",
+    "smokestick (lesser)",
+    "+1 resilient chain mail",
+    "storm flash",
+    "silver dagger low",
+]
+
+
+def make_request(rng: random.Random) -> bytes:
+    request = {"op": "item", "name": rng.choice(ITEMS)}
+    return json.dumps(request).encode("utf-8") + b"\n"
+
+
+async def keep_alive_client(address: str, n_requests: int, seed: int):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_unix_connection(address)
+    for _ in range(n_requests):
+        writer.write(make_request(rng))
+        await writer.drain()
+        assert json.loads(await reader.readline())["status"] == 0
+    writer.close()
+
+
+async def one_shot_client(address: str, n_requests: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(n_requests):
+        reader, writer = await asyncio.open_unix_connection(address)
+        writer.write(make_request(rng))
+        await writer.drain()
+        assert json.loads(await reader.readline())["status"] == 0
+        writer.close()
+
+
+async def load(client, address: str, n_clients: int, n_requests: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(address, n_requests, seed) for seed in range(n_clients))
+    )
+    return n_clients * n_requests / (time.perf_counter() - start)
+
+
+def main(n_clients: int = 16, n_requests: int = 500):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PF2EWC_CACHE_DIR"] = tmpdir
+        address = os.path.join(tmpdir, "pf2ewc.sock")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "pf2e_wealth_calculator.entry_point", "serve"],
+            env={**os.environ, "PF2EWC_SERVER": address},
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(address):
+                time.sleep(0.05)
+
+            print(f"{n_clients} concurrent clients, {n_requests} item lookups each")
+            for name, client in [
+                ("kept-alive connections", keep_alive_client),
+                ("connection per request", one_shot_client),
+            ]:
+                rate = asyncio.run(load(client, address, n_clients, n_requests))
+                print(f"  {name:<24} {rate:9.0f} requests/s")
+        finally:
+            server.terminate()
+            server.wait()
+
+        runs = [time_command(["-i", "+1 striking longsword"])[1] for _ in range(5)]
+        print(f"  {'process per request':<24} {5 / sum(runs):9.1f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
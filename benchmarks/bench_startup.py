@@ -0,0 +1,68 @@
+"""
+Measure the time to first output of each pf2ewc CLI mode.
+
+Every mode is run in a fresh interpreter, like a user invoking the command would,
+and timed until the first byte is written to stdout and until the process exits.
+
+Run from the repository root with `python -m benchmarks.bench_startup`.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SAMPLE_LOOT = """\
+longsword
+oil of potency, 2
+smokestick (lesser), 5
+32sp
++1 striking shock rapier
+storm flash
+cold iron warhammer (standard)
+"""
+
+
+def time_command(args: list[str]) -> tuple[float, float]:
+    """Run the CLI with the given arguments and return (first output, exit) times."""
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pf2e_wealth_calculator.entry_point", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    proc.stdout.read(1)
+    first_output = time.perf_counter() - start
+    proc.stdout.read()
+    proc.wait()
+    return first_output, time.perf_counter() - start
+
+
+def main(repeat: int = 5):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        loot_file = os.path.join(tmpdir, "loot.txt")
+        with open(loot_file, "w") as file:
+            file.write(SAMPLE_LOOT)
+
+        modes = {
+            "--format": ["--format"],
+            "--tbl": ["--tbl"],
+            "-i": ["-i", "+1 striking longsword"],
+            "-r": ["-r", "5", "-l", "3-5"],
+            "file": [loot_file, "-l", "5"],
+        }
+
+        print(f"Time to first output / exit (median of {repeat} runs)")
+        for mode, args in modes.items():
+            runs = [time_command(args) for _ in range(repeat)]
+            first = statistics.median(run[0] for run in runs)
+            total = statistics.median(run[1] for run in runs)
+            print(f"  {mode:<10} {first * 1000:8.1f} ms / {total * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Compare the memory and summing speed of the slotted Money and ItemInfo with the
+plain dataclasses they replaced.
+
+Run from the repository root with `python -m benchmarks.bench_structs`.
+"""
+
+from pf2e_wealth_calculator.structs import ItemInfo, Money, Origins
+
+from dataclasses import dataclass, field
+import time
+import tracemalloc
+import typing
+
+
+@dataclass
+class PlainMoney:
+    cp: int = 0
+    sp: int = 0
+    gp: int = 0
+    origin: Origins = Origins.ITEM
+    check_origin: bool = True
+
+    def __add__(self, val):
+        if type(val) == PlainMoney:
+            if self.check_origin and val.check_origin and self.origin != val.origin:
+                raise ValueError("Origins don't match")
+            return PlainMoney(
+                self.cp + val.cp,
+                self.sp + val.sp,
+                self.gp + val.gp,
+                self.origin,
+                self.check_origin,
+            )
+        raise TypeError
+
+
+@dataclass(frozen=True)
+class PlainItemInfo:
+    name: str = "item"
+    price: PlainMoney = field(default_factory=PlainMoney)
+    category: str = "none"
+    subcategory: str = "none"
+    level: int = 0
+    rarity: str = "common"
+    bulk: typing.Union[int, str] = 0
+
+
+def measure_memory(money_cls, item_cls, n_items: int) -> int:
+    tracemalloc.start()
+    items = [
+        item_cls("longsword", money_cls(i % 10, i % 7, i), "weapons")
+        for i in range(n_items)
+    ]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def time_sum(money_cls, n_items: int, in_place: bool) -> float:
+    prices = [money_cls(i % 10, i % 7, i) for i in range(n_items)]
+    start = time.perf_counter()
+    total = money_cls()
+    if in_place:
+        for price in prices:
+            total.accumulate(price)
+    else:
+        for price in prices:
+            total = total + price
+    return time.perf_counter() - start
+
+
+def main(n_items: int = 1_000_000):
+    print(f"{n_items} items")
+
+    plain = measure_memory(PlainMoney, PlainItemInfo, n_items)
+    slotted = measure_memory(Money, ItemInfo, n_items)
+    print(
+        f"  Memory: dataclasses {plain / 2**20:7.1f} MiB"
+        f" / slotted {slotted / 2**20:7.1f} MiB ({plain / slotted:.2f}x smaller)"
+    )
+
+    plain_sum = time_sum(PlainMoney, n_items, in_place=False)
+    slotted_sum = time_sum(Money, n_items, in_place=False)
+    accumulated = time_sum(Money, n_items, in_place=True)
+    print(
+        f"  Summing: dataclasses {plain_sum:.3f} s / slotted {slotted_sum:.3f} s"
+        f" / slotted in place {accumulated:.3f} s ({plain_sum / accumulated:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare the suggestions for misspelled item names given by the trigram index and by
+difflib.get_close_matches over every name, checking that the top suggestions match.
+
+Run from the repository root with `python -m benchmarks.bench_suggest`.
+"""
+
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.suggest import SuggestionIndex, closest_name
+
+import random
+import statistics
+import string
+import time
+
+
+def make_typo(name: str, rng: random.Random) -> str:
+    """Apply one to three random deletions, insertions, substitutions or swaps."""
+
+    chars = list(name)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(chars))
+        edit = rng.randrange(4)
+        if edit == 0 and len(chars) > 1:
+            del chars[i]
+        elif edit == 1:
+            chars.insert(i, rng.choice(string.ascii_lowercase))
+        elif edit == 2:
+            chars[i] = rng.choice(string.ascii_lowercase)
+        elif i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+
+    return "".join(chars)
+
+
+def main(n_typos: int = 200):
+    names = get_catalog().names
+    rng = random.Random(0)
+    typos = [make_typo(rng.choice(names), rng) for _ in range(n_typos)]
+
+    start = time.perf_counter()
+    index = SuggestionIndex(names)
+    build_time = time.perf_counter() - start
+
+    difflib_times, index_times, mismatches = [], [], []
+    for typo in typos:
+        start = time.perf_counter()
+        expected = closest_name(typo, names)
+        difflib_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        suggestion = index.best(typo)
+        index_times.append(time.perf_counter() - start)
+
+        if suggestion != expected:
+            mismatches.append((typo, expected, suggestion))
+
+    print(f"{n_typos} misspelled names, index built in {build_time * 1000:.1f} ms")
+    for label, times in (("difflib", difflib_times), ("trigram index", index_times)):
+        print(
+            f"  {label:<14} median {statistics.median(times) * 1000:8.3f} ms"
+            f" / max {max(times) * 1000:8.3f} ms"
+        )
+    print(f"  matching suggestions: {n_typos - len(mismatches)}/{n_typos}")
+    for typo, expected, suggestion in mismatches:
+        print(f'    "{typo}": difflib "{expected}", index "{suggestion}"')
+
+
+if __name__ == "__main__":
+    main()
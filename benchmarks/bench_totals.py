@@ -0,0 +1,58 @@
+"""
+Compare summing priced loot by origin with Money objects and with int64 arrays.
+
+Run from the repository root with `python -m benchmarks.bench_totals`.
+"""
+
+from benchmarks.bench_pricing import make_ledger
+from pf2e_wealth_calculator.catalog import get_catalog
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import numpy as np
+import pandas as pd
+
+import time
+
+
+def sum_objects(priced: pd.DataFrame) -> dict:
+    money = {origin: pf.Money(origin=origin) for origin in pf.Origins}
+    for origin, cp, sp, gp in zip(
+        priced["origin"], priced["cp"], priced["sp"], priced["gp"]
+    ):
+        money[origin] += pf.Money(int(cp), int(sp), int(gp), origin)
+    return money
+
+
+def sum_arrays(priced: pd.DataFrame) -> dict:
+    money = {origin: pf.Money(origin=origin) for origin in pf.Origins}
+    codes, origins = pd.factorize(priced["origin"])
+    totals = np.zeros((len(origins), 3), dtype=np.int64)
+    np.add.at(totals, codes, priced[["cp", "sp", "gp"]].to_numpy(dtype=np.int64))
+    for origin, (cp, sp, gp) in zip(origins, totals.tolist()):
+        money[origin].add_coins(cp, sp, gp)
+    return money
+
+
+def main(sizes: tuple[int, ...] = (10_000, 100_000, 500_000)):
+    get_catalog()
+    print("Summing priced loot by origin (seconds)")
+    for n_rows in sizes:
+        priced = pf.price_loot(make_ledger(n_rows))
+
+        start = time.perf_counter()
+        expected = sum_objects(priced)
+        object_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = sum_arrays(priced)
+        array_time = time.perf_counter() - start
+
+        assert result == expected
+        print(
+            f"  {n_rows:>7} rows: Money objects {object_time:7.3f}"
+            f" / int64 arrays {array_time:7.3f} ({object_time / array_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
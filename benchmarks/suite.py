@@ -0,0 +1,215 @@
+"""
+Run the main benchmarks in one go and save their timings as JSON, to compare commits.
+
+Every benchmark runs on the same synthetic loot ledgers, made from a fixed seed, so two
+result files are directly comparable. Times are in seconds, the median of the repeats.
+
+Run from the repository root with `python -m benchmarks.suite`, then compare two runs
+with `python -m benchmarks.suite --compare before.json after.json`.
+"""
+
+from benchmarks.bench_budget import PARTY_SIZES, make_ranges
+from benchmarks.bench_pricing import make_ledger
+from benchmarks.bench_startup import time_command
+from benchmarks.bench_suggest import make_typo
+from pf2e_wealth_calculator.budget import get_treasure_table
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.sampling import treasure_parcel
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+
+FIXTURE_SIZES = (1_000, 10_000, 100_000)
+
+RUNED_ITEMS = (
+    "+1 striking longsword",
+    "+2 greater striking flaming composite longbow",
+    "+1 resilient full plate",
+    "+3 major striking keen vorpal greataxe",
+    "+2 greater resilient energy-resistant leather armor",
+)
+
+
+def median_time(function: typing.Callable[[], typing.Any], repeat: int) -> float:
+    """Run a function repeat times, without its output, and get the median time."""
+
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def per_call(
+    function: typing.Callable[[str], typing.Any], names: list[str], repeat: int
+) -> float:
+    """Get the median time of calling a function once per name, divided by the names."""
+
+    def run():
+        for name in names:
+            function(name)
+
+    return median_time(run, repeat) / len(names)
+
+
+def write_fixtures(directory: str, sizes: typing.Iterable[int]) -> dict[int, str]:
+    """Write a loot ledger of each size in the directory, and get their paths."""
+
+    paths = {}
+    for n_rows in sizes:
+        path = os.path.join(directory, f"loot_{n_rows}.txt")
+        make_ledger(n_rows).to_csv(path, header=False, index=False)
+        paths[n_rows] = path
+    return paths
+
+
+def run_suite(
+    sizes: typing.Iterable[int] = FIXTURE_SIZES, repeat: int = 5
+) -> dict[str, float]:
+    """Run every benchmark and get their times by name."""
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.environ["PF2EWC_CACHE_DIR"] = os.path.join(tmpdir, "cache")
+
+        # The first run also builds the catalog snapshot, like a fresh install would
+        results["startup.cold"] = time_command(["-i", "longsword"])[1]
+        for mode, args in {
+            "item": ["-i", "+1 striking longsword", "--no-cache"],
+            "tbl": ["--tbl"],
+        }.items():
+            runs = [time_command(args)[1] for _ in range(repeat)]
+            results[f"startup.{mode}"] = statistics.median(runs)
+
+        catalog = get_catalog()
+        rng = random.Random(0)
+        # Some names, like those of precious materials, can't be priced on their own
+        names = [
+            name
+            for name in rng.sample(catalog.names, 1200)
+            if pf.price_item(name, cache=None, quiet=True).category != "error"
+        ][:1000]
+        typos = [make_typo(name, rng) for name in names[:200]]
+
+        # No item cache, so each item is really looked up every time
+        results["lookup.single"] = per_call(
+            lambda name: pf.price_item(name, cache=None), names, repeat
+        )
+        results["lookup.runed"] = per_call(
+            lambda name: pf.price_item(name, cache=None), list(RUNED_ITEMS), repeat
+        )
+        results["lookup.fuzzy_miss"] = per_call(catalog.suggestions.best, typos, repeat)
+
+        paths = write_fixtures(tmpdir, sizes)
+        for n_rows, path in paths.items():
+            pf.item_cache.clear()
+            results[f"pricing.{n_rows}"] = median_time(
+                lambda: pf.get_file_stats(path), repeat if n_rows < 100_000 else 3
+            )
+
+        results["random.items_10000"] = median_time(
+            lambda: pf.pick_random_records(10_000, "1-20", seed=0), repeat
+        )
+        results["random.parcels_1000"] = median_time(
+            lambda: [treasure_parcel(10, seed=seed) for seed in range(1000)], repeat
+        )
+
+        ranges = make_ranges(10_000)
+        results["budget.matrix_80000"] = median_time(
+            lambda: get_treasure_table().budgets(PARTY_SIZES, ranges), repeat
+        )
+
+    return results
+
+
+def environment() -> dict[str, str]:
+    """Describe where the suite ran, to tell result files apart."""
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(before_path: str, after_path: str):
+    """Print how the timings of two result files compare."""
+
+    with open(before_path) as file:
+        before = json.load(file)
+    with open(after_path) as file:
+        after = json.load(file)
+
+    print(
+        f"{before['environment']['commit']} -> {after['environment']['commit']}"
+        " (seconds)"
+    )
+    for name, old in before["results"].items():
+        new = after["results"].get(name)
+        if new is None:
+            print(f"  {name:<22} {old:10.6f}          gone")
+        else:
+            print(f"  {name:<22} {old:10.6f} {new:10.6f} {new / old:6.2f}x")
+    for name in after["results"].keys() - before["results"].keys():
+        print(f"  {name:<22}        new {after['results'][name]:10.6f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "-o", "--output", default="bench_results.json", help="where to save the JSON"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=FIXTURE_SIZES,
+        help="the number of lines of the loot ledgers to price",
+    )
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two results"
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+
+    results = run_suite(args.sizes, args.repeat)
+    with open(args.output, "w") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+
+    for name, seconds in results.items():
+        print(f"  {name:<22} {seconds:10.6f}")
+    print(f"Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from pf2e_wealth_calculator.calculator import LootReport, WealthCalculator
+from pf2e_wealth_calculator.structs import (
+    ItemInfo,
+    ItemNotFoundError,
+    LevelError,
+    Money,
+    Origins,
+)
@@ -0,0 +1,172 @@
+"""
+Treasure budgets of the Treasure by Level table, for any party size and range of levels.
+
+The gp columns of the table are kept as cumulative sums, so the budget of a range of
+levels is the difference of two of them however long the range is. Budgets of many
+parties over many ranges, and how they compare to the value of their loot, are worked
+out at once with NumPy.
+
+The table is made for four PCs. Each PC more or less adds or removes the table's
+Currency per Additional PC, along with a fourth of the items of the level, as the
+rules add an item or two for each PC beyond the fourth.
+"""
+
+from pf2e_wealth_calculator.dataframes import _pathfinder
+from pf2e_wealth_calculator.structs import LevelError
+
+import csv
+import functools
+import itertools
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Party size the Treasure by Level table is made for
+TABLE_PARTY_SIZE = 4
+
+LEVEL_ERROR = "Please only insert levels between 1 and 20"
+PARTY_SIZE_ERROR = "A party needs at least one PC"
+
+
+class TreasureTable:
+    """
+    Cumulative sums of the gp columns of the Treasure by Level table.
+
+    The total value, party currency and currency per additional PC of the levels up to
+    and including a level are at its position in the lists, and position 0 is zero.
+    """
+
+    def __init__(self, rows: typing.Iterable[tuple[int, int, int]]):
+        rows = list(rows)
+        self.max_level = len(rows)
+        self.total: list[int] = [0, *itertools.accumulate(row[0] for row in rows)]
+        self.currency: list[int] = [0, *itertools.accumulate(row[1] for row in rows)]
+        self.per_pc: list[int] = [0, *itertools.accumulate(row[2] for row in rows)]
+        self._arrays: typing.Optional[tuple["npt.NDArray[np.int64]", ...]] = None
+
+    @classmethod
+    def from_csv(
+        cls, path: str = _pathfinder("tables/treasurebylevel.csv")
+    ) -> "TreasureTable":
+        with open(path, "r", newline="") as file:
+            return cls(
+                (
+                    int(row["Total Value"]),
+                    int(row["Party Currency"]),
+                    int(row["Currency per Additional PC"]),
+                )
+                for row in csv.DictReader(file)
+            )
+
+    def _range(
+        self, low: int, high: typing.Optional[int], party_size: int
+    ) -> tuple[int, int]:
+        if party_size < 1:
+            raise ValueError(PARTY_SIZE_ERROR)
+        high = low if high is None else high
+        low, high = min(low, high), max(low, high)
+        if low < 1 or high > self.max_level:
+            raise LevelError(LEVEL_ERROR)
+        return low - 1, high
+
+    def budget(
+        self,
+        low: int,
+        high: typing.Optional[int] = None,
+        party_size: int = TABLE_PARTY_SIZE,
+    ) -> int:
+        """
+        Get the gp a party should find over a level, or from low to high inclusive.
+
+        Raises LevelError for levels that aren't in the table and ValueError for
+        parties without PCs.
+        """
+
+        start, stop = self._range(low, high, party_size)
+        total = self.total[stop] - self.total[start]
+        extra = party_size - TABLE_PARTY_SIZE
+        if extra == 0:
+            return total
+
+        items = total - (self.currency[stop] - self.currency[start])
+        per_pc = self.per_pc[stop] - self.per_pc[start]
+        return total + items * extra // TABLE_PARTY_SIZE + per_pc * extra
+
+    def party_currency(
+        self,
+        low: int,
+        high: typing.Optional[int] = None,
+        party_size: int = TABLE_PARTY_SIZE,
+    ) -> int:
+        """Get the part of the budget that the party should find as currency."""
+
+        start, stop = self._range(low, high, party_size)
+        per_pc = self.per_pc[stop] - self.per_pc[start]
+        extra = party_size - TABLE_PARTY_SIZE
+        return self.currency[stop] - self.currency[start] + per_pc * extra
+
+    def budgets(
+        self,
+        party_sizes: typing.Sequence[int],
+        levels: typing.Sequence[typing.Union[int, tuple[int, int]]],
+    ) -> "npt.NDArray[np.int64]":
+        """
+        Get the budget of every party size over every level or range, like budget.
+
+        Returns an int64 matrix with a row per party size and a column per range.
+        Raises LevelError if any level isn't in the table and ValueError for parties
+        without PCs.
+        """
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = tuple(
+                np.array(column, dtype=np.int64)
+                for column in (self.total, self.currency, self.per_pc)
+            )
+        total, currency, per_pc = self._arrays
+
+        bounds = np.array(
+            [(level, level) if isinstance(level, int) else level for level in levels],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        low, high = bounds.min(axis=1), bounds.max(axis=1)
+        if len(bounds) and (low.min() < 1 or high.max() > self.max_level):
+            raise LevelError(LEVEL_ERROR)
+
+        range_total = total[high] - total[low - 1]
+        range_items = range_total - (currency[high] - currency[low - 1])
+        range_per_pc = per_pc[high] - per_pc[low - 1]
+        sizes = np.asarray(party_sizes, dtype=np.int64).reshape(-1, 1)
+        if len(sizes) and sizes.min() < 1:
+            raise ValueError(PARTY_SIZE_ERROR)
+        extra = sizes - TABLE_PARTY_SIZE
+        matrix: "npt.NDArray[np.int64]" = (
+            range_total + range_items * extra // TABLE_PARTY_SIZE + range_per_pc * extra
+        )
+        return matrix
+
+    def compare(
+        self,
+        totals: "npt.ArrayLike",
+        party_sizes: typing.Sequence[int],
+        levels: typing.Sequence[typing.Union[int, tuple[int, int]]],
+    ) -> "npt.NDArray[np.int64]":
+        """
+        Get how many gp each party's loot is short of its budget over each range.
+
+        The gp totals of the loot are broadcast against the matrix of budgets, so they
+        can be a single total, one per party as a column, one per range or the whole
+        matrix. Like LootReport.difference, loot over budget is negative.
+        """
+        import numpy as np
+
+        return self.budgets(party_sizes, levels) - np.asarray(totals, dtype=np.int64)
+
+
+@functools.lru_cache(maxsize=None)
+def get_treasure_table() -> TreasureTable:
+    """Get the bundled Treasure by Level table, read on first use."""
+    return TreasureTable.from_csv()
@@ -0,0 +1,306 @@
+from collections import OrderedDict
+import contextlib
+import os
+import pickle
+import sqlite3
+import time
+import typing
+
+
+def save_pickle(path: str, header: typing.Hashable, value: typing.Any):
+    """Pickle a value after a header, like a version, replacing the file at once."""
+
+    import tempfile
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write to a temporary file first so that concurrent readers never see half of it
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_pickle(path: str, header: typing.Hashable) -> typing.Any:
+    """Load a value saved by save_pickle, or None if it's missing, stale or unreadable."""
+
+    try:
+        with open(path, "rb") as file:
+            if pickle.load(file) != header:
+                return None
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+
+class CacheInfo(typing.NamedTuple):
+    """Usage counters of a cache, in the style of functools.lru_cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Size-bounded mapping that evicts the least recently used entries first."""
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("The cache size must be at least 1")
+
+        self.maxsize = maxsize
+        self._data: OrderedDict[typing.Hashable, typing.Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: typing.Hashable, default: typing.Any = None) -> typing.Any:
+        """Get the value for the key and mark it as recently used."""
+
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: typing.Hashable, value: typing.Any):
+        """Store the value for the key, evicting the least recently used entry if full."""
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+        )
+
+
+class DiskCache:
+    """
+    Size-bounded cache kept in an SQLite file, so that it lasts between runs.
+
+    Values are pickled and the least recently used entries are evicted first. Every
+    entry belongs to the namespace the cache was opened with, like a hash of the tables
+    the values were computed from, and opening it with another namespace empties it.
+
+    New entries and the times entries were used are kept in memory and written in a
+    single short transaction when the cache is closed, so a long run never keeps the
+    file locked and other processes can use it at the same time. Any error with the
+    file makes the cache act as if it were empty, so a broken cache can only make
+    things slower.
+    """
+
+    def __init__(self, path: str, namespace: str = "", maxsize: int = 50_000):
+        if maxsize < 1:
+            raise ValueError("The cache size must be at least 1")
+
+        self.path = path
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        # Entries stored and times entries were used in this run, until it's closed
+        self._pending: dict[str, bytes] = {}
+        self._used: dict[str, int] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Transactions are only opened explicitly, so reads never hold a lock
+        connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            with self._transaction(connection):
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key TEXT PRIMARY KEY, value BLOB NOT NULL, used INTEGER NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_used ON entries (used)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value)"
+                )
+
+                row = connection.execute(
+                    "SELECT value FROM stats WHERE name = 'namespace'"
+                ).fetchone()
+                if row is None or row[0] != self.namespace:
+                    connection.execute("DELETE FROM entries")
+                    connection.execute("DELETE FROM stats")
+                    connection.execute(
+                        "INSERT INTO stats VALUES ('namespace', ?)", (self.namespace,)
+                    )
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        self._connection = connection
+        return connection
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transaction(connection: sqlite3.Connection) -> typing.Iterator[None]:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """Get the value for the key and mark it as recently used."""
+
+        try:
+            data = self._pending.get(key)
+            if data is None:
+                row = (
+                    self._connect()
+                    .execute("SELECT value FROM entries WHERE key = ?", (key,))
+                    .fetchone()
+                )
+                data = row[0] if row is not None else None
+            if data is not None:
+                value = pickle.loads(data)
+                self._used[key] = time.time_ns()
+                self.hits += 1
+                return value
+        except (
+            sqlite3.Error,
+            OSError,
+            pickle.UnpicklingError,
+            AttributeError,
+            TypeError,
+        ):
+            pass
+
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value: typing.Any):
+        """Store the value for the key, to be saved when the cache is closed."""
+
+        try:
+            self._connect()
+            self._pending[key] = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (
+            sqlite3.Error,
+            OSError,
+            pickle.PicklingError,
+            AttributeError,
+            TypeError,
+        ):
+            return
+        self._used[key] = time.time_ns()
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+
+        self._pending.clear()
+        self._used.clear()
+        try:
+            connection = self._connect()
+            with self._transaction(connection):
+                connection.execute("DELETE FROM entries")
+                connection.execute("DELETE FROM stats WHERE name != 'namespace'")
+        except (sqlite3.Error, OSError):
+            pass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self):
+        """Save the new entries and usage, evicting the least recently used over the limit."""
+
+        if self._connection is None:
+            return
+
+        connection, self._connection = self._connection, None
+        pending, self._pending = self._pending, {}
+        used, self._used = self._used, {}
+        try:
+            with self._transaction(connection):
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    [(key, value, used[key]) for key, value in pending.items()],
+                )
+                connection.executemany(
+                    "UPDATE entries SET used = ? WHERE key = ?",
+                    [(time, key) for key, time in used.items() if key not in pending],
+                )
+
+                (count,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+                if count > self.maxsize:
+                    connection.execute(
+                        "DELETE FROM entries WHERE key IN"
+                        " (SELECT key FROM entries ORDER BY used LIMIT ?)",
+                        (count - self.maxsize,),
+                    )
+                    self.evictions += count - self.maxsize
+
+                for name in ("hits", "misses", "evictions"):
+                    connection.execute(
+                        "INSERT INTO stats VALUES (?, ?) ON CONFLICT (name)"
+                        " DO UPDATE SET value = value + excluded.value",
+                        (name, getattr(self, name)),
+                    )
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+        except sqlite3.Error:
+            pass
+        finally:
+            connection.close()
+
+    def cache_info(self) -> CacheInfo:
+        """Get the counters of every run so far, this one included, and the saved size."""
+
+        try:
+            connection = self._connect()
+            stats = dict(
+                connection.execute(
+                    "SELECT name, value FROM stats WHERE name != 'namespace'"
+                ).fetchall()
+            )
+            (currsize,) = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+        except (sqlite3.Error, OSError):
+            stats, currsize = {}, 0
+
+        return CacheInfo(
+            stats.get("hits", 0) + self.hits,
+            stats.get("misses", 0) + self.misses,
+            stats.get("evictions", 0) + self.evictions,
+            self.maxsize,
+            currsize,
+        )
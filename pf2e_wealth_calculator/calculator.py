@@ -0,0 +1,296 @@
+"""
+Programmatic API of the wealth calculator, for using it from other programs.
+
+Unlike the functions behind the command line, nothing here prints or exits. Results are
+returned as objects and problems are raised as exceptions: LevelError for a level that
+isn't valid and ItemNotFoundError for a single item that isn't in the tables.
+
+    >>> calculator = WealthCalculator()
+    >>> calculator.price("+1 striking longsword").price
+    Money(cp=0, sp=0, gp=101, origin=<Origins.ITEM: 'item'>, check_origin=True)
+    >>> calculator.budget("1-3")
+    975
+"""
+
+from pf2e_wealth_calculator.budget import TABLE_PARTY_SIZE, get_treasure_table
+from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord, get_catalog
+from pf2e_wealth_calculator.loot import iter_loot
+from pf2e_wealth_calculator.pf2ewc import (
+    Level,
+    PricedCallback,
+    get_records_stats,
+    get_totals,
+    parse_level,
+    pick_random_records,
+    price_item,
+    treasure_budget,
+)
+from pf2e_wealth_calculator.structs import (
+    ItemInfo,
+    ItemNotFoundError,
+    LootStats,
+    Money,
+    Origins,
+)
+
+from dataclasses import dataclass, field
+import typing
+
+if typing.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from pf2e_wealth_calculator.query import QueryPage
+    from pf2e_wealth_calculator.sampling import Parcel
+
+    import pandas as pd
+
+LootEntry = typing.Union[str, tuple[str, int]]
+
+
+def _loot_record(entry: LootEntry) -> tuple[str, int]:
+    """Turn an item name or a (name, amount) tuple into a record like iter_loot's."""
+
+    if isinstance(entry, str):
+        return entry.lower(), 1
+    name, amount = entry
+    return name.lower(), amount
+
+
+@dataclass
+class LootReport:
+    """Value of a whole loot, like what pf2ewc prints for a loot file."""
+
+    money: dict[Origins, Money]
+    stats: LootStats
+    unknown: list[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> Money:
+        """Total value of the loot, of every origin."""
+        return self.money[Origins.TOTAL]
+
+    def difference(self, budget: int) -> int:
+        """Get how many gp the loot is short of a budget, negative if it's over it."""
+        return budget - self.total.gp
+
+
+class WealthCalculator:
+    """
+    Prices items and loot with an item catalog, by default the bundled one.
+
+    The default catalog is loaded on first use and shared by every calculator in the
+    process, along with the item caches, so creating calculators is cheap.
+    """
+
+    def __init__(self, catalog: typing.Optional[ItemCatalog] = None):
+        self._catalog = catalog
+
+    @property
+    def catalog(self) -> ItemCatalog:
+        return self._catalog if self._catalog is not None else get_catalog()
+
+    def price(self, name: str, amount: int = 1) -> ItemInfo:
+        """
+        Price an item, currency included, like `pf2ewc -i` does.
+
+        Raises ItemNotFoundError if the item, or the base item of a runed item, isn't
+        in the tables.
+        """
+
+        item = price_item(name, amount, self._catalog, quiet=True)
+        if item.category == "error":
+            suggestion = self.catalog.suggestions.best(item.name)
+            raise ItemNotFoundError(item.name, suggestion)
+        return item
+
+    def price_many(
+        self,
+        loot: typing.Iterable[LootEntry],
+        currency: int = 0,
+        convert: bool = True,
+        on_priced: typing.Optional[PricedCallback] = None,
+    ) -> LootReport:
+        """
+        Price a whole loot, given as item names or (name, amount) tuples.
+
+        The gp of currency are added to the totals and, if convert is set, cp and sp are
+        exchanged for gp like pf2ewc does. Items that aren't in the tables are worth
+        nothing and listed in the unknown names of the report. If given, on_priced is
+        called with every chunk of the loot as priced by price_loot.
+        """
+
+        records = (_loot_record(entry) for entry in loot)
+        return self._report(records, currency, convert, on_priced)
+
+    def price_file(
+        self,
+        path: str,
+        currency: int = 0,
+        convert: bool = True,
+        on_priced: typing.Optional[PricedCallback] = None,
+    ) -> LootReport:
+        """Price a loot file, like price_many does for loot in memory."""
+        return self._report(iter_loot(path), currency, convert, on_priced)
+
+    def _report(
+        self,
+        records: typing.Iterable[tuple[str, int]],
+        currency: int,
+        convert: bool,
+        on_priced: typing.Optional[PricedCallback],
+    ) -> LootReport:
+        unknown: dict[str, None] = {}
+
+        def collect(priced: "pd.DataFrame"):
+            errors = priced["name"][priced["category"] == "error"]
+            unknown.update(dict.fromkeys(errors.str.strip()))
+            if on_priced is not None:
+                on_priced(priced)
+
+        stats = get_records_stats(records, collect, self._catalog, quiet=True)
+        money = get_totals(stats, currency, noconversion=not convert)
+        return LootReport(money, stats, list(unknown))
+
+    def budget(
+        self, level: typing.Union[str, Level], party_size: int = TABLE_PARTY_SIZE
+    ) -> int:
+        """
+        Get the gp the Treasure by Level table expects for a level or range of levels.
+
+        The level can be an int, a (low, high) tuple or a string like "5" or "1-6".
+        Parties of more or less than four PCs get more or less treasure. Raises
+        LevelError if the level isn't valid or isn't between 1 and 20, and ValueError
+        for parties without PCs.
+        """
+        return treasure_budget(level, party_size)
+
+    def budgets(
+        self,
+        party_sizes: typing.Sequence[int],
+        levels: typing.Sequence[typing.Union[str, Level]],
+    ) -> "npt.NDArray[np.int64]":
+        """
+        Get the budget of every party size over every level or range, like budget.
+
+        Returns a NumPy matrix with a row per party size and a column per level.
+        """
+        return get_treasure_table().budgets(
+            party_sizes, [parse_level(level) for level in levels]
+        )
+
+    def compare_budgets(
+        self,
+        totals: "npt.ArrayLike",
+        party_sizes: typing.Sequence[int],
+        levels: typing.Sequence[typing.Union[str, Level]],
+    ) -> "npt.NDArray[np.int64]":
+        """
+        Get how many gp the loot totals are short of the budgets of budgets.
+
+        Totals can be one per party, as a column, one per level or the whole matrix.
+        Loot worth more than its budget is negative, like in LootReport.difference.
+        """
+        return get_treasure_table().compare(
+            totals, party_sizes, [parse_level(level) for level in levels]
+        )
+
+    def random_items(
+        self,
+        n_of_items: int,
+        level: typing.Union[str, Level] = "0-100",
+        seed: typing.Optional[int] = None,
+        rarity_weights: typing.Optional[typing.Mapping[str, float]] = None,
+        category_weights: typing.Optional[typing.Mapping[str, float]] = None,
+    ) -> list[ItemInfo]:
+        """
+        Pick random items within a level or range of levels, like `pf2ewc -r` does.
+
+        Pass a seed to get the same items every time. Rarities and categories can be
+        made more or less likely with relative weights, like {"rare": 0.5}, and those
+        that aren't given weigh 1. Raises LevelError for invalid levels and levels
+        without any item.
+        """
+
+        records = pick_random_records(
+            n_of_items, level, self._catalog, seed, rarity_weights, category_weights
+        )
+        return [self._item_info(record) for record in records]
+
+    def treasure_parcel(
+        self,
+        level: typing.Union[str, Level],
+        tolerance: float = 0.1,
+        seed: typing.Optional[int] = None,
+        rarity_weights: typing.Optional[typing.Mapping[str, float]] = None,
+        category_weights: typing.Optional[typing.Mapping[str, float]] = None,
+        party_size: int = TABLE_PARTY_SIZE,
+    ) -> "Parcel":
+        """
+        Generate random treasure worth the Total Value of a party level or range.
+
+        The parcel's items and currency are worth the budget give or take the tolerance,
+        with items of the party level up to one level higher. Seed and weights work
+        like in random_items, and the budget is adjusted for the party size. Raises
+        LevelError for levels that aren't between 1 and 20.
+        """
+
+        from pf2e_wealth_calculator.sampling import treasure_parcel
+
+        return treasure_parcel(
+            level,
+            tolerance,
+            seed,
+            rarity_weights,
+            category_weights,
+            self._catalog,
+            party_size,
+        )
+
+    def find_items(
+        self,
+        level: typing.Union[str, Level, None] = None,
+        min_gp: typing.Optional[float] = None,
+        max_gp: typing.Optional[float] = None,
+        categories: typing.Iterable[str] = (),
+        rarities: typing.Iterable[str] = (),
+        sort: str = "price",
+        descending: bool = False,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> "QueryPage":
+        """
+        Find the items within a level or range of levels and a range of prices.
+
+        Prices are in gp, and fractions of a gp are fine. Items can also be limited to
+        some categories and rarities. The items of the page are sorted by "price",
+        "level" or "name", as ItemInfo, and the page also tells how many items match.
+        Raises LevelError for invalid levels.
+        """
+
+        from pf2e_wealth_calculator.query import get_item_index
+
+        low = high = None
+        if level is not None:
+            level = parse_level(level)
+            low, high = (level, level) if isinstance(level, int) else sorted(level)
+        prices = (
+            None if min_gp is None else round(min_gp * 100),
+            None if max_gp is None else round(max_gp * 100),
+        )
+
+        page = get_item_index(self._catalog).query(
+            (low, high), prices, categories, rarities, sort, descending, offset, limit
+        )
+        return page._replace(items=[self._item_info(record) for record in page.items])
+
+    def _item_info(self, record: ItemRecord) -> ItemInfo:
+        return ItemInfo(
+            record.name,
+            self.catalog.price(record),
+            record.category,
+            record.subcategory,
+            record.level,
+            record.rarity,
+            record.bulk,
+        )
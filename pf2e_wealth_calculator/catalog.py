@@ -0,0 +1,319 @@
+from pf2e_wealth_calculator import instrument
+from pf2e_wealth_calculator.cache import load_pickle, save_pickle
+from pf2e_wealth_calculator.dataframes import _pathfinder
+from pf2e_wealth_calculator.materials import MaterialIndex
+from pf2e_wealth_calculator.prices import Coins, parse_coins
+from pf2e_wealth_calculator.runes import RuneIndex
+from pf2e_wealth_calculator.structs import Money
+from pf2e_wealth_calculator.suggest import SuggestionIndex
+
+import csv
+import hashlib
+import os
+import sys
+import typing
+
+# Bump whenever ItemCatalog or ItemRecord change, so that old snapshots are rebuilt
+SNAPSHOT_VERSION = 6
+
+# Categories that get their own sub-catalog at load time for restricted lookups
+PARTITIONED_CATEGORIES = ("runes", "weapons", "armor", "shields", "materials")
+
+# Tables the catalog is built from, whose contents key the snapshot
+SOURCE_TABLES = (
+    _pathfinder("tables/PF2eItemList.csv"),
+    _pathfinder("tables/materials.csv"),
+)
+
+
+class ItemRecord(typing.NamedTuple):
+    """A single row of the item list, already normalized."""
+
+    name: str
+    rarity: str
+    category: str
+    subcategory: str
+    level: int
+    price: str
+    bulk: typing.Union[int, str]
+
+
+class ItemCatalog:
+    """
+    Hash-indexed view of the bundled item tables.
+
+    Items are indexed by name, category, level and rarity so that lookups don't
+    need to scan the whole item list. When more items share a name (e.g. the
+    assistive and weapon versions of the probing cane) they're all kept in
+    table order and the first one is returned by default.
+
+    Lookups restricted to a category go through a partition of the catalog that only
+    holds the items of that category, with its own indexes.
+
+    Prices are parsed into coins once, when the catalog is built.
+    """
+
+    def __init__(
+        self,
+        records: typing.Iterable[ItemRecord],
+        materials: typing.Iterable[str] = (),
+        partitions: typing.Iterable[str] = PARTITIONED_CATEGORIES,
+    ):
+        self.records: tuple[ItemRecord, ...] = tuple(records)
+        self.materials: list[str] = list(materials)
+        self.names: list[str] = [record.name for record in self.records]
+
+        self._by_name: dict[str, list[ItemRecord]] = {}
+        self.by_category: dict[str, list[ItemRecord]] = {}
+        self.by_level: dict[int, list[ItemRecord]] = {}
+        self.by_rarity: dict[str, list[ItemRecord]] = {}
+        self._coins: dict[str, Coins] = {}
+
+        for record in self.records:
+            if record.price not in self._coins:
+                self._coins[record.price] = parse_coins(record.price)
+            self._by_name.setdefault(record.name, []).append(record)
+            self.by_category.setdefault(record.category, []).append(record)
+            self.by_level.setdefault(record.level, []).append(record)
+            self.by_rarity.setdefault(record.rarity, []).append(record)
+
+        self._partitions: dict[str, ItemCatalog] = {}
+        for category in partitions:
+            self.partition(category)
+
+        self._suggestions: typing.Optional[SuggestionIndex] = None
+        self._runes: typing.Optional[RuneIndex] = None
+        self._material_prices: typing.Optional[MaterialIndex] = None
+
+    @classmethod
+    def from_csv(
+        cls,
+        itemlist_path: str = _pathfinder("tables/PF2eItemList.csv"),
+        materials_path: str = _pathfinder("tables/materials.csv"),
+    ) -> "ItemCatalog":
+        """
+        Build the catalog straight from the bundled CSV files.
+
+        This applies the same normalization as dataframes.py without importing pandas.
+        """
+
+        with open(itemlist_path, "r", newline="") as file:
+            reader = csv.reader(file)
+            next(reader)  # Skip the header
+            records = [
+                ItemRecord(
+                    name.lower(),
+                    rarity.lower(),
+                    category.lower(),
+                    subcategory.lower() if subcategory else "none",
+                    int(level),
+                    price if price else "0 gp",
+                    int(bulk) if bulk.isdigit() else bulk if bulk else 0,
+                )
+                for name, rarity, category, subcategory, level, price, bulk in reader
+            ]
+
+        with open(materials_path, "r") as file:
+            materials = [mat.rstrip("\n") for mat in file.readlines()]
+
+        return cls(records, materials)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        # The suggestion index is only needed for misspelled names, the rune index for
+        # runed items and the material prices for precious items, so they're built on
+        # demand instead of being stored
+        return {
+            **self.__dict__,
+            "_suggestions": None,
+            "_runes": None,
+            "_material_prices": None,
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __getitem__(self, name: str) -> ItemRecord:
+        record = self.get(name)
+        if record is None:
+            raise KeyError(name)
+        return record
+
+    def get(
+        self, name: str, category: typing.Optional[str] = None
+    ) -> typing.Optional[ItemRecord]:
+        """
+        Get the record with the given name, or None if there isn't one.
+
+        If category is given, only records whose category contains it are considered.
+        """
+
+        if category is not None:
+            return self.partition(category).get(name)
+
+        matches = self._by_name.get(name)
+        return matches[0] if matches else None
+
+    def price(self, record: ItemRecord, amount: int = 1) -> Money:
+        """Get the price of an amount of the given item."""
+
+        cp, sp, gp = self._coins.get(record.price) or parse_coins(record.price)
+        return Money(cp * amount, sp * amount, gp * amount)
+
+    @property
+    def suggestions(self) -> SuggestionIndex:
+        """Index to suggest the closest item name to a misspelled one, built on first use."""
+
+        if self._suggestions is None:
+            self._suggestions = SuggestionIndex(self.names)
+        return self._suggestions
+
+    @property
+    def runes(self) -> RuneIndex:
+        """Trie of the rune names, to break down runed item names. Built on first use."""
+
+        if self._runes is None:
+            self._runes = RuneIndex(self.partition("runes").records)
+        return self._runes
+
+    @property
+    def material_prices(self) -> MaterialIndex:
+        """Price matrix of the precious materials. Built on first use."""
+
+        if self._material_prices is None:
+            self._material_prices = MaterialIndex(self)
+        return self._material_prices
+
+    def partition(self, category: str) -> "ItemCatalog":
+        """
+        Get the sub-catalog of the items whose category contains the given one.
+
+        Partitions of the categories in PARTITIONED_CATEGORIES are built with the
+        catalog, any other one is built the first time it's requested.
+        """
+
+        try:
+            return self._partitions[category]
+        except KeyError:
+            pass
+
+        records = [record for record in self.records if category in record.category]
+        partition = ItemCatalog(records, self.materials, partitions=())
+        self._partitions[category] = partition
+        return partition
+
+    def get_all(self, name: str) -> list[ItemRecord]:
+        """Get every record with the given name, in table order."""
+        return list(self._by_name.get(name, ()))
+
+    def in_level_range(self, low: int, high: int) -> list[ItemRecord]:
+        """Get all records with a level between low and high, inclusive."""
+
+        return [
+            record
+            for level in sorted(self.by_level)
+            if low <= level <= high
+            for record in self.by_level[level]
+        ]
+
+
+def user_cache_dir() -> str:
+    """
+    Get the directory where pf2ewc stores its caches.
+
+    It can be overridden with the PF2EWC_CACHE_DIR environment variable.
+    """
+
+    if "PF2EWC_CACHE_DIR" in os.environ:
+        return os.environ["PF2EWC_CACHE_DIR"]
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        return os.path.join(base, "pf2e-wealth-calculator", "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, "pf2e-wealth-calculator")
+
+
+def tables_hash(paths: typing.Iterable[str] = SOURCE_TABLES) -> str:
+    """Get a hash of the contents of the given tables."""
+
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as file:
+            digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+def snapshot_path() -> str:
+    return os.path.join(user_cache_dir(), "catalog.pickle")
+
+
+def write_snapshot(
+    catalog: ItemCatalog, path: typing.Optional[str] = None, key: str = ""
+) -> str:
+    """
+    Write a binary snapshot of the catalog and return its path.
+
+    The snapshot starts with a header holding the snapshot version and the hash of the
+    source tables, so that stale snapshots can be detected without loading them in full.
+    """
+
+    path = path or snapshot_path()
+    save_pickle(path, (SNAPSHOT_VERSION, key or tables_hash()), catalog)
+    return path
+
+
+def read_snapshot(
+    path: typing.Optional[str] = None, key: str = ""
+) -> typing.Optional[ItemCatalog]:
+    """Read the catalog snapshot, or return None if it's missing, stale or unreadable."""
+
+    catalog = load_pickle(
+        path or snapshot_path(), (SNAPSHOT_VERSION, key or tables_hash())
+    )
+    return catalog if isinstance(catalog, ItemCatalog) else None
+
+
+def load_catalog() -> ItemCatalog:
+    """
+    Load the catalog of the bundled tables.
+
+    A fresh snapshot is used when available. Otherwise the catalog is built from the
+    CSV files and the snapshot is rewritten for the next run.
+    """
+
+    key = tables_hash()
+    catalog = read_snapshot(key=key)
+    if catalog is None:
+        catalog = ItemCatalog.from_csv()
+        try:
+            write_snapshot(catalog, key=key)
+        except OSError:
+            pass  # Read-only cache directory, build from the CSV files every time
+
+    return catalog
+
+
+_catalog: typing.Optional[ItemCatalog] = None
+
+
+def get_catalog() -> ItemCatalog:
+    """Get the catalog of the bundled tables, loading it on first use."""
+
+    global _catalog
+    if _catalog is None:
+        with instrument.stage("catalog"):
+            _catalog = load_catalog()
+
+    return _catalog
+
+
+if __name__ == "__main__":
+    print(f"Catalog snapshot written to {write_snapshot(ItemCatalog.from_csv())}")
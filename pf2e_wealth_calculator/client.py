@@ -0,0 +1,114 @@
+"""
+Client of the pricing server started with `pf2ewc serve`.
+
+Requests and responses are single lines of JSON. A request names an operation and its
+arguments, like {"op": "item", "name": "longsword"}, and its response holds what the
+same command would have printed and its exit status, like
+{"status": 0, "output": "Value: 1 gp\\n..."}.
+
+This module only needs the standard library, so forwarding a command to the server
+doesn't pay for importing pandas or loading the tables.
+"""
+
+from pf2e_wealth_calculator.catalog import user_cache_dir
+
+import json
+import os
+import socket
+import sys
+import typing
+
+DEFAULT_PORT = 8765
+
+Address = typing.Union[str, tuple[str, int]]
+
+
+def default_address() -> str:
+    """
+    Get the address the server listens on by default.
+
+    It's a Unix socket in the cache directory where they're available and port 8765 of
+    localhost everywhere else. It can be overridden with the PF2EWC_SERVER environment
+    variable.
+    """
+
+    if "PF2EWC_SERVER" in os.environ:
+        return os.environ["PF2EWC_SERVER"]
+    elif hasattr(socket, "AF_UNIX"):
+        return os.path.join(user_cache_dir(), "pf2ewc.sock")
+    else:
+        return f"127.0.0.1:{DEFAULT_PORT}"
+
+
+def parse_address(address: str) -> Address:
+    """
+    Turn an address into a socket path or a (host, port) tuple.
+
+    "HOST:PORT" and a bare port number are TCP addresses, anything else is the path of
+    a Unix socket.
+    """
+
+    host, sep, port = address.rpartition(":")
+    if port.isdigit() and (sep or address.isdigit()):
+        return (host or "127.0.0.1", int(port))
+    return address
+
+
+def connect(address: str, timeout: typing.Optional[float] = None) -> socket.socket:
+    """Open a connection to the server at the given address."""
+
+    parsed = parse_address(address)
+    if isinstance(parsed, tuple):
+        return socket.create_connection(parsed, timeout=timeout)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(parsed)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send_request(
+    request: dict[str, typing.Any], address: typing.Optional[str] = None
+) -> dict[str, typing.Any]:
+    """Send a single request to the server and wait for its response."""
+
+    with connect(address or default_address()) as sock:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as file:
+            line = file.readline()
+
+    if not line:
+        raise ConnectionError("The server closed the connection without answering")
+    response: dict[str, typing.Any] = json.loads(line)
+    return response
+
+
+def forward(
+    request: dict[str, typing.Any], address: typing.Optional[str] = None
+) -> int:
+    """
+    Run a command on the server as if it were run locally.
+
+    Prints the output of the command and returns its exit status.
+    """
+
+    address = address or default_address()
+    try:
+        response = send_request(request, address)
+    except (OSError, ValueError) as err:
+        print(
+            f"Could not reach the pricing server at {address} ({err})."
+            " Start it with `pf2ewc serve`.",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(response.get("output", ""), end="")
+    if "error" in response:
+        print(response["error"].rstrip("\n"), file=sys.stderr)
+    status: int = response.get("status", 1)
+    return status
@@ -1,5 +1,22 @@
-import pandas as pd
+"""
+Bundled tables as pandas DataFrames.
+
+The tables are loaded lazily the first time one of the module attributes
+(itemlist, tbl or materials) is accessed, so importing this
+module doesn't import pandas or read any CSV file.
+"""
+
+from pf2e_wealth_calculator import instrument
+
 import os
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+    itemlist: pd.DataFrame
+    tbl: pd.DataFrame
+    materials: list[str]
 
 
 # Global file access
@@ -7,31 +24,53 @@ def _pathfinder(path):
     return os.path.join(os.path.dirname(os.path.realpath(__file__)), path)
 
 
-# List of all items
-itemlist: pd.DataFrame = pd.read_csv(
-    _pathfinder("tables/PF2eItemList.csv"), dtype={"Level": int}
-)
-# Rune name translation table
-rune_replacer: pd.DataFrame = pd.read_csv(
-    _pathfinder("tables/rune_replacer.csv"), names=["name", "replacer"]
-)
-# Treasure by level table
-tbl: pd.DataFrame = pd.read_csv(_pathfinder("tables/treasurebylevel.csv"))
-# Precious materials
-with open(_pathfinder("tables/materials.csv"), "r") as _mats:
-    materials = _mats.readlines()
-    materials = [mat.rstrip("\n") for mat in materials]
-
-
-# Make all names lowercase
-itemlist.columns = itemlist.columns.str.lower()
-itemlist["subcategory"].fillna("None", inplace=True)
-for col in ["name", "rarity", "category", "subcategory"]:
-    itemlist[col] = itemlist[col].apply(lambda name: name.lower())
-
-# Replace NaN price and bulk with zero
-itemlist["price"].fillna("0 gp", inplace=True)
-itemlist["bulk"].fillna("0", inplace=True)
-
-# Fill NaN values with empty strings
-rune_replacer["replacer"].fillna("", inplace=True)
+def _load_itemlist():
+    import pandas as pd
+
+    # List of all items
+    itemlist = pd.read_csv(_pathfinder("tables/PF2eItemList.csv"), dtype={"Level": int})
+
+    # Make all names lowercase
+    itemlist.columns = itemlist.columns.str.lower()
+    itemlist["subcategory"].fillna("None", inplace=True)
+    for col in ["name", "rarity", "category", "subcategory"]:
+        itemlist[col] = itemlist[col].apply(lambda name: name.lower())
+
+    # Replace NaN price and bulk with zero
+    itemlist["price"].fillna("0 gp", inplace=True)
+    itemlist["bulk"].fillna("0", inplace=True)
+
+    return itemlist
+
+
+def _load_tbl():
+    import pandas as pd
+
+    # Treasure by level table
+    return pd.read_csv(_pathfinder("tables/treasurebylevel.csv"))
+
+
+def _load_materials():
+    # Precious materials
+    with open(_pathfinder("tables/materials.csv"), "r") as _mats:
+        return [mat.rstrip("\n") for mat in _mats.readlines()]
+
+
+_loaders = {
+    "itemlist": _load_itemlist,
+    "tbl": _load_tbl,
+    "materials": _load_materials,
+}
+
+
+def __getattr__(name: str):
+    try:
+        loader = _loaders[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the table as a regular module attribute so it's only loaded once
+    with instrument.stage("tables"):
+        value = loader()
+    globals()[name] = value
+    return value
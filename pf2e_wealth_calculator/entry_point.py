@@ -2,18 +2,39 @@ from pf2e_wealth_calculator.pf2ewc import (
     find_single_item,
     console_entry_point,
     generate_random_items,
+    open_disk_cache,
+    print_cache_stats,
+    watch_files,
 )
-from pf2e_wealth_calculator.dataframes import tbl
+from pf2e_wealth_calculator import instrument
+from pf2e_wealth_calculator.dataframes import _pathfinder
+from pf2e_wealth_calculator.client import forward
+from pf2e_wealth_calculator.loot import is_loot_file
+from pf2e_wealth_calculator.output import OUTPUT_FORMATS
 
 from tabulate import tabulate
 
 import argparse
+import atexit
+import csv
+import functools
 import textwrap
 import sys
 import os
 
 
 def entry_point():
+    if sys.argv[1:2] == ["serve"]:
+        from pf2e_wealth_calculator.server import serve_entry_point
+
+        serve_entry_point(sys.argv[2:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["query"]:
+        from pf2e_wealth_calculator.query import query_entry_point
+
+        query_entry_point(sys.argv[2:])
+        sys.exit(0)
+
     parser = argparse.ArgumentParser(
         description="A simple tool for Pathfinder 2e that calculates how much your loot is worth."
     )
@@ -22,7 +43,7 @@ def entry_point():
         type=str,
         nargs="*",
         default="",
-        help="the name of the text file containing the loot",
+        help="the name of the text file containing the loot; use - to read from stdin",
     )
     parser.add_argument(
         "-i",
@@ -36,6 +57,13 @@ def entry_point():
         type=str,
         help="the level of the party; can be an integer or of the form X-Y (eg. 5-8)",
     )
+    parser.add_argument(
+        "-p",
+        "--party-size",
+        type=int,
+        default=4,
+        help="the number of PCs in the party, to adjust the expected gp of --level",
+    )
     parser.add_argument(
         "-c",
         "--currency",
@@ -62,18 +90,80 @@ def entry_point():
         help="prevent conversion of coins into gp",
     )
     parser.add_argument(
-        "-r",
-        "--random",
+        "-r", "--random", type=int, help="randomly pick items within a range of levels"
+    )
+    parser.add_argument(
+        "--seed",
         type=int,
-        help="randomly pick items within a range of levels"
+        help="pick the same random items every time with the same seed",
     )
     parser.add_argument(
-        "--tbl",
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="price the input files in this many parallel processes",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="print the items and totals as text (default) or in a structured format",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only price the lines of the loot files that changed since the last run",
+    )
+    parser.add_argument(
+        "--watch",
         action="store_true",
-        help="print the Treasure by Level table and exit"
+        help="print the totals again every time a loot file changes, until stopped",
+    )
+    parser.add_argument(
+        "--tbl", action="store_true", help="print the Treasure by Level table and exit"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="don't read or save item prices in the on-disk cache",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="show statistics on the on-disk cache of item prices and exit",
+    )
+    parser.add_argument(
+        "--remote",
+        action="store_true",
+        help="send the command to a server started with `pf2ewc serve`",
+    )
+    parser.add_argument(
+        "--address",
+        type=str,
+        help="the Unix socket path or the localhost port of the server for --remote",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print how long each stage took and how items were looked up to stderr",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        metavar="FILE",
+        help="profile the run with cProfile and save the stats to the given file",
     )
     args = parser.parse_args()
 
+    # Registered first so they run last, after everything else that runs at exit
+    if args.profile:
+        atexit.register(instrument.start_profile(args.profile))
+    if args.stats:
+        instrument.enable()
+        atexit.register(instrument.print_summary)
+
     if args.format:
         # TODO: Add more info in the formatting instructions
         print(
@@ -100,7 +190,7 @@ def entry_point():
             The grade must be after the item name and simply needs to include "low", "standard" or "high"
             "silver dagger (low-grade)" is correct, as is "silver dagger low"
             Make sure that it's only one word: "high-grade" is ok, "high grade" is not
-            Remember that not every material supports every grade; invalid grades currently crash the program
+            Remember that not every material supports every grade; items with an invalid grade are skipped with a warning
 
             Runes and precious materials can be combined in one single name
             "+1 striking mithral warhammer (standard)" is valid
@@ -136,35 +226,93 @@ def entry_point():
         sys.exit(0)
 
     if args.tbl:
+        with open(_pathfinder("tables/treasurebylevel.csv"), "r", newline="") as file:
+            header, *tbl = csv.reader(file)
         print(
             tabulate(
-                tbl, # type: ignore
-                headers=tbl.columns, # type: ignore
+                tbl,
+                headers=header,
                 showindex=False,
                 tablefmt="rounded_outline",
             )
         )
         sys.exit(0)
 
-    if args.item:
-        find_single_item(args.item)
+    if args.cache_stats:
+        print_cache_stats()
         sys.exit(0)
 
-    if args.random:
-        if args.level:
-            generate_random_items(args.random, args.level)
-        else:
-            generate_random_items(args.random)
+    if not args.no_cache and not args.remote:
+        atexit.register(open_disk_cache().close)
+
+    if args.item:
+        if args.remote:
+            request = {"op": "item", "name": args.item, "output": args.output}
+            sys.exit(forward(request, args.address))
 
+        find_single_item(args.item, args.output)
         sys.exit(0)
 
-    if all(os.path.isfile(file) for file in args.input) and all(
-        file.endswith(".txt") for file in args.input
-    ):
-        console_entry_point(
-            args.input, args.level, args.currency, args.detailed, args.no_conversion
+    if args.random:
+        if args.remote:
+            request = {
+                "op": "random",
+                "count": args.random,
+                "level": args.level,
+                "output": args.output,
+                "seed": args.seed,
+            }
+            sys.exit(forward(request, args.address))
+
+        generate_random_items(
+            args.random, args.level or "0-100", args.output, args.seed
         )
+
         sys.exit(0)
+
+    if all(is_loot_file(file) for file in args.input):
+        if args.watch and "-" in args.input:
+            print("The standard input can't be watched for changes")
+            sys.exit(1)
+
+        incremental = args.incremental or args.watch
+        if args.remote:
+            request = {
+                "op": "loot",
+                # The server doesn't share the working directory or stdin of the client
+                "files": [
+                    file if file == "-" else os.path.abspath(file)
+                    for file in args.input
+                ],
+                "stdin": sys.stdin.read() if "-" in args.input else "",
+                "level": args.level,
+                "currency": args.currency,
+                "detailed": args.detailed,
+                "no_conversion": args.no_conversion,
+                "output": args.output,
+                "incremental": incremental,
+                "party_size": args.party_size,
+            }
+            run = functools.partial(forward, request, args.address)
+        else:
+            run = functools.partial(
+                console_entry_point,
+                args.input,
+                args.level,
+                args.currency,
+                args.detailed,
+                args.no_conversion,
+                args.jobs,
+                args.output,
+                incremental,
+                args.party_size,
+            )
+
+        if args.watch:
+            watch_files(args.input, run)
+            sys.exit(0)
+
+        sys.exit(run())
     else:
         print("Please input a valid text file or use the -i or -r options")
         sys.exit(1)
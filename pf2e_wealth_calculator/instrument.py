@@ -0,0 +1,93 @@
+"""
+Timers for the stages of a run and counters for the paths item lookups take.
+
+Everything is off unless enable is called, as `pf2ewc --stats` does, in which case
+stage and count record where a run spends its time and how items get priced. When it's
+off, stage returns a shared no-op context manager and count returns at once, so the
+instrumented code runs at practically full speed.
+
+Stages can be nested, in which case the time of the inner stage is also part of the
+outer one. Only the current process is measured, so the work of the processes started
+by `--jobs` isn't counted.
+"""
+
+from collections import Counter
+import contextlib
+import sys
+import time
+import typing
+
+enabled = False
+
+# Seconds spent in each stage and how many times it was entered
+timings: dict[str, float] = {}
+entries: Counter[str] = Counter()
+counters: Counter[str] = Counter()
+
+_NO_STAGE = contextlib.nullcontext()
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        timings[self.name] = timings.get(self.name, 0.0) + elapsed
+        entries[self.name] += 1
+
+
+def enable():
+    """Start recording stages and counters, from zero."""
+    global enabled
+
+    enabled = True
+    timings.clear()
+    entries.clear()
+    counters.clear()
+
+
+def stage(name: str) -> typing.ContextManager[None]:
+    """Time the code in the with block as part of the named stage."""
+    return _Stage(name) if enabled else _NO_STAGE
+
+
+def count(name: str, n: int = 1):
+    """Add n to the named counter."""
+    if enabled:
+        counters[name] += n
+
+
+def summary() -> str:
+    """Describe the recorded stages and counters, like `pf2ewc --stats` prints them."""
+
+    lines = ["Stages:"]
+    for name, seconds in timings.items():
+        lines.append(f"  - {name}: {seconds * 1000:.1f} ms ({entries[name]}x)")
+    lines.append("Counters:")
+    for name, value in sorted(counters.items()):
+        lines.append(f"  - {name}: {value}")
+    return "\n".join(lines)
+
+
+def print_summary(file: typing.Optional[typing.TextIO] = None):
+    print(summary(), file=file if file is not None else sys.stderr)
+
+
+def start_profile(path: str) -> typing.Callable[[], None]:
+    """Start profiling with cProfile and get a function that stops it and saves it."""
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    def dump():
+        profiler.disable()
+        profiler.dump_stats(path)
+
+    return dump
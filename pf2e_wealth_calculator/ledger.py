@@ -0,0 +1,168 @@
+"""
+Incremental totals of loot files that are edited and priced again and again.
+
+A ledger keeps the price of every distinct line of a loot file, keyed by the record the
+line holds, and how many times each line appears, along with the totals and histograms
+of the whole file. When the file changes only the lines that weren't there before are
+priced, and the totals are updated by the difference in how many times each line
+appears. A file that hasn't changed at all isn't even read.
+
+Ledgers are saved in the cache directory, one per loot file, and are thrown away when
+the tables change.
+"""
+
+from pf2e_wealth_calculator.cache import load_pickle, save_pickle
+from pf2e_wealth_calculator.catalog import tables_hash, user_cache_dir
+from pf2e_wealth_calculator.structs import LootStats, Money, Origins
+
+from collections import Counter
+import hashlib
+import itertools
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+LEDGER_VERSION = 2
+
+# A line of a loot file, as read by iter_loot
+Record = tuple[str, int]
+
+
+class PricedLine(typing.NamedTuple):
+    """Value and stats of a whole line of a loot file, amount included."""
+
+    origin: Origins
+    cp: int
+    sp: int
+    gp: int
+    level: str
+    category: str
+    subcategory: str
+    rarity: str
+
+
+def ledger_path(loot_path: str) -> str:
+    """Get where the ledger of a loot file is saved."""
+
+    name = hashlib.sha256(os.path.abspath(loot_path).encode("utf-8")).hexdigest()
+    return os.path.join(user_cache_dir(), "ledgers", f"{name}.pickle")
+
+
+class Ledger:
+    """
+    Priced lines of a loot file and their totals, updated by difference.
+
+    Use unpriced to find the records that need a price, add_prices to store them and
+    update to move the totals to the new contents of the file.
+    """
+
+    def __init__(self, loot_path: str, key: str = ""):
+        self.loot_path = loot_path
+        self.key = key
+        # Size and modification time of the loot file when it was last read
+        self.signature: tuple[int, int] = (-1, -1)
+        self.counts: Counter[Record] = Counter()
+        self.lines: dict[Record, PricedLine] = {}
+        self.stats = LootStats()
+        # How many lines of the file count towards each key of the histograms, which
+        # keep keys whose lines add up to 0 like the stats of the whole file do
+        self.contributors: Counter[tuple[int, str]] = Counter()
+
+    @classmethod
+    def load(cls, loot_path: str, key: str = "") -> "Ledger":
+        """Load the saved ledger of a loot file, or start an empty one."""
+
+        key = key or tables_hash()
+        ledger = load_pickle(ledger_path(loot_path), (LEDGER_VERSION, key))
+        return ledger if isinstance(ledger, cls) else cls(loot_path, key)
+
+    def save(self):
+        """Save the ledger, replacing the previous one at once."""
+
+        save_pickle(ledger_path(self.loot_path), (LEDGER_VERSION, self.key), self)
+
+    def file_signature(self) -> tuple[int, int]:
+        """Get the size and modification time of the loot file."""
+
+        stat = os.stat(self.loot_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def unpriced(self, counts: typing.Mapping[Record, int]) -> list[Record]:
+        """Get the records that don't have a price yet, in order."""
+        return [record for record in counts if record not in self.lines]
+
+    def unknown(self) -> list[Record]:
+        """Get the records of unknown items, which were priced as errors."""
+        return [
+            record for record, line in self.lines.items() if line.category == "error"
+        ]
+
+    def add_prices(self, priced: "pd.DataFrame"):
+        """Store the prices of records, as priced by price_loot."""
+
+        columns = (
+            "name",
+            "amount",
+            "origin",
+            "cp",
+            "sp",
+            "gp",
+            "level",
+            "category",
+            "subcategory",
+            "rarity",
+        )
+        for name, amount, origin, cp, sp, gp, level, *stats in zip(
+            *(priced[column].tolist() for column in columns)
+        ):
+            self.lines[name, amount] = PricedLine(
+                origin, cp, sp, gp, str(level), *stats
+            )
+
+    def update(self, counts: typing.Mapping[Record, int]) -> int:
+        """
+        Move the totals to a file with the given lines, each with how often it appears.
+
+        Every line must have a price already. Returns how many distinct lines were
+        added or removed.
+        """
+
+        # Lines in the order of the file, so new histogram entries are in that order too
+        removed = [record for record in self.counts if record not in counts]
+        changed = 0
+        for record in itertools.chain(counts, removed):
+            delta = counts.get(record, 0) - self.counts.get(record, 0)
+            if delta != 0:
+                self._apply(record, delta)
+                changed += 1
+
+        self.counts = Counter(counts)
+        # Prices of lines that are gone would only make the ledger grow forever
+        for record in [record for record in self.lines if record not in counts]:
+            del self.lines[record]
+
+        return changed
+
+    def _apply(self, record: Record, delta: int):
+        line = self.lines[record]
+        amount = record[1] * delta
+        stats = self.stats
+        stats.money.setdefault(line.origin, Money(origin=line.origin)).add_coins(
+            line.cp * delta, line.sp * delta, line.gp * delta
+        )
+        for histogram, (counts, key) in enumerate(
+            (
+                (stats.levels, line.level),
+                (stats.categories, line.category),
+                (stats.subcategories, line.subcategory),
+                (stats.rarities, line.rarity),
+            )
+        ):
+            self.contributors[histogram, key] += delta
+            if self.contributors[histogram, key] == 0:
+                del self.contributors[histogram, key]
+                del counts[key]
+            else:
+                counts[key] = counts.get(key, 0) + amount
@@ -0,0 +1,92 @@
+"""
+Streaming reader for loot files.
+
+Loot files are read one line at a time, so they can be arbitrarily large, gzipped or
+piped in through stdin without being loaded in memory all at once.
+"""
+
+import csv
+import gzip
+import io
+import itertools
+import os
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+LootSource = typing.Union[str, typing.Iterable[str]]
+
+# Number of records priced at once when streaming a loot file
+CHUNK_SIZE = 10_000
+
+LOOT_EXTENSIONS = (".txt", ".txt.gz")
+
+
+def is_loot_file(source: str) -> bool:
+    """Check that a source is "-" for stdin or an existing file with a loot extension."""
+    return source == "-" or (
+        os.path.isfile(source) and source.endswith(LOOT_EXTENSIONS)
+    )
+
+
+def open_loot(source: str) -> typing.TextIO:
+    """Open a loot file, reading stdin for "-" and decompressing .gz files."""
+
+    if source == "-":
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    elif source.endswith(".gz"):
+        return gzip.open(source, "rt", encoding="utf-8", newline="")
+    else:
+        return open(source, "r", encoding="utf-8", newline="")
+
+
+def parse_amount(amount: str) -> int:
+    """Parse the amount column of a loot file, which defaults to 1 if empty."""
+
+    amount = amount.strip()
+    if not amount:
+        return 1
+    elif amount.isdigit():
+        return int(amount)
+
+    try:
+        return int(float(amount))
+    except ValueError:
+        # Amounts that aren't numbers at all are ignored
+        return 0
+
+
+def iter_loot(source: LootSource) -> typing.Iterator[tuple[str, int]]:
+    """
+    Yield the (name, amount) records of a loot file one at a time.
+
+    The source can be a path, "-" for stdin, a .gz path or any iterable of lines.
+    Blank lines and lines with a # in the item name are skipped and names are lowercased.
+    """
+
+    if isinstance(source, str):
+        with open_loot(source) as file:
+            yield from iter_loot(file)
+        return
+
+    for row in csv.reader(source):
+        if not row or not row[0].strip() or "#" in row[0]:
+            continue
+
+        yield row[0].lower(), parse_amount(row[1]) if len(row) > 1 else 1
+
+
+def iter_loot_chunks(
+    records: typing.Iterable[tuple[str, int]], size: int = CHUNK_SIZE
+) -> typing.Iterator["pd.DataFrame"]:
+    """Group loot records into DataFrames of at most the given size, for price_loot."""
+    import pandas as pd
+
+    records = iter(records)
+    while True:
+        chunk = list(itertools.islice(records, size))
+        if not chunk:
+            return
+        yield pd.DataFrame(chunk, columns=["name", "amount"])
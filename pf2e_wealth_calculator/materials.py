@@ -0,0 +1,108 @@
+"""
+Price matrix of the precious materials, by material, kind of item and grade.
+
+Every material of materials.csv has a row in the item list for each kind of item it can
+be used for and each grade it comes in, like "cold iron weapon (low-grade)". The matrix
+holds the price, level and rarity of all of them, so pricing an item made of a precious
+material is a lookup by position, and a grade a material doesn't come in is known to be
+invalid without searching the item list for it.
+"""
+
+from pf2e_wealth_calculator.prices import Coins, parse_coins
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord
+
+KINDS = ("weapon", "armor", "shield", "buckler", "object")
+GRADES = ("low", "standard", "high")
+
+# Kind of item of each category that has its own material prices, the rest are objects
+CATEGORY_KINDS = {"weapons": "weapon", "armor": "armor", "shields": "shield"}
+
+
+class MaterialPrice(typing.NamedTuple):
+    """A precious material as priced on a kind of item, for a grade."""
+
+    record: "ItemRecord"
+    coins: Coins
+
+
+def material_kind(item_name: str, category: str) -> str:
+    """Get the kind of item the price of a material depends on, like "weapon"."""
+
+    # Bucklers are priced differently than other shields
+    if "buckler" in item_name:
+        return "buckler"
+    return CATEGORY_KINDS.get(category, "object")
+
+
+def parse_grade(word: str) -> typing.Optional[str]:
+    """Get the grade written in a word like "low" or "(high-grade)", if there is one."""
+
+    for grade in GRADES:
+        if grade in word:
+            return grade
+    return None
+
+
+class MaterialIndex:
+    """
+    Dense matrix of material prices, indexed by material, kind of item and grade.
+
+    Cells of combinations that don't exist, like low-grade adamantine, are None.
+    """
+
+    def __init__(self, catalog: "ItemCatalog"):
+        self.materials = list(catalog.materials)
+        self._positions = {material: i for i, material in enumerate(self.materials)}
+        self._matrix: list[list[list[typing.Optional[MaterialPrice]]]] = [
+            [
+                [
+                    self._cell(catalog, f"{material} {kind} ({grade}-grade)")
+                    for grade in GRADES
+                ]
+                for kind in KINDS
+            ]
+            for material in self.materials
+        ]
+
+    @staticmethod
+    def _cell(catalog: "ItemCatalog", name: str) -> typing.Optional[MaterialPrice]:
+        record = catalog.get(name)
+        if record is None:
+            return None
+        return MaterialPrice(record, parse_coins(record.price))
+
+    def get(
+        self, material: str, kind: str, grade: typing.Optional[str]
+    ) -> typing.Optional[MaterialPrice]:
+        """Get the price of a material for a kind of item and grade, if it exists."""
+
+        if grade is None:
+            return None
+        try:
+            cells = self._matrix[self._positions[material]][KINDS.index(kind)]
+            return cells[GRADES.index(grade)]
+        except (KeyError, ValueError):
+            return None
+
+    def grades(self, material: str, kind: str) -> list[str]:
+        """Get the grades a material comes in for a kind of item."""
+
+        return [
+            grade for grade in GRADES if self.get(material, kind, grade) is not None
+        ]
+
+    def grade_error(self, material: str, kind: str, grade: typing.Optional[str]) -> str:
+        """Explain why there is no price for a material, kind of item and grade."""
+
+        grades = self.grades(material, kind)
+        if not grades:
+            return f"{material.capitalize()} can't be used for a {kind}"
+        names = [f"{grade}-grade" for grade in grades]
+        valid = " or ".join(filter(None, (", ".join(names[:-1]), names[-1])))
+        if grade is None:
+            return f"The grade of {material} is missing, it can be {valid}"
+        return f"{material.capitalize()} {kind}s can only be {valid}, not {grade}-grade"
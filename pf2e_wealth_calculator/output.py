@@ -0,0 +1,261 @@
+"""
+Machine-readable output of priced items and loot totals, for `--output json|jsonl|csv`.
+
+Writers are fed priced items as they come, a chunk of a loot file at a time, and write
+them straight away, so memory use doesn't grow with the size of the loot. The totals and
+histograms of a loot file are written once every item has been priced.
+
+Every format holds the same records:
+
+- json: one object, {"items": [...], "totals": {...}, ...}, with the summary keys
+  only present for loot files
+- jsonl: an object per line, {"type": "item", ...} for every item and a final
+  {"type": "summary", ...} for loot files
+- csv: a row per item with type "item", followed for loot files by a row per total
+  ("total"), the expected value ("expected") and histogram entry ("level",
+  "category", "subcategory" and "rarity")
+"""
+
+from pf2e_wealth_calculator.structs import ItemInfo, LootStats, Money, Origins
+
+import csv
+import json
+import sys
+import typing
+
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
+    from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord
+
+OUTPUT_FORMATS = ("text", "json", "jsonl", "csv")
+
+# Fields of a priced loot row, in the order of price_loot
+ITEM_FIELDS = (
+    "name",
+    "amount",
+    "origin",
+    "cp",
+    "sp",
+    "gp",
+    "copper",
+    "level",
+    "category",
+    "subcategory",
+    "rarity",
+    "bulk",
+)
+
+CSV_FIELDS = ("type", *ITEM_FIELDS)
+
+# Histograms of a loot summary and the type of their rows in CSV
+HISTOGRAMS = {
+    "levels": "level",
+    "categories": "category",
+    "subcategories": "subcategory",
+    "rarities": "rarity",
+}
+
+Row = dict[str, typing.Any]
+
+
+def _priced_columns(priced: "pd.DataFrame") -> list[list[typing.Any]]:
+    """Get the item fields of a DataFrame made by price_loot as lists of plain values."""
+
+    columns = [priced[field].tolist() for field in ITEM_FIELDS]
+    origin = ITEM_FIELDS.index("origin")
+    columns[origin] = [value.value for value in columns[origin]]
+    return columns
+
+
+def priced_rows(priced: "pd.DataFrame") -> typing.Iterator[Row]:
+    """Turn the rows of a DataFrame made by price_loot into plain dicts."""
+
+    for values in zip(*_priced_columns(priced)):
+        yield dict(zip(ITEM_FIELDS, values))
+
+
+def item_row(item: ItemInfo, amount: int = 1) -> Row:
+    """Turn an item priced by price_item into a row."""
+
+    return {
+        "name": item.name,
+        "amount": amount,
+        "origin": item.price.origin.value,
+        "cp": item.price.cp,
+        "sp": item.price.sp,
+        "gp": item.price.gp,
+        "copper": item.price.copper,
+        "level": item.level,
+        "category": item.category,
+        "subcategory": item.subcategory,
+        "rarity": item.rarity,
+        "bulk": item.bulk,
+    }
+
+
+def record_row(record: "ItemRecord", catalog: "ItemCatalog") -> Row:
+    """Turn a record of the item catalog into a row."""
+
+    price = catalog.price(record)
+    return item_row(
+        ItemInfo(
+            record.name,
+            price,
+            record.category,
+            record.subcategory,
+            record.level,
+            record.rarity,
+            record.bulk,
+        )
+    )
+
+
+def _coins(money: Money) -> Row:
+    return {"cp": money.cp, "sp": money.sp, "gp": money.gp, "copper": money.copper}
+
+
+def loot_summary(
+    money: dict[Origins, Money],
+    stats: LootStats,
+    converted: bool,
+    expected: typing.Optional[int] = None,
+) -> Row:
+    """
+    Collect the totals of a loot file, as made by get_totals, and its histograms.
+
+    The expected value is the gp the Treasure by Level table gives for the party level,
+    if one was given, and the difference is how many gp the loot is short of it.
+    """
+
+    total = money[Origins.TOTAL]
+    return {
+        "converted": converted,
+        "totals": {origin.value: _coins(value) for origin, value in money.items()},
+        "expected_gp": None if expected is None else int(expected),
+        "difference_gp": None if expected is None else int(expected) - total.gp,
+        "levels": dict(stats.levels),
+        "categories": dict(stats.categories),
+        "subcategories": dict(stats.subcategories),
+        "rarities": dict(stats.rarities),
+    }
+
+
+class Writer:
+    """
+    Base of the structured output writers.
+
+    Writers are context managers, which write whatever closes the output on exit.
+    """
+
+    def __init__(self, stream: typing.Optional[typing.TextIO] = None):
+        self.stream = stream if stream is not None else sys.stdout
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write_item(self, row: Row):
+        raise NotImplementedError
+
+    def write_items(self, rows: typing.Iterable[Row]):
+        for row in rows:
+            self.write_item(row)
+
+    def write_priced(self, priced: "pd.DataFrame"):
+        """Write every row of a DataFrame made by price_loot."""
+        self.write_items(priced_rows(priced))
+
+    def write_summary(self, summary: Row):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class JsonWriter(Writer):
+    """Writes a single JSON object, streaming its list of items."""
+
+    def __init__(self, stream: typing.Optional[typing.TextIO] = None):
+        super().__init__(stream)
+        self._items = 0
+        self._summary: Row = {}
+
+    def write_item(self, row: Row):
+        self.stream.write('{"items": [' if self._items == 0 else ", ")
+        self.stream.write(json.dumps(row))
+        self._items += 1
+
+    def write_summary(self, summary: Row):
+        self._summary = summary
+
+    def close(self):
+        self.stream.write('{"items": [' if self._items == 0 else "")
+        self.stream.write("]")
+        for key, value in self._summary.items():
+            self.stream.write(f", {json.dumps(key)}: {json.dumps(value)}")
+        self.stream.write("}\n")
+
+
+class JsonlWriter(Writer):
+    """Writes a JSON object per line."""
+
+    def write_item(self, row: Row):
+        self.stream.write(json.dumps({"type": "item", **row}) + "\n")
+
+    def write_summary(self, summary: Row):
+        self.stream.write(json.dumps({"type": "summary", **summary}) + "\n")
+
+
+class CsvWriter(Writer):
+    """Writes a CSV table with a row per item, total and histogram entry."""
+
+    def __init__(self, stream: typing.Optional[typing.TextIO] = None):
+        super().__init__(stream)
+        self._writer = csv.DictWriter(
+            self.stream, CSV_FIELDS, restval="", lineterminator="\n"
+        )
+        self._writer.writeheader()
+
+    def write_item(self, row: Row):
+        self._writer.writerow({"type": "item", **row})
+
+    def write_priced(self, priced: "pd.DataFrame"):
+        # Much faster than a dict per row, for the same output
+        csv.writer(self.stream, lineterminator="\n").writerows(
+            ("item", *row) for row in zip(*_priced_columns(priced))
+        )
+
+    def write_summary(self, summary: Row):
+        rows: list[Row] = [
+            {"type": "total", "name": origin, **coins}
+            for origin, coins in summary["totals"].items()
+        ]
+        if summary["expected_gp"] is not None:
+            rows.append(
+                {"type": "expected", "name": "expected", "gp": summary["expected_gp"]}
+            )
+        for histogram, kind in HISTOGRAMS.items():
+            rows.extend(
+                {"type": kind, "name": key, "amount": count}
+                for key, count in summary[histogram].items()
+            )
+        self._writer.writerows(rows)
+
+
+WRITERS: dict[str, type[Writer]] = {
+    "json": JsonWriter,
+    "jsonl": JsonlWriter,
+    "csv": CsvWriter,
+}
+
+
+def get_writer(output: str, stream: typing.Optional[typing.TextIO] = None) -> Writer:
+    """Get a writer of the given output format, other than text."""
+
+    try:
+        return WRITERS[output](stream)
+    except KeyError:
+        raise ValueError(f"Unknown output format {output!r}") from None
@@ -1,17 +1,43 @@
-from pf2e_wealth_calculator.dataframes import itemlist, rune_replacer, tbl, materials
+from pf2e_wealth_calculator import instrument
 from pf2e_wealth_calculator.structs import *
+from pf2e_wealth_calculator.budget import TABLE_PARTY_SIZE, get_treasure_table
+from pf2e_wealth_calculator.catalog import (
+    ItemCatalog,
+    ItemRecord,
+    get_catalog,
+    tables_hash,
+    user_cache_dir,
+)
+from pf2e_wealth_calculator.cache import DiskCache, LRUCache
+from pf2e_wealth_calculator.ledger import Ledger
+from pf2e_wealth_calculator.materials import material_kind, parse_grade
+from pf2e_wealth_calculator.loot import LootSource, iter_loot, iter_loot_chunks
+from pf2e_wealth_calculator.output import (
+    get_writer,
+    item_row,
+    loot_summary,
+    record_row,
+)
+from pf2e_wealth_calculator.prices import CURRENCY_PATTERN, parse_coins, parse_currency
 
-import pandas as pd
-import numpy as np
 from tabulate import tabulate
 
-import re
-from difflib import get_close_matches
-
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import contextlib
+import functools
+import io
+import os
 import sys
 import textwrap
+import time
 import typing  # for backwards compatibility to python 3.9
 
+# pandas is only imported when a loot file is processed, to keep startup fast
+if typing.TYPE_CHECKING:
+    import pandas as pd
+
 
 def get_higher_rarity(rar1: str, rar2: str) -> str:
     """Get the higher rarity among the two given ones."""
@@ -25,10 +51,13 @@ def get_higher_rarity(rar1: str, rar2: str) -> str:
 
 
 def get_material_grade(
-    name_split: list[str], materials: list[str] = materials
+    name_split: list[str], materials: typing.Union[list[str], None] = None
 ) -> tuple[str, typing.Union[str, None], typing.Union[str, None]]:
     """Get the grade and material from an item's name, if present."""
 
+    if materials is None:
+        materials = get_catalog().materials
+
     if name_split[0] in materials:
         material = name_split.pop(0)
     elif len(name_split) > 1 and f"{name_split[0]} {name_split[1]}" in materials:
@@ -39,14 +68,10 @@ def get_material_grade(
     else:
         return " ".join(name_split), None, None
 
-    grade = name_split.pop(-1)
-
-    if "low" in grade:
-        grade = "(low-grade)"
-    elif "standard" in grade:
-        grade = "(standard-grade)"
-    elif "high" in grade:
-        grade = "(high-grade)"
+    grade = parse_grade(name_split[-1]) if name_split else None
+    if grade is not None:
+        name_split.pop(-1)
+        grade = f"({grade}-grade)"
 
     base_name = " ".join(name_split)
 
@@ -65,28 +90,34 @@ def parse_database(
     amount: int,
     *,
     restrict_cat: typing.Union[str, None] = None,
-    df: pd.DataFrame = itemlist,
-    materials: list[str] = materials,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    materials: typing.Union[list[str], None] = None,
     quiet: bool = False,
 ) -> ItemInfo:
     """Parses the Archives of Nethys item list and returns information about the item."""
 
+    if catalog is None:
+        catalog = get_catalog()
+    if materials is None:
+        materials = catalog.materials
+
     item_name = item_name.strip()
 
     # Check if the item name is just plain currency, in which case exit early
-    # The regex checks for an asterisk maybe followed by spaces, then digits, then an optional decimal
-    # comma or dot followed by more digits, followed by cp, sp or gp after any amount of spaces
-    if re.match(r"\*?\ *\d+([,\.]\d*)?\ *(cp|sp|gp)", item_name) is not None:
-        if item_name.find("*") == 0:
+    currency_value = parse_currency(item_name, amount)
+    if currency_value is not None:
+        if currency_value.origin == Origins.ART_OBJECT:
             item_name = item_name.replace("*", "", 1)
-            currency_value = get_price(item_name, amount, origin=Origins.ART_OBJECT)
             return ItemInfo(item_name, currency_value, "art objects", "none")
         else:
-            currency_value = get_price(item_name, amount, origin=Origins.CURRENCY)
             return ItemInfo(item_name, currency_value, "currency", "none")
 
     # Check if the first one or two words denote a precious material
+    full_name = item_name
     item_name, material, grade = get_material_grade(item_name.split(), materials)
+    # Items like "darkwood lumber" only start with the name of a material
+    if material and grade is None and catalog.get(full_name, restrict_cat) is not None:
+        item_name, material = full_name, None
 
     # Special case for handwraps which don't have a real listing
     # They're technically "worn items", not "weapons", but using the right category
@@ -99,21 +130,16 @@ def parse_database(
         )
 
     # If category is restricted, check only items from that category
-    # TODO: This can probably be simplified
-    if restrict_cat:
-        filtered_list = itemlist.set_index("category")
-        filtered_list = filtered_list.filter(like=restrict_cat, axis=0)
-        item_row = filtered_list[filtered_list["name"] == item_name]
-    else:
-        item_row = df[df["name"] == item_name]
+    item_row = catalog.get(item_name, category=restrict_cat or None)
+    instrument.count("lookup.restricted" if restrict_cat else "lookup.exact")
 
     # If there is no item with the given name, find closest item to suggest
     # and print a warning
-    if item_row.empty:
+    if item_row is None:
+        instrument.count("lookup.miss")
         if not quiet:
-            suggestion = "".join(
-                get_close_matches(item_name.strip(), df["name"].tolist(), 1, 0)
-            )
+            instrument.count("lookup.fuzzy")
+            suggestion = catalog.suggestions.best(item_name.strip())
 
             if item_name != suggestion:
                 print(
@@ -127,40 +153,33 @@ def parse_database(
         item_name = "shield"
 
     # Get item stats
-    item_category = item_row["category"].item() if not restrict_cat else restrict_cat
-    item_subcategory = item_row["subcategory"].item()
-    item_level = item_row["level"].item()
-    item_rarity = item_row["rarity"].item()
-    item_bulk = item_row["bulk"].item()
-    if item_bulk.isdigit():
-        item_bulk = int(item_bulk)
+    item_category = item_row.category if not restrict_cat else restrict_cat
+    item_subcategory = item_row.subcategory
+    item_level = item_row.level
+    item_rarity = item_row.rarity
+    item_bulk = item_row.bulk
 
     # Get item price
     if not material:
-        item_price = get_price(item_row["price"].item(), amount)
+        item_price = catalog.price(item_row, amount)
     else:
-        item_name = f"{material} {item_name} {grade}"
-        # Convert category to a AoN-legible name
-        categories = {
-            "weapons": "weapon",
-            "armor": "armor",
-            "shields": "shield",
-        }
-
-        if "buckler" in item_name:
-            # Bucklers are priced differently than other shields
-            category = "buckler"
-        elif item_category in categories.keys():
-            category = categories[item_category]
-        else:
-            # If it's not a weapon, an armor set or a shield, it's a generic object
-            category = "object"
-
-        material_name = f"{material} {category} {grade}"
-        material_row = df[df["name"] == material_name]
+        instrument.count("lookup.material")
+        full_name = " ".join(filter(None, (material, item_name, grade)))
+        category = material_kind(item_name, item_category)
+        grade = parse_grade(grade) if grade else None
+        material_price = catalog.material_prices.get(material, category, grade)
+        if material_price is None:
+            if not quiet:
+                error = catalog.material_prices.grade_error(material, category, grade)
+                print(f'WARNING: Ignoring item "{full_name}". {error}.')
+            return ItemInfo(full_name, category="error")
+
+        item_name = full_name
+        material_row = material_price.record
 
         # Add the price of the precious material
-        item_price = get_price(material_row["price"].item(), amount)
+        cp, sp, gp = material_price.coins
+        item_price = Money(cp * amount, sp * amount, gp * amount)
         # Add the extra price based on bulk
         # Formula: price of precious item + 10% of price * Bulk (for weapons and armor)
         #          price of precious item * Bulk (for objects)
@@ -174,10 +193,10 @@ def parse_database(
             item_price = item_price * multiplier if multiplier > 0 else item_price
 
         # Materials have their own level and rarity, pick the highest ones
-        material_level = material_row["level"].item()
+        material_level = material_row.level
         item_level = material_level if material_level > item_level else item_level
 
-        material_rarity = material_row["rarity"].item()
+        material_rarity = material_row.rarity
         item_rarity = get_higher_rarity(material_rarity, item_rarity)
 
     return ItemInfo(
@@ -191,168 +210,93 @@ def parse_database(
     )
 
 
-def get_potency_rune_stats(
-    cached_rune: str, category: typing.Union[str, None], level: int
-) -> tuple[Money, int]:
-    "Use the cached potency rune to add the appropriate price, depending on category"
-
-    if category == "weapons":
-        if cached_rune == "+1":
-            level = 2 if 2 > level else level
-            return Money(0, 0, 35), level
-        elif cached_rune == "+2":
-            level = 10 if 10 > level else level
-            return Money(0, 0, 935), level
-        elif cached_rune == "+3":
-            level = 16 if 16 > level else level
-            return Money(0, 0, 8935), level
-        else:
-            raise ValueError("Invalid potency rune.")
-
-    elif category == "armor":
-        if cached_rune == "+1":
-            level = 5 if 5 > level else level
-            return Money(0, 0, 160), level
-        elif cached_rune == "+2":
-            level = 11 if 11 > level else level
-            return Money(0, 0, 1060), level
-        elif cached_rune == "+3":
-            level = 18 if 18 > level else level
-            return Money(0, 0, 20560), level
-        else:
-            raise ValueError("Invalid potency rune.")
-
-    else:
-        return Money(), level
-
-
-def check_multiword_item(item, amount, item_runes, cur_index):
-    item += " " + " ".join(item_runes[cur_index + 1 :])
-    item_info = parse_database(item, amount, quiet=True)
-    if item_info.category != "error":
-        return item_info
-    else:
-        return ItemInfo(item, category="error")
+def _is_base_item(catalog: ItemCatalog, name: str) -> bool:
+    record = catalog.get(name)
+    return record is not None and record.category != "runes"
 
 
 def rune_calculator(
     item_name,
     amount,
-    df: pd.DataFrame = itemlist,
-    rune_names: pd.DataFrame = rune_replacer,
-    materials: list[str] = materials,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
 ) -> ItemInfo:
     """Automatically breaks down the item's name into singular runes and calculates price for each."""
 
-    running_sum = Money()
-    rune_info = ItemInfo()
-    highest_level = 0
-    highest_rarity = "common"
-    potency_rune = "0"
-    skip_cycle = False
-    material_flag = False
-
-    item_runes = item_name.split()  # Break up the name into single runes
-
-    # Cycle through runes found in the item name
-    for cur_index, rune in enumerate(item_runes):
-        if skip_cycle:
-            skip_cycle = False
-            continue
-
-        rune = rune.strip()
-
-        # Find potency rune and cache it
-        if rune == "+1":
-            potency_rune = "+1"
-            continue
-        elif rune == "+2":
-            potency_rune = "+2"
-            continue
-        elif rune == "+3":
-            potency_rune = "+3"
-            continue
-
-        # If rune is a prefix, fuse it with the next one, short-circuit, and skip next cycle
-        if rune in ("lesser", "moderate", "greater", "major", "true"):
-            rune = f"{item_runes[cur_index + 1]} ({rune})"
-            rune_info = parse_database(rune, amount, quiet=True)
-            running_sum += rune_info.price
-            highest_level = (
-                rune_info.level if rune_info.level > highest_level else highest_level
-            )
-            highest_rarity = get_higher_rarity(highest_rarity, rune_info.rarity)
-            skip_cycle = True
-            continue
+    if catalog is None:
+        catalog = get_catalog()
 
-        # Replace the name if necessary. If it is replaced, short-circuit
-        rune_row = rune_names[rune_names["name"] == rune]
-        if not rune_row.empty and len(rune_row["replacer"].item()) > 0:
-            rune_info = parse_database(rune_row["replacer"].item(), amount, quiet=True)
-            running_sum += rune_info.price
-            highest_level = (
-                rune_info.level if rune_info.level > highest_level else highest_level
-            )
-            highest_rarity = get_higher_rarity(highest_rarity, rune_info.rarity)
-            skip_cycle = True
-            continue
-        elif not rune_row.empty and len(rune_row["replacer"].item()) == 0:
-            continue
+    # Split the name into potency rune, other runes and base item in a single pass
+    item_runes = item_name.split()
+    potency_rune, runes, base = catalog.runes.parse(
+        item_runes, functools.partial(_is_base_item, catalog)
+    )
+    instrument.count("runes.items")
+    instrument.count("runes.tokens", len(runes) + bool(potency_rune))
 
-        # Find the rune in the list of runes (if present)
-        if rune not in materials:
-            rune_info = parse_database(rune, amount, restrict_cat="runes")
-        else:
-            rune_info = ItemInfo(rune, category="error")
-            material_flag = True
-
-        # If it's not a rune, use the remainder of the name to find the correct base item
-        if rune_info.category == "error":
-            rune_info = check_multiword_item(rune, amount, item_runes, cur_index)
-            if rune_info.category != "error":
-                highest_level = (
-                    rune_info.level
-                    if rune_info.level > highest_level
-                    else highest_level
-                )
-                highest_rarity = get_higher_rarity(highest_rarity, rune_info.rarity)
-                running_sum += rune_info.price
-                break
-            else:
+    if base:
+        base_info = parse_database(" ".join(base), amount, catalog=catalog, quiet=True)
+        if base_info.category == "error":
+            if not quiet:
                 print(
                     f"WARNING: No results for {item_name}. Skipping price calculation."
                 )
-                return ItemInfo(item_name, category="error")
-        else:
-            highest_level = (
-                rune_info.level if rune_info.level > highest_level else highest_level
-            )
-            highest_rarity = get_higher_rarity(highest_rarity, rune_info.rarity)
-
-        # Add rune/base item price to the total
-        running_sum += rune_info.price
+            return ItemInfo(item_name, category="error")
+        running_sum = base_info.price
+        highest_level = base_info.level
+        highest_rarity = base_info.rarity
+        category = base_info.category
+        subcategory = base_info.subcategory
+        bulk = base_info.bulk
+    else:
+        # Just runes, so the item is the last of them
+        rune = catalog.runes.price(runes[-1]) if runes else None
+        last_rune = (
+            rune.record
+            if rune is not None
+            else ItemRecord(item_name, "common", "none", "none", 0, "0 gp", 0)
+        )
+        running_sum = Money()
+        highest_level = 0
+        highest_rarity = "common"
+        category = last_rune.category
+        subcategory = last_rune.subcategory
+        bulk = last_rune.bulk
+
+    # Every rune, potency included, is a lookup in the rune price table
+    if potency_rune:
+        runes.append(potency_rune)
+    cp = sp = gp = 0
+    for key in runes:
+        rune = catalog.runes.price(key, category)
+        if rune is None:
+            continue
+        cp += rune.coins[0]
+        sp += rune.coins[1]
+        gp += rune.coins[2]
+        level = rune.record.level
+        highest_level = level if level > highest_level else highest_level
+        highest_rarity = get_higher_rarity(highest_rarity, rune.record.rarity)
+    running_sum.add_coins(cp * amount, sp * amount, gp * amount)
 
     # Manually change the grade tag into the standardized form
-    if material_flag:
+    if base and (
+        base[0] in catalog.materials or " ".join(base[:2]) in catalog.materials
+    ):
         for grade in ("low", "standard", "high"):
             if grade in item_runes[-1]:
                 item_runes[-1] = f"({grade}-grade)"
                 item_name = " ".join(item_runes)
                 break
 
-    # Add potency rune price
-    add_to_sum, highest_level = get_potency_rune_stats(
-        potency_rune, rune_info.category, highest_level
-    )
-    running_sum += add_to_sum
     return ItemInfo(
         item_name,
         running_sum,
-        rune_info.category,
-        rune_info.subcategory,
+        category,
+        subcategory,
         highest_level,
         highest_rarity,
-        rune_info.bulk,
+        bulk,
     )
 
 
@@ -363,183 +307,614 @@ def get_price(price_str: str, amount: int = 1, origin: Origins = Origins.ITEM) -
     price_str is a string that includes the price and coin type (i.e. "12 gp").
     """
 
-    # Fetch price and coin type through regex
-    try:
-        price_match = re.search(r"\d*(,\d*)?", price_str)
-        type_match = re.search(r"cp|sp|gp", price_str)
-    except TypeError:
-        return Money()
-
-    # Check which kind of coin it is (if any)
-    if type_match is not None and price_match is not None:
-        # Add to total while multiplying by quantity
-        item_price = price_match.group()
-        coin_type = type_match.group()
-
-        if coin_type == "cp":
-            return Money(int(item_price.replace(",", "")) * amount, 0, 0, origin=origin)
-        elif coin_type == "sp":
-            return Money(0, int(item_price.replace(",", "")) * amount, 0, origin=origin)
-        elif coin_type == "gp":
-            return Money(0, 0, int(item_price.replace(",", "")) * amount, origin=origin)
-        else:  # This shouldn't even be reachable
-            raise ValueError("Invalid currency type")
-    else:
-        return Money()
+    cp, sp, gp = parse_coins(price_str)
+    return Money(cp * amount, sp * amount, gp * amount, origin=origin)
+
 
+# Resolved items for a single unit, keyed by normalized name and catalog
+item_cache = LRUCache(maxsize=2048)
 
-def process_loot_file(filepath: str) -> pd.DataFrame:
-    # User-defined loot
-    loot = pd.read_csv(filepath, names=["name", "amount"])
-    # Skip rows starting in #
-    # TODO: Skip only if # is the first character
-    for i, row in enumerate(loot["name"]):
-        if "#" in row:
-            loot.drop(i, axis=0, inplace=True)
+# Unknown items whose warning was shown in this run, so it's only shown once per run
+warned_items: dict[tuple[str, typing.Optional[ItemCatalog]], ItemInfo] = {}
+
+# Resolved items of the bundled tables kept between runs, opened by the CLI
+disk_cache: typing.Union[DiskCache, None] = None
+
+# Bump whenever ItemInfo or the way items are priced changes, so the disk cache is emptied
+ITEM_CACHE_VERSION = 1
+
+
+def open_disk_cache(maxsize: int = 50_000) -> DiskCache:
+    """Open the on-disk item cache in the user cache directory and use it in price_item."""
+    global disk_cache
+
+    disk_cache = DiskCache(
+        os.path.join(user_cache_dir(), "items.sqlite3"),
+        namespace=f"{ITEM_CACHE_VERSION}:{tables_hash()}",
+        maxsize=maxsize,
+    )
+    return disk_cache
 
-    loot["name"] = loot["name"].apply(lambda name: name.lower())
-    # Assume no amount means 1
-    loot["amount"].fillna(1, inplace=True)
-    # Uses regex to replace non-numeric values in the "Amount" column
-    loot["amount"].replace(r"\D", 0, regex=True, inplace=True)
-    loot["amount"] = loot["amount"].astype(int)
 
-    return loot
+def forget_warnings():
+    """Start a new run, in which the warnings about unknown items are shown again."""
+    warned_items.clear()
+
+
+def price_item(
+    item_name: str,
+    amount: int = 1,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    cache: typing.Union[LRUCache, None] = item_cache,
+    quiet: bool = False,
+) -> ItemInfo:
+    """Get information on any item, using the rune calculator if it has a potency rune."""
+
+    item_name = " ".join(item_name.lower().split())
+    key = (item_name, catalog)
+    item = None
+    if cache is not None:
+        item = cache.get(key)
+        if item is None:
+            item = warned_items.get(key)
+    if item is not None:
+        instrument.count("cache.memory_hit")
+
+    # Only items of the bundled tables are kept on disk, and no cache disables both
+    persistent = disk_cache if catalog is None and cache is not None else None
+    if item is None and cache is not None and persistent is not None:
+        item = persistent.get(item_name)
+        if item is not None:
+            instrument.count("cache.disk_hit")
+            cache.put(key, item)
+
+    if item is None:
+        instrument.count("cache.miss")
+        resolved = catalog if catalog is not None else get_catalog()
+        # Check if there is a fundamental rune in the item
+        if "+1" in item_name or "+2" in item_name or "+3" in item_name:
+            item = rune_calculator(item_name, 1, resolved, quiet)
+        else:
+            item = parse_database(item_name, 1, catalog=resolved, quiet=quiet)
+
+        if cache is not None and item.category != "error":
+            cache.put(key, item)
+        elif cache is not None and not quiet:
+            warned_items[key] = item
+        # Unknown items aren't stored, so their warning is shown on every run
+        if persistent is not None and item.category != "error":
+            persistent.put(item_name, item)
+
+    # Items are cached for a single unit, so they're the same for any amount
+    return replace(item, price=item.price * amount)
+
+
+def process_loot_file(filepath: str) -> "pd.DataFrame":
+    """Read a whole loot file into a DataFrame with a name and an amount column."""
+    import pandas as pd
+
+    return pd.DataFrame(list(iter_loot(filepath)), columns=["name", "amount"])
+
+
+@functools.lru_cache(maxsize=None)
+def _item_table(catalog: ItemCatalog) -> "pd.DataFrame":
+    """Get the unit price and stats of every item in the catalog, indexed by name."""
+    import pandas as pd
+
+    rows = {}
+    for record in catalog.records:
+        # Same as parse_database, the first item with a given name wins
+        if record.name in rows:
+            continue
+        price = catalog.price(record)
+        rows[record.name] = (
+            price.cp,
+            price.sp,
+            price.gp,
+            price.copper,
+            record.level,
+            record.category,
+            record.subcategory,
+            record.rarity,
+            record.bulk,
+        )
+
+    return pd.DataFrame.from_dict(
+        rows,
+        orient="index",
+        columns=[
+            "cp",
+            "sp",
+            "gp",
+            "copper",
+            "level",
+            "category",
+            "subcategory",
+            "rarity",
+            "bulk",
+        ],
+    )
+
+
+def price_loot(
+    loot: "pd.DataFrame",
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
+) -> "pd.DataFrame":
+    """Price every row of a loot DataFrame with a name and an amount column, in bulk."""
+    import numpy as np
+    import pandas as pd
+
+    # Slow items are priced with the default catalog, and so its disk cache, if no other
+    # catalog was given
+    item_catalog = catalog
+    if catalog is None:
+        catalog = get_catalog()
+
+    raw_names = loot["name"].astype(str)
+    names = raw_names.str.strip()
+    amounts = loot["amount"].to_numpy(dtype=np.int64)
+
+    n_rows = len(loot)
+    coins = {coin: np.zeros(n_rows, dtype=np.int64) for coin in ("cp", "sp", "gp")}
+    copper = np.zeros(n_rows, dtype=np.int64)
+    origin = np.full(n_rows, Origins.ITEM, dtype=object)
+    level = np.zeros(n_rows, dtype=np.int64)
+    category = np.full(n_rows, "none", dtype=object)
+    subcategory = np.full(n_rows, "none", dtype=object)
+    rarity = np.full(n_rows, "common", dtype=object)
+    bulk = np.zeros(n_rows, dtype=object)
+
+    # Names with a fundamental rune always go through the rune calculator
+    runed = raw_names.str.contains(r"\+[123]").to_numpy()
+
+    # Plain currency and art objects, same pattern as in parse_database
+    currency = names.str.match(CURRENCY_PATTERN.pattern).to_numpy() & ~runed
+    positions = np.flatnonzero(currency)
+    # Loot files repeat the same few amounts, so each is only parsed once
+    codes, unique_names = pd.factorize(names[currency])
+    # Every name matched the currency pattern, so none of them is None
+    values = [typing.cast(Money, parse_currency(name)) for name in unique_names]
+    unit_coins = np.array([(v.cp, v.sp, v.gp) for v in values], dtype=np.int64)
+    unit_coins = unit_coins.reshape(-1, 3)[codes] * amounts[positions, None]
+    for i, coin in enumerate(coins):
+        coins[coin][positions] = unit_coins[:, i]
+    copper[positions] = unit_coins @ np.array([1, 10, 100], dtype=np.int64)
+    art = np.array([v.origin == Origins.ART_OBJECT for v in values], dtype=np.bool_)
+    art = art[codes]
+    origin[positions] = Origins.CURRENCY
+    origin[positions[art]] = Origins.ART_OBJECT
+    category[positions] = np.where(art, "art objects", "currency")
+
+    # Everything else is looked up by name, collapsing whitespace like parse_database
+    plain = ~runed & ~currency
+    keys = names[plain].str.replace(r"\s+", " ", regex=True)
+    first_words = keys.str.split(" ", n=2)
+    is_material = first_words.str[0].isin(catalog.materials) | first_words.str[
+        :2
+    ].str.join(" ").isin(catalog.materials)
+    joinable = ~is_material & (keys != "handwraps of mighty blows")
+
+    table = _item_table(catalog).reindex(keys[joinable])
+    found = table["cp"].notna().to_numpy()
+    positions = np.flatnonzero(plain)[joinable.to_numpy()][found]
+    table = table[found]
+    for coin in coins:
+        coins[coin][positions] = (
+            table[coin].to_numpy(dtype=np.int64) * amounts[positions]
+        )
+    copper[positions] = table["copper"].to_numpy(dtype=np.int64) * amounts[positions]
+    level[positions] = table["level"].to_numpy(dtype=np.int64)
+    category[positions] = table["category"].to_numpy()
+    subcategory[positions] = table["subcategory"].to_numpy()
+    rarity[positions] = table["rarity"].to_numpy()
+    bulk[positions] = table["bulk"].to_numpy()
+
+    # Runes, materials and unknown names are priced one at a time
+    priced = np.zeros(n_rows, dtype=bool)
+    priced[positions] = True
+    priced |= currency
+    if instrument.enabled:
+        instrument.count("loot.rows", n_rows)
+        instrument.count("loot.currency", int(currency.sum()))
+        instrument.count("loot.joined", len(positions))
+        instrument.count("loot.one_by_one", n_rows - int(priced.sum()))
+    for pos in np.flatnonzero(~priced):
+        item = price_item(
+            raw_names.iat[pos], int(amounts[pos]), item_catalog, quiet=quiet
+        )
+        coins["cp"][pos] = item.price.cp
+        coins["sp"][pos] = item.price.sp
+        coins["gp"][pos] = item.price.gp
+        copper[pos] = item.price.copper
+        origin[pos] = item.price.origin
+        level[pos] = item.level
+        category[pos] = item.category
+        subcategory[pos] = item.subcategory
+        rarity[pos] = item.rarity
+        bulk[pos] = item.bulk
+
+    return pd.DataFrame(
+        {
+            "name": raw_names.to_numpy(),
+            "amount": amounts,
+            "origin": origin,
+            **coins,
+            "copper": copper,
+            "level": level,
+            "category": category,
+            "subcategory": subcategory,
+            "rarity": rarity,
+            "bulk": bulk,
+        },
+        index=loot.index,
+    )
 
 
 def get_loot_stats(
-    loot: pd.DataFrame,
+    loot: "pd.DataFrame",
     money: dict[Origins, Money],
     levels: dict[str, int],
     categories: dict[str, int],
     subcategories: dict[str, int],
     rarities: dict[str, int],
-):
-    """Get the price for each item in the loot DataFrame."""
-    for _, row in loot.iterrows():
-        name, amount = row.tolist()
-        # Check if there is a fundamental rune in the item
-        if "+1" in name or "+2" in name or "+3" in name:
-            curr_item = rune_calculator(name, amount)
-        else:
-            curr_item = parse_database(name, amount)
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
+) -> "pd.DataFrame":
+    """Get the price for each item in the loot DataFrame and add them to the totals."""
+    import numpy as np
+    import pandas as pd
 
-        money[curr_item.price.origin] += curr_item.price
+    priced = price_loot(loot, catalog, quiet)
 
-        try:
-            levels[str(curr_item.level)] += amount
-        except KeyError:
-            levels[str(curr_item.level)] = amount
+    # Sum the coins of every origin in a single pass over an int64 array
+    codes, origins = pd.factorize(priced["origin"])
+    totals = np.zeros((len(origins), 3), dtype=np.int64)
+    np.add.at(totals, codes, priced[["cp", "sp", "gp"]].to_numpy(dtype=np.int64))
+    for origin, (cp, sp, gp) in zip(origins, totals.tolist()):
+        money[origin].add_coins(cp, sp, gp)
 
-        try:
-            categories[curr_item.category] += amount
-        except KeyError:
-            categories[curr_item.category] = amount
+    # Count items in order of first appearance, like the totals printed by the CLI
+    for column, counts in (
+        ("level", levels),
+        ("category", categories),
+        ("subcategory", subcategories),
+        ("rarity", rarities),
+    ):
+        keys = priced[column].astype(str)
+        for key, amount in priced["amount"].groupby(keys, sort=False).sum().items():
+            counts[key] = counts.get(key, 0) + int(amount)
 
-        try:
-            subcategories[curr_item.subcategory] += amount
-        except KeyError:
-            subcategories[curr_item.subcategory] = amount
+    return priced
 
-        try:
-            rarities[curr_item.rarity] += amount
-        except KeyError:
-            rarities[curr_item.rarity] = amount
 
+Level = typing.Union[int, tuple[int, int]]
+
+INVALID_LEVEL = (
+    "Invalid level type\nPlease only insert an integer or a range with the syntax X-Y"
+)
+
+
+def parse_level(level: typing.Union[str, Level]) -> Level:
+    """Turn a level like "5" or a range of levels like "1-6" into an int or a tuple."""
+
+    if type(level) is int:
+        return level
+    if type(level) is tuple and len(level) == 2 and all(type(x) is int for x in level):
+        return level
+    if not isinstance(level, str):
+        raise LevelError(INVALID_LEVEL)
 
-def convert_input_level(level) -> typing.Union[int, tuple[int, int]]:
-    """Transform the user input level into a integer or a tuple of two integers."""
     try:
-        level = [int(x) for x in level.split("-")]
+        levels = [int(x) for x in level.split("-")]
     except ValueError:
-        print(
-            "Invalid level type\nPlease only insert an integer or a range with the syntax X-Y"
-        )
-        sys.exit(1)
+        raise LevelError(INVALID_LEVEL) from None
 
-    if len(level) == 1:
-        level = level[0]
-    elif len(level) == 2:
-        level = tuple(level)
+    if len(levels) == 1:
+        return levels[0]
+    elif len(levels) == 2:
+        return levels[0], levels[1]
     else:
-        print(
-            "Invalid level type\nPlease only insert an integer or a range with the syntax X-Y"
-        )
-        sys.exit(1)
+        raise LevelError(INVALID_LEVEL)
 
-    return level
 
+def treasure_budget(
+    level: typing.Union[str, Level], party_size: int = TABLE_PARTY_SIZE
+) -> int:
+    """Get the gp the Treasure by Level table expects a party to find over the levels."""
 
-def get_value_from_level(level) -> int:
-    """Find the amount of gold expected by the Treasure by Level table for the range of levels provided."""
-    if type(level) is tuple:
+    level = parse_level(level)
+    if isinstance(level, tuple):
         if 0 < level[0] <= 20 and 0 < level[1] <= 20:
-            total_value = tbl["Total Value"][min(level) - 1 : max(level)].sum()
-        else:
-            print("Please only insert levels between 1 and 20")
-            sys.exit(1)
+            return get_treasure_table().budget(*level, party_size=party_size)
+        raise LevelError("Please only insert levels between 1 and 20")
 
-    elif type(level) is int:
-        if 0 < level <= 20:
-            total_value = tbl.at[level - 1, "Total Value"]
-        else:
-            print("Please only insert a level between 1 and 20")
-            sys.exit(1)
+    if 0 < level <= 20:
+        return get_treasure_table().budget(level, party_size=party_size)
+    raise LevelError("Please only insert a level between 1 and 20")
 
-    else:
-        print(
-            "Invalid level type\nPlease only insert an integer or a range with the syntax X-Y"
-        )
-        sys.exit(1)  # Probably unreachable, but type safety y'know
 
-    return total_value
+def convert_input_level(level) -> Level:
+    """Transform the user input level into a integer or a tuple of two integers."""
+    try:
+        return parse_level(level)
+    except LevelError as err:
+        print(err)
+        sys.exit(1)
+
+
+def get_value_from_level(level, party_size: int = TABLE_PARTY_SIZE) -> int:
+    """Find the amount of gold expected by the Treasure by Level table for the range of levels provided."""
+    try:
+        return treasure_budget(level, party_size)
+    except (LevelError, ValueError) as err:
+        print(err)
+        sys.exit(1)
+
+
+PricedCallback = typing.Callable[["pd.DataFrame"], None]
+
+
+def get_records_stats(
+    records: typing.Iterable[tuple[str, int]],
+    on_priced: typing.Optional[PricedCallback] = None,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
+) -> LootStats:
+    """Get the money totals and item counts of (name, amount) records, like iter_loot's."""
+
+    stats = LootStats()
+    # Price the records a chunk at a time so that memory use doesn't grow with their number
+    chunks = iter_loot_chunks(records)
+    while True:
+        with instrument.stage("read"):
+            loot = next(chunks, None)
+        if loot is None:
+            break
+
+        with instrument.stage("price"):
+            priced = get_loot_stats(
+                loot,
+                stats.money,
+                stats.levels,
+                stats.categories,
+                stats.subcategories,
+                stats.rarities,
+                catalog,
+                quiet,
+            )
+        if on_priced is not None:
+            with instrument.stage("output"):
+                on_priced(priced)
+
+    return stats
+
+
+def get_file_stats(
+    file: LootSource,
+    on_priced: typing.Optional[PricedCallback] = None,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
+) -> LootStats:
+    """Get the money totals and item counts of a single loot file."""
+
+    return get_records_stats(iter_loot(file), on_priced, catalog, quiet)
+
+
+def _init_worker():
+    global disk_cache
+
+    # The connection to the disk cache belongs to the parent process
+    disk_cache = None
+    get_catalog()
+
+
+def _get_file_stats_quietly(file: str) -> tuple[LootStats, str]:
+    """Get the stats of a loot file in a worker process, along with what it printed."""
+
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        stats = get_file_stats(file)
+    return stats, output.getvalue()
+
+
+def get_files_stats(
+    input_files: list[str],
+    jobs: int = 1,
+    on_priced: typing.Optional[PricedCallback] = None,
+    catalog: typing.Union[ItemCatalog, None] = None,
+    quiet: bool = False,
+) -> LootStats:
+    """Get the combined stats of the given loot files, in parallel with more jobs."""
+
+    stats = LootStats()
+    # Chunks can only be passed to on_priced in the process that priced them
+    serial = on_priced is not None or catalog is not None
+    if jobs <= 1 or len(input_files) <= 1 or serial:
+        for file in input_files:
+            stats.merge(get_file_stats(file, on_priced, catalog, quiet))
+        return stats
+
+    # Load the catalog before forking so workers inherit it instead of loading their own
+    get_catalog()
+    # Workers can't read the standard input, so it's priced here
+    pooled = [file for file in input_files if file != "-"]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        results = pool.map(_get_file_stats_quietly, pooled)
+        shown: set[str] = set()
+        for file in input_files:
+            if file == "-":
+                file_stats, output = _get_file_stats_quietly(file)
+            else:
+                file_stats, output = next(results)
+
+            # Merged in order like a serial run, which shows each warning once
+            for line in output.splitlines(keepends=True):
+                if not quiet and line not in shown:
+                    shown.add(line)
+                    print(line, end="")
+            stats.merge(file_stats)
+
+    return stats
+
+
+def get_ledger_stats(file: str) -> LootStats:
+    """Get the stats of a loot file from its ledger, only pricing the lines that changed."""
+
+    if file == "-":
+        return get_file_stats(file)
+
+    ledger = Ledger.load(file)
+    signature = ledger.file_signature()
+    if signature != ledger.signature:
+        with instrument.stage("read"):
+            counts = Counter(iter_loot(file))
+        with instrument.stage("price"):
+            for loot in iter_loot_chunks(ledger.unpriced(counts)):
+                ledger.add_prices(price_loot(loot))
+            instrument.count("ledger.changed", ledger.update(counts))
+        ledger.signature = signature
+        try:
+            ledger.save()
+        except OSError:
+            pass  # The next run will just have more to price
+
+    # Unknown items keep their price, but are warned about on every run like in a full one
+    for name, _ in ledger.unknown():
+        price_item(name)
+
+    return ledger.stats
+
+
+def get_ledgers_stats(input_files: list[str]) -> LootStats:
+    """Get the combined stats of the given loot files from their ledgers."""
+
+    stats = LootStats()
+    for file in input_files:
+        stats.merge(get_ledger_stats(file))
+    return stats
+
+
+def watch_files(
+    input_files: list[str], run: typing.Callable[[], typing.Any], interval: float = 0.5
+):
+    """Call run now and again every time one of the files changes, until interrupted."""
+
+    def signatures() -> typing.Optional[list[tuple[int, int]]]:
+        try:
+            return [
+                (stat.st_size, stat.st_mtime_ns)
+                for stat in (os.stat(file) for file in input_files)
+            ]
+        except OSError:
+            return None
+
+    last = None
+    try:
+        while True:
+            current = signatures()
+            if current is not None and current != last:
+                if last is not None:
+                    print(f"[{time.strftime('%H:%M:%S')}] Loot changed, new totals:")
+                run()
+                sys.stdout.flush()
+                last = current
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def get_totals(
+    stats: LootStats, currency: int = 0, noconversion: bool = False
+) -> dict[Origins, Money]:
+    """Get the money of each origin in the loot and their total, with the given gp added."""
+
+    money = {origin: replace(value) for origin, value in stats.money.items()}
+    money[Origins.CURRENCY].add_coins(gp=currency)
+
+    # Convert coins in gp where possible, if requested
+    if not noconversion:
+        money = {origin: value.converted() for origin, value in money.items()}
+
+    total = Money(origin=Origins.TOTAL, check_origin=False)
+    for value in money.values():
+        total.accumulate(value)
+    money[Origins.TOTAL] = total
+
+    return money
+
+
+def write_loot(
+    input_files: list[str],
+    level_str: typing.Optional[str],
+    currency: int,
+    noconversion: bool,
+    output: str,
+    party_size: int = TABLE_PARTY_SIZE,
+):
+    """Write every item of the loot files and their totals in a structured format."""
+
+    # An invalid level exits before anything is written, so there's no partial output
+    total_value = None
+    if level_str:
+        with contextlib.redirect_stdout(sys.stderr):
+            total_value = get_value_from_level(
+                convert_input_level(level_str), party_size
+            )
+
+    with get_writer(output, sys.stdout) as writer, contextlib.redirect_stdout(
+        sys.stderr
+    ):
+        stats = get_files_stats(input_files, on_priced=writer.write_priced)
+        money = get_totals(stats, currency, noconversion)
+        writer.write_summary(loot_summary(money, stats, not noconversion, total_value))
 
 
 def console_entry_point(
     input_files: list[str],
-    level_str: str,
+    level_str: typing.Optional[str],
     currency: int,
     detailed: bool,
     noconversion: bool,
+    jobs: int = 1,
+    output: str = "text",
+    incremental: bool = False,
+    party_size: int = TABLE_PARTY_SIZE,
 ):
     """Primary entry point for the script."""
 
-    money = {
-        Origins.ITEM: Money(origin=Origins.ITEM),
-        Origins.ART_OBJECT: Money(origin=Origins.ART_OBJECT),
-        Origins.CURRENCY: Money(origin=Origins.CURRENCY),
-    }
-    levels: dict[str, int] = {}
-    categories: dict[str, int] = {}
-    subcategories: dict[str, int] = {}
-    rarities: dict[str, int] = {}
+    forget_warnings()
+    # Structured output lists every item, so it never prices incrementally
+    if output != "text":
+        write_loot(input_files, level_str, currency, noconversion, output, party_size)
+        return
 
-    for file in input_files:
-        loot = process_loot_file(file)
-
-        get_loot_stats(loot, money, levels, categories, subcategories, rarities)
-
-        if level_str:
-            level = convert_input_level(level_str)
-            total_value = get_value_from_level(level)
+    total_value = None
+    if level_str:
+        level = convert_input_level(level_str)
+        total_value = get_value_from_level(level, party_size)
 
-    money[Origins.CURRENCY] += Money(gp=currency, origin=Origins.CURRENCY)
+    if incremental:
+        stats = get_ledgers_stats(input_files)
+    else:
+        stats = get_files_stats(input_files, jobs)
+    money = get_totals(stats, currency, noconversion)
+    with instrument.stage("output"):
+        print_loot(money, stats, total_value, detailed, noconversion)
 
-    # Convert coins in gp where possible, if requested
-    if not noconversion:
-        for origin in money.keys():
-            money[origin].gp += money[origin].cp // 100
-            money[origin].gp += money[origin].sp // 10
-            money[origin].cp %= 100
-            money[origin].sp %= 10
 
-    def get_total(money_list):
-        res = Money(origin=Origins.TOTAL, check_origin=False)
-        for item in money_list:
-            res += item
-        return res
+def print_loot(
+    money: dict[Origins, Money],
+    stats: LootStats,
+    total_value: typing.Optional[int],
+    detailed: bool,
+    noconversion: bool,
+):
+    """Print the totals of a loot, and how they compare to the expected gp if given."""
 
-    money[Origins.TOTAL] = get_total(money.values())
+    levels = stats.levels
+    categories = stats.categories
+    subcategories = stats.subcategories
+    rarities = stats.rarities
 
     print("\nTotal value", end="")
     if not noconversion:
@@ -560,7 +935,7 @@ def console_entry_point(
         )
     )
 
-    if level_str:
+    if total_value is not None:
         print("\nDifference:")
         if total_value - money[Origins.TOTAL].gp < 0:
             print(
@@ -593,15 +968,71 @@ def console_entry_point(
     print()
 
 
-def find_single_item(item_name: str):
+def print_cache_stats():
+    """Print how full and how effective the on-disk item cache is."""
+
+    cache = disk_cache if disk_cache is not None else open_disk_cache()
+    info = cache.cache_info()
+    lookups = info.hits + info.misses
+    size = os.path.getsize(cache.path) if os.path.exists(cache.path) else 0
+
+    print(
+        textwrap.dedent(
+            f"""\
+        Item cache: {cache.path}
+          - Entries: {info.currsize} of {info.maxsize} ({size / 1024:.1f} KiB)
+          - Hits: {info.hits} ({info.hits / lookups if lookups else 0:.1%} of lookups)
+          - Misses: {info.misses}
+          - Evictions: {info.evictions}"""
+        )
+    )
+
+
+def pick_random_records(
+    n_of_items: int,
+    level: typing.Union[str, Level] = "0-100",
+    catalog: typing.Union[ItemCatalog, None] = None,
+    seed: typing.Optional[int] = None,
+    rarity_weights: typing.Optional[typing.Mapping[str, float]] = None,
+    category_weights: typing.Optional[typing.Mapping[str, float]] = None,
+) -> list[ItemRecord]:
+    """Pick random items from the catalog, within a level or range of levels."""
+
+    # Drawn from the level buckets of the sampler, so a seed gives the same items to
+    # the command line and to WealthCalculator.random_items
+    from pf2e_wealth_calculator.sampling import get_sampler
+
+    level = parse_level(level)
+    low, high = (level, level) if isinstance(level, int) else level
+    return get_sampler(catalog).sample(
+        n_of_items, low, high, seed, rarity_weights, category_weights
+    )
+
+
+def random_records(
+    n_of_items: int, level_str: str = "0-100", seed: typing.Optional[int] = None
+) -> list[ItemRecord]:
+    """Pick random items from the catalog, within a level or range of levels."""
+
+    try:
+        return pick_random_records(n_of_items, level_str, seed=seed)
+    except LevelError as err:
+        print(err)
+        sys.exit(1)
+
+
+def find_single_item(item_name: str, output: str = "text"):
     """Fetches and prints information on a single item instead of a table."""
 
-    item_name = item_name.lower()
+    if output != "text":
+        with get_writer(output, sys.stdout) as writer, contextlib.redirect_stdout(
+            sys.stderr
+        ):
+            writer.write_item(item_row(price_item(item_name.lower())))
+        return
 
-    if "+1" in item_name or "+2" in item_name or "+3" in item_name:
-        item = rune_calculator(item_name, 1)
-    else:
-        item = parse_database(item_name, 1)
+    with instrument.stage("price"):
+        item = price_item(item_name.lower())
 
     if item.price.gp != 0:
         print(f"Value: {item.price.gp}gp")
@@ -625,36 +1056,36 @@ def find_single_item(item_name: str):
     )
 
 
-def generate_random_items(n_of_items: int, level_str: str = "0-100"):
-    level = convert_input_level(level_str)
-
-    if type(level) is int:
-        rand_ids = np.random.choice(
-            itemlist[itemlist["level"] == level].index, n_of_items
-        )
-        rand_items = itemlist.iloc[rand_ids]
-    elif type(level) is tuple:
-        rand_ids = np.random.choice(
-            itemlist[
-                (itemlist["level"] >= level[0]) & (itemlist["level"] <= level[1])
-            ].index,
-            n_of_items,
-        )
-        rand_items = itemlist.iloc[rand_ids]
-    else:
-        sys.exit(1)
+def generate_random_items(
+    n_of_items: int,
+    level_str: str = "0-100",
+    output: str = "text",
+    seed: typing.Optional[int] = None,
+):
+    if output != "text":
+        with get_writer(output, sys.stdout) as writer, contextlib.redirect_stdout(
+            sys.stderr
+        ):
+            catalog = get_catalog()
+            writer.write_items(
+                record_row(record, catalog)
+                for record in random_records(n_of_items, level_str, seed)
+            )
+        return
 
-    rand_items = rand_items.applymap(
-        lambda word: word.capitalize() if type(word) is str else word
-    )
+    rand_items = [
+        [field.capitalize() if type(field) is str else field for field in record]
+        for record in random_records(n_of_items, level_str, seed)
+    ]
 
-    print()
-    print(
-        tabulate(
-            rand_items,  # type: ignore
-            headers=rand_items.columns.str.capitalize(),  # type: ignore
-            showindex=False,
-            tablefmt="rounded_outline",
+    with instrument.stage("output"):
+        print()
+        print(
+            tabulate(
+                rand_items,
+                headers=[field.capitalize() for field in ItemRecord._fields],
+                showindex=False,
+                tablefmt="rounded_outline",
+            )
         )
-    )
-    print()
+        print()
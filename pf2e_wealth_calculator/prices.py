@@ -0,0 +1,89 @@
+"""
+Parsing of catalog prices and user-entered currency.
+
+Both go through the same precompiled pattern, which reads an amount of coins like
+"12 gp", "1,200 sp" or "2.5 gp" in a single pass. Commas followed by groups of three
+digits are thousands separators, any other comma or dot starts the decimals, which
+are converted into smaller coins.
+"""
+
+from pf2e_wealth_calculator.structs import Money, Origins
+
+import re
+import typing
+
+COIN_VALUES = {"cp": 1, "sp": 10, "gp": 100}
+_COIN_INDEX = {"cp": 0, "sp": 1, "gp": 2}
+
+# An integer part, with or without thousands separators, and optional decimals
+_NUMBER = r"(\d{1,3}(?:,\d{3})+|\d+)(?:[.,](\d*))?"
+
+# A number on its own, without a coin
+NUMBER_PATTERN = re.compile(_NUMBER)
+
+# A number and a coin
+_AMOUNT = _NUMBER + r"\ *(cp|sp|gp)"
+
+# One amount of coins in a price, like each part of "1 gp 5 sp"
+PRICE_TOKEN = re.compile(r"\ *" + _AMOUNT)
+
+# A currency line of a loot file, where a leading * marks an art object
+CURRENCY_PATTERN = re.compile(r"(\*)?\ *" + _AMOUNT)
+
+Coins = tuple[int, int, int]
+
+
+def _add_token(coins: list[int], whole: str, decimals: str, coin: str):
+    """Add an amount of a coin type, turning its decimals into smaller coins."""
+
+    coins[_COIN_INDEX[coin]] += int(whole.replace(",", "") if "," in whole else whole)
+
+    if decimals:
+        copper = int(decimals) * COIN_VALUES[coin] // 10 ** len(decimals)
+        gp, copper = divmod(copper, 100)
+        sp, cp = divmod(copper, 10)
+        coins[0] += cp
+        coins[1] += sp
+        coins[2] += gp
+
+
+def _add_tokens(coins: list[int], text: str, start: int):
+    """Add every amount of coins that follows, from the given position on."""
+
+    match = PRICE_TOKEN.match(text, start)
+    while match is not None:
+        _add_token(coins, *match.groups())
+        match = PRICE_TOKEN.match(text, match.end())
+
+
+def parse_coins(price_str: str) -> Coins:
+    """
+    Get the (cp, sp, gp) in a price string, like "12 gp" or "1 gp 5 sp (per day)".
+
+    Consecutive amounts at the start of the string are added together and anything
+    after them is ignored. Prices that don't start with an amount are worth nothing.
+    """
+
+    coins = [0, 0, 0]
+    if isinstance(price_str, str):
+        _add_tokens(coins, price_str, 0)
+    return coins[0], coins[1], coins[2]
+
+
+def parse_currency(item_name: str, amount: int = 1) -> typing.Optional[Money]:
+    """
+    Get the value of a currency line of a loot file, or None if it isn't currency.
+
+    Lines starting with * are art objects, the rest is plain currency.
+    """
+
+    match = CURRENCY_PATTERN.match(item_name)
+    if match is None:
+        return None
+
+    coins = [0, 0, 0]
+    _add_token(coins, *match.groups()[1:])
+    _add_tokens(coins, item_name, match.end())
+    origin = Origins.ART_OBJECT if match.group(1) else Origins.CURRENCY
+
+    return Money(coins[0] * amount, coins[1] * amount, coins[2] * amount, origin)
@@ -0,0 +1,323 @@
+"""
+Range queries over the catalog by price, level, category and rarity, like "all uncommon
+consumables of level 4-7 that cost between 20 and 150 gp".
+
+The items are sorted once by price in copper, so a price range is a contiguous run of
+them found with bisect. Levels, categories and rarities are bitmaps over the same order,
+held in Python ints, so the other filters are a few bitwise ands and the matches come
+out already sorted by price.
+
+Also the entry point of `pf2ewc query`.
+"""
+
+from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord, get_catalog
+from pf2e_wealth_calculator.prices import NUMBER_PATTERN, parse_coins
+
+import argparse
+import bisect
+import functools
+import itertools
+import sys
+import typing
+
+SORT_KEYS = ("price", "level", "name")
+
+
+class QueryPage(typing.NamedTuple):
+    """A page of the items matching a query, and how many match in total."""
+
+    items: list[typing.Any]
+    total: int
+    offset: int
+
+
+def _bits(positions: typing.Iterable[int]) -> int:
+    bitmap = 0
+    for position in positions:
+        bitmap |= 1 << position
+    return bitmap
+
+
+def _positions(bitmap: int, reverse: bool = False) -> typing.Iterator[int]:
+    """Get the positions of the set bits of a bitmap, lowest or highest first."""
+
+    # Searching the binary digits is much faster than shifting big ints bit by bit
+    digits = bin(bitmap)[:1:-1]
+    if reverse:
+        position = digits.rfind("1")
+        while position >= 0:
+            yield position
+            position = digits.rfind("1", 0, position)
+    else:
+        position = digits.find("1")
+        while position >= 0:
+            yield position
+            position = digits.find("1", position + 1)
+
+
+class ItemIndex:
+    """Items sorted by price, with bitmaps of their levels, categories and rarities."""
+
+    def __init__(self, catalog: ItemCatalog):
+        self.catalog = catalog
+        priced = sorted(
+            (catalog.price(record).copper, record.level, record.name, record)
+            for record in catalog.records
+        )
+        self.records: list[ItemRecord] = [row[3] for row in priced]
+        self.prices: list[int] = [row[0] for row in priced]
+
+        # Positions of the items when sorted by the other keys, ties broken by price
+        self._orders: dict[str, list[int]] = {
+            "level": sorted(
+                range(len(self.records)), key=lambda i: self.records[i].level
+            ),
+            "name": sorted(
+                range(len(self.records)), key=lambda i: self.records[i].name
+            ),
+        }
+
+        def bitmaps(
+            key: typing.Callable[[ItemRecord], typing.Any]
+        ) -> dict[typing.Any, int]:
+            groups: dict[typing.Any, list[int]] = {}
+            for position, record in enumerate(self.records):
+                groups.setdefault(key(record), []).append(position)
+            return {value: _bits(positions) for value, positions in groups.items()}
+
+        self.levels: dict[int, int] = bitmaps(lambda record: record.level)
+        self.categories: dict[str, int] = bitmaps(lambda record: record.category)
+        self.rarities: dict[str, int] = bitmaps(lambda record: record.rarity)
+        self.everything = (1 << len(self.records)) - 1
+
+    def price_range(
+        self, low: typing.Optional[int] = None, high: typing.Optional[int] = None
+    ) -> int:
+        """Get the bitmap of the items that cost between low and high cp, inclusive."""
+
+        start = 0 if low is None else bisect.bisect_left(self.prices, low)
+        stop = (
+            len(self.prices) if high is None else bisect.bisect_right(self.prices, high)
+        )
+        if start >= stop:
+            return 0
+        return (1 << stop) - (1 << start)
+
+    def level_range(
+        self, low: typing.Optional[int] = None, high: typing.Optional[int] = None
+    ) -> int:
+        """Get the bitmap of the items with a level between low and high, inclusive."""
+
+        if low is None and high is None:
+            return self.everything
+        bitmap = 0
+        for level, levels in self.levels.items():
+            if (low is None or level >= low) and (high is None or level <= high):
+                bitmap |= levels
+        return bitmap
+
+    def match(
+        self,
+        levels: tuple[typing.Optional[int], typing.Optional[int]] = (None, None),
+        prices: tuple[typing.Optional[int], typing.Optional[int]] = (None, None),
+        categories: typing.Iterable[str] = (),
+        rarities: typing.Iterable[str] = (),
+    ) -> int:
+        """
+        Get the bitmap of the items within the level and price (in cp) ranges.
+
+        Either end of a range can be None to leave it open. If any categories or
+        rarities are given, the items must have one of them.
+        """
+
+        bitmap = self.price_range(*prices) & self.level_range(*levels)
+        for wanted, bitmaps in (
+            (categories, self.categories),
+            (rarities, self.rarities),
+        ):
+            wanted = list(wanted)
+            if wanted:
+                bitmap &= functools.reduce(
+                    int.__or__, (bitmaps.get(value, 0) for value in wanted), 0
+                )
+        return bitmap
+
+    def query(
+        self,
+        levels: tuple[typing.Optional[int], typing.Optional[int]] = (None, None),
+        prices: tuple[typing.Optional[int], typing.Optional[int]] = (None, None),
+        categories: typing.Iterable[str] = (),
+        rarities: typing.Iterable[str] = (),
+        sort: str = "price",
+        descending: bool = False,
+        offset: int = 0,
+        limit: typing.Optional[int] = None,
+    ) -> QueryPage:
+        """
+        Get a page of the items matching the filters of match, sorted by a key.
+
+        Items are sorted by price, level or name and then by the rest of them, and the
+        page is limit items long starting from the offset. Raises ValueError for
+        unknown sort keys.
+        """
+
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Items can only be sorted by {', '.join(SORT_KEYS)}")
+
+        bitmap = self.match(levels, prices, categories, rarities)
+        total = bin(bitmap).count("1")
+        stop = total if limit is None else min(total, offset + limit)
+
+        if sort == "price":
+            # Matches are already in order of price, so only the page is gathered
+            positions = _positions(bitmap, descending)
+            page = list(itertools.islice(positions, offset, stop))
+        else:
+            # Walk the items in the order of the key until the page is full
+            digits = bin(bitmap)[:1:-1]
+            order = self._orders[sort]
+            matches = (
+                position
+                for position in (reversed(order) if descending else order)
+                if position < len(digits) and digits[position] == "1"
+            )
+            page = list(itertools.islice(matches, offset, stop))
+
+        return QueryPage([self.records[position] for position in page], total, offset)
+
+
+@functools.lru_cache(maxsize=None)
+def get_item_index(catalog: typing.Optional[ItemCatalog] = None) -> ItemIndex:
+    """Get the item index of a catalog, by default the bundled one. Built once."""
+    return ItemIndex(catalog if catalog is not None else get_catalog())
+
+
+def parse_price(price: str) -> int:
+    """Turn a price like "150", "1,200 gp" or "5sp" into copper. Bare numbers are gp."""
+
+    price = price.strip()
+    # Commas are read like in prices, so "1,500" is 1500 gp but "1,5" is 1.5 gp
+    if NUMBER_PATTERN.fullmatch(price):
+        price += " gp"
+
+    cp, sp, gp = parse_coins(price)
+    if not (cp or sp or gp) and not price.startswith("0"):
+        raise ValueError(f'Invalid price "{price}"')
+    return cp + sp * 10 + gp * 100
+
+
+def parse_range(
+    value: typing.Optional[str], parse: typing.Callable[[str], int]
+) -> tuple[typing.Optional[int], typing.Optional[int]]:
+    """
+    Turn a range like "4-7", "4-", "-7" or "4" into a (low, high) tuple.
+
+    Open ends are None, a single value is both ends and reversed ends are swapped.
+    """
+
+    if not value:
+        return None, None
+    low, dash, high = value.partition("-")
+    if not dash:
+        return parse(low), parse(low)
+    start = parse(low) if low.strip() else None
+    stop = parse(high) if high.strip() else None
+    if start is not None and stop is not None and start > stop:
+        return stop, start
+    return start, stop
+
+
+def query_entry_point(argv: typing.Optional[list[str]] = None):
+    """Entry point of `pf2ewc query`."""
+
+    from pf2e_wealth_calculator.output import OUTPUT_FORMATS, get_writer, record_row
+
+    from tabulate import tabulate
+
+    parser = argparse.ArgumentParser(
+        prog="pf2ewc query",
+        description="List the items within a range of levels and prices.",
+    )
+    parser.add_argument(
+        "-l", "--level", type=str, help="a level or range of levels, like 4 or 4-7"
+    )
+    parser.add_argument(
+        "-p",
+        "--price",
+        type=str,
+        help='a range of prices in gp, like 20-150, or with coins, like "5 sp-2 gp"',
+    )
+    parser.add_argument(
+        "-c",
+        "--category",
+        action="append",
+        default=[],
+        help="only list items of this category; can be given more than once",
+    )
+    parser.add_argument(
+        "-r",
+        "--rarity",
+        action="append",
+        default=[],
+        help="only list items of this rarity; can be given more than once",
+    )
+    parser.add_argument("-s", "--sort", choices=SORT_KEYS, default="price")
+    parser.add_argument(
+        "--desc", action="store_true", help="sort from the highest to the lowest"
+    )
+    parser.add_argument("--page", type=int, default=1, help="the page to show")
+    parser.add_argument(
+        "--per-page", type=int, default=20, help="how many items to show per page"
+    )
+    parser.add_argument("-o", "--output", choices=OUTPUT_FORMATS, default="text")
+    args = parser.parse_args(argv)
+
+    try:
+        levels = parse_range(args.level, int)
+        prices = parse_range(args.price, parse_price)
+    except ValueError as err:
+        parser.error(str(err))
+    if args.page < 1 or args.per_page < 1:
+        parser.error("--page and --per-page must be at least 1")
+
+    index = get_item_index()
+    page = index.query(
+        levels,
+        prices,
+        [category.lower() for category in args.category],
+        [rarity.lower() for rarity in args.rarity],
+        args.sort,
+        args.desc,
+        (args.page - 1) * args.per_page,
+        args.per_page,
+    )
+
+    if args.output != "text":
+        with get_writer(args.output, sys.stdout) as writer:
+            writer.write_items(
+                record_row(record, index.catalog) for record in page.items
+            )
+        return
+
+    if not page.items:
+        print(f"No items on page {args.page}, {page.total} items match")
+        return
+
+    print()
+    print(
+        tabulate(
+            [
+                [
+                    field.capitalize() if type(field) is str else field
+                    for field in record
+                ]
+                for record in page.items
+            ],
+            headers=[field.capitalize() for field in ItemRecord._fields],
+            showindex=False,
+            tablefmt="rounded_outline",
+        )
+    )
+    first = page.offset + 1
+    print(f"Items {first}-{page.offset + len(page.items)} of {page.total}")
+    print()
@@ -0,0 +1,236 @@
+"""
+Token trie of rune names, to split a runed item name into its runes and base item.
+
+A name like "+1 greater striking ghost touch cold iron longsword low" is read left to
+right, one word at a time, taking the longest rune name that starts at each word. The
+first word that doesn't start a rune is where the base item begins. Given a way to tell
+item names apart, the rest of the name is taken as the base item as soon as it is one,
+and shorter rune names are tried when the longer ones leave no item behind, so specific
+items like "holy avenger" or "brilliant rapier" aren't read as runes.
+
+The price, level and rarity of every rune on every kind of item is worked out when the
+index is built, so pricing a runed item only takes a lookup per rune.
+"""
+
+from pf2e_wealth_calculator.prices import Coins, parse_coins
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from pf2e_wealth_calculator.catalog import ItemRecord
+
+GRADES = ("lesser", "moderate", "greater", "major", "true")
+POTENCY_RUNES = ("+1", "+2", "+3")
+
+# Kinds of items runes are etched on. Handwraps of mighty blows count as weapons
+TARGET_CATEGORIES = ("weapons", "armor", "shields")
+
+# Key of the rune whose name ends at a node, which can't clash with a word
+_END = ""
+
+RuneKey = typing.Union[int, str]
+
+
+def spellings(name: str) -> list[tuple[str, ...]]:
+    """
+    Get the ways a rune name can be written in an item name, as tuples of words.
+
+    Besides its full name, a graded rune like "striking (greater)" can be written as
+    "greater striking" and a rune with any other qualifier, like "called (weapon rune)"
+    or "dragon's breath (1st-level spell)", can be written without it.
+    """
+
+    words = tuple(name.split())
+    if not name.endswith(")") or "(" not in name:
+        return [words]
+
+    base, qualifier = name[:-1].split("(", 1)
+    base_words = tuple(base.split())
+    if qualifier in GRADES:
+        return [words, (qualifier, *base_words)]
+    return [words, base_words]
+
+
+def pick(
+    records: list["ItemRecord"], category: typing.Optional[str] = None
+) -> "ItemRecord":
+    """
+    Choose which of the runes written the same way is meant, for an item category.
+
+    A rune without a qualifier wins, then one meant for that category of item, like
+    "called (weapon rune)" for weapons, then the lowest level one.
+    """
+
+    if len(records) == 1:
+        return records[0]
+
+    for record in records:
+        if "(" not in record.name:
+            return record
+
+    if category:
+        kind = category.rstrip("s")
+        for record in sorted(records, key=lambda record: record.level):
+            if kind in record.name.split("(", 1)[1]:
+                return record
+
+    return min(records, key=lambda record: record.level)
+
+
+class RunePrice(typing.NamedTuple):
+    """A rune as priced on a kind of item."""
+
+    record: "ItemRecord"
+    coins: Coins
+
+
+class RuneParsing(typing.NamedTuple):
+    """The parts of a runed item name, with the runes as keys of a RuneIndex."""
+
+    potency: typing.Optional[str]
+    runes: list[RuneKey]
+    base: list[str]
+
+
+class RuneIndex:
+    """
+    Token trie of every way to write the runes of a catalog, with their prices.
+
+    Some spellings fit more than one rune, like "called" for both the accessory and
+    weapon versions of the called rune or "dragon's breath" for every spell level.
+    Which one is meant depends on the item, so the price table is keyed by spelling
+    and target category.
+
+    Potency runes are written as +1, +2 or +3 and priced as the weapon or armor potency
+    rune depending on the item.
+    """
+
+    def __init__(self, records: typing.Iterable["ItemRecord"]):
+        self._root: dict[str, typing.Any] = {}
+        spelled: list[list["ItemRecord"]] = []
+        potency: dict[tuple[str, str], "ItemRecord"] = {}
+        potency_targets = {"weapon": "weapons", "armor": "armor"}
+
+        for record in records:
+            if "potency (+" in record.name:
+                kind, _, bonus = record.name.partition(" potency (")
+                if kind in potency_targets:
+                    target = (bonus.rstrip(")"), potency_targets[kind])
+                    potency.setdefault(target, record)
+                continue
+
+            for words in spellings(record.name):
+                node = self._root
+                for word in words:
+                    node = node.setdefault(word, {})
+                if _END not in node:
+                    node[_END] = len(spelled)
+                    spelled.append([])
+                spelled[node[_END]].append(record)
+
+        self._prices: dict[tuple[RuneKey, typing.Optional[str]], RunePrice] = {}
+        for key, candidates in enumerate(spelled):
+            for category in (None, *TARGET_CATEGORIES):
+                record = pick(candidates, category)
+                self._prices[key, category] = RunePrice(
+                    record, parse_coins(record.price)
+                )
+
+        for (bonus, category), record in potency.items():
+            self._prices[bonus, category] = RunePrice(record, parse_coins(record.price))
+
+    def matches(
+        self, words: typing.Sequence[str], start: int = 0
+    ) -> list[tuple[int, int]]:
+        """Get the end and key of every rune name starting at the given word, shortest first."""
+
+        found = []
+        node = self._root
+        for i in range(start, len(words)):
+            child = node.get(words[i])
+            if child is None:
+                break
+            node = child
+            if _END in node:
+                found.append((i + 1, node[_END]))
+        return found
+
+    def match(
+        self, words: typing.Sequence[str], start: int = 0
+    ) -> tuple[int, typing.Optional[int]]:
+        """
+        Get the end of the longest rune name starting at the given word and its key.
+
+        Returns the start itself and None if no rune starts there.
+        """
+
+        found = self.matches(words, start)
+        return found[-1] if found else (start, None)
+
+    def parse(
+        self,
+        words: typing.Sequence[str],
+        is_item: typing.Optional[typing.Callable[[str], bool]] = None,
+    ) -> RuneParsing:
+        """
+        Split the words of a runed item name into its potency, runes and base item.
+
+        If is_item is given, the runes are split off so that the base is an item name
+        for which it's true, when there's a way to. Otherwise each rune is the longest
+        one that fits.
+        """
+
+        if is_item is not None:
+            parsing = self._split(words, 0, None, [], is_item)
+            if parsing is not None:
+                return parsing
+
+        potency = None
+        runes: list[RuneKey] = []
+        i = 0
+        while i < len(words):
+            if words[i] in POTENCY_RUNES:
+                potency = words[i]
+                i += 1
+                continue
+
+            end, key = self.match(words, i)
+            if key is None:
+                break
+            runes.append(key)
+            i = end
+
+        return RuneParsing(potency, runes, list(words[i:]))
+
+    def _split(
+        self,
+        words: typing.Sequence[str],
+        start: int,
+        potency: typing.Optional[str],
+        runes: list[RuneKey],
+        is_item: typing.Callable[[str], bool],
+    ) -> typing.Optional[RuneParsing]:
+        while start < len(words) and words[start] in POTENCY_RUNES:
+            potency = words[start]
+            start += 1
+
+        base = list(words[start:])
+        if base and is_item(" ".join(base)):
+            return RuneParsing(potency, runes, base)
+
+        for end, key in reversed(self.matches(words, start)):
+            parsing = self._split(words, end, potency, [*runes, key], is_item)
+            if parsing is not None:
+                return parsing
+        return None
+
+    def price(
+        self, key: RuneKey, category: typing.Optional[str] = None
+    ) -> typing.Optional[RunePrice]:
+        """
+        Get the rune with the given key as priced on an item of the given category.
+
+        Returns None for a potency rune on an item that can't have one.
+        """
+
+        return self._prices.get((key, category)) or self._prices.get((key, None))
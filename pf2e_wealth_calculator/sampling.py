@@ -0,0 +1,256 @@
+"""
+Vectorized random sampling of items, for generating loot in bulk.
+
+The catalog is laid out once in arrays sorted by level, so every level or range of
+levels is a contiguous slice of them. Drawing items is then a handful of NumPy calls on
+that slice, optionally weighted by rarity and category, with a seedable generator.
+
+Treasure parcels are drawn the same way, a few items at a time, until their value is
+within a tolerance of what the Treasure by Level table expects for the party level.
+"""
+
+from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord, get_catalog
+from pf2e_wealth_calculator.budget import TABLE_PARTY_SIZE, get_treasure_table
+from pf2e_wealth_calculator.pf2ewc import Level, parse_level, treasure_budget
+from pf2e_wealth_calculator.structs import LevelError, Money, Origins
+
+import functools
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+Weights = typing.Optional[typing.Mapping[str, float]]
+Seed = typing.Union[None, int, np.random.Generator]
+
+# Items drawn at once while filling a parcel
+PARCEL_BATCH = 16
+
+
+class Parcel(typing.NamedTuple):
+    """A random treasure parcel and how it compares to its budget."""
+
+    items: list[ItemRecord]
+    currency: Money
+    value: Money
+    budget: Money
+
+
+class LootSampler:
+    """
+    Random item picker over a catalog, with buckets of items by level.
+
+    Rarity and category weights are relative, so {"rare": 0.5} makes rare items half as
+    likely as they'd otherwise be. Rarities and categories that aren't given weigh 1.
+    """
+
+    def __init__(self, catalog: ItemCatalog):
+        self.catalog = catalog
+        levels = sorted(catalog.by_level)
+        self.records = [
+            record for level in levels for record in catalog.by_level[level]
+        ]
+
+        # The items of levels[i] are records[starts[i]:starts[i + 1]]
+        sizes = [len(catalog.by_level[level]) for level in levels]
+        self.levels = np.array(levels, dtype=np.int64)
+        self.starts = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+
+        self.copper = np.array(
+            [catalog.price(record).copper for record in self.records], dtype=np.int64
+        )
+        self.rarities, rarity_codes = np.unique(
+            [record.rarity for record in self.records], return_inverse=True
+        )
+        self.categories, category_codes = np.unique(
+            [record.category for record in self.records], return_inverse=True
+        )
+        self.rarity_codes = rarity_codes.astype(np.int64)
+        self.category_codes = category_codes.astype(np.int64)
+
+    def level_slice(self, low: int, high: int) -> slice:
+        """Get the slice of the records with a level between low and high, inclusive."""
+
+        start = self.starts[np.searchsorted(self.levels, low, side="left")]
+        stop = self.starts[np.searchsorted(self.levels, high, side="right")]
+        return slice(int(start), int(stop))
+
+    def _weights(
+        self, items: slice, rarity_weights: Weights, category_weights: Weights
+    ) -> typing.Optional[npt.NDArray[np.float64]]:
+        if not rarity_weights and not category_weights:
+            return None
+
+        weights = np.ones(items.stop - items.start)
+        for table, names, codes in (
+            (rarity_weights, self.rarities, self.rarity_codes),
+            (category_weights, self.categories, self.category_codes),
+        ):
+            if table:
+                by_code = np.array([table.get(name, 1.0) for name in names])
+                weights *= by_code[codes[items]]
+        return weights
+
+    def _draw(
+        self,
+        rng: np.random.Generator,
+        n_of_items: int,
+        candidates: npt.NDArray[np.int64],
+        weights: typing.Optional[npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.int64]:
+        """Draw from the candidate indices, weighted by their weights if given."""
+
+        drawn: npt.NDArray[np.int64]
+        if weights is None:
+            drawn = candidates[rng.integers(0, len(candidates), n_of_items)]
+            return drawn
+
+        cumulative = np.cumsum(weights)
+        if cumulative[-1] <= 0:
+            raise ValueError("The weights of the items can't all be zero")
+        draws = rng.random(n_of_items) * cumulative[-1]
+        drawn = candidates[np.searchsorted(cumulative, draws, side="right")]
+        return drawn
+
+    def sample_indices(
+        self,
+        n_of_items: int,
+        low: int = 0,
+        high: int = 100,
+        seed: Seed = None,
+        rarity_weights: Weights = None,
+        category_weights: Weights = None,
+    ) -> npt.NDArray[np.int64]:
+        """
+        Draw the indices into records of random items with a level between low and high.
+
+        Raises LevelError if there are no items of those levels.
+        """
+
+        items = self.level_slice(low, high)
+        if items.start == items.stop:
+            raise LevelError("There are no items of that level")
+
+        rng = np.random.default_rng(seed)
+        candidates = np.arange(items.start, items.stop)
+        weights = self._weights(items, rarity_weights, category_weights)
+        return self._draw(rng, n_of_items, candidates, weights)
+
+    def sample(
+        self,
+        n_of_items: int,
+        low: int = 0,
+        high: int = 100,
+        seed: Seed = None,
+        rarity_weights: Weights = None,
+        category_weights: Weights = None,
+    ) -> list[ItemRecord]:
+        """Draw random items with a level between low and high, like sample_indices."""
+
+        indices = self.sample_indices(
+            n_of_items, low, high, seed, rarity_weights, category_weights
+        )
+        return [self.records[i] for i in indices.tolist()]
+
+    def parcel(
+        self,
+        budget: int,
+        low: int,
+        high: int,
+        tolerance: float = 0.1,
+        currency: int = 0,
+        seed: Seed = None,
+        rarity_weights: Weights = None,
+        category_weights: Weights = None,
+    ) -> Parcel:
+        """
+        Draw a treasure parcel worth the budget in gp, give or take the tolerance.
+
+        Items with a level between low and high are added a few at a time, only ever
+        picking items that still fit in the budget, until the items are worth the budget
+        minus the given gp of currency. The parcel's currency is that, plus whatever the
+        items fell short of the budget if no more items fit.
+        """
+
+        rng = np.random.default_rng(seed)
+        items = self.level_slice(low, high)
+        target = (budget - currency) * 100
+        floor, ceiling = target * (1 - tolerance), target * (1 + tolerance)
+
+        # Worthless items would never bring the parcel any closer to its budget
+        copper = self.copper[items]
+        priced = copper > 0
+        candidates = np.arange(items.start, items.stop)[priced]
+        copper = copper[priced]
+        weights = self._weights(items, rarity_weights, category_weights)
+        if weights is not None:
+            weights = weights[priced]
+
+        chosen: list[npt.NDArray[np.int64]] = []
+        value = 0
+        while value < floor:
+            fits = copper <= ceiling - value
+            if not fits.any():
+                break
+            drawn = self._draw(
+                rng,
+                PARCEL_BATCH,
+                candidates[fits],
+                weights[fits] if weights is not None else None,
+            )
+            # Keep the drawn items for as long as they fit, the first one always does
+            running = value + np.cumsum(self.copper[drawn])
+            kept = int(np.searchsorted(running, ceiling, side="right"))
+            # Stop at the first item that gets the parcel in the budget
+            kept = min(kept, int(np.searchsorted(running, floor, side="left")) + 1)
+            chosen.append(drawn[:kept])
+            value = int(running[kept - 1])
+
+        indices = np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+        coins = currency * 100 + max(0, target - value)
+        return Parcel(
+            [self.records[i] for i in indices.tolist()],
+            Money(gp=coins // 100, origin=Origins.CURRENCY),
+            Money.from_copper(value + coins // 100 * 100, Origins.TOTAL, False),
+            Money(gp=budget, origin=Origins.TOTAL, check_origin=False),
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_sampler(catalog: typing.Optional[ItemCatalog] = None) -> LootSampler:
+    """Get the sampler of a catalog, by default the bundled one, built on first use."""
+    return LootSampler(catalog if catalog is not None else get_catalog())
+
+
+def treasure_parcel(
+    level: typing.Union[str, Level],
+    tolerance: float = 0.1,
+    seed: Seed = None,
+    rarity_weights: Weights = None,
+    category_weights: Weights = None,
+    catalog: typing.Optional[ItemCatalog] = None,
+    party_size: int = TABLE_PARTY_SIZE,
+) -> Parcel:
+    """
+    Draw the treasure of a party level, or range of levels, worth its Total Value.
+
+    Like the Treasure by Level table the items are of the party level up to one level
+    higher, and part of the treasure is the table's Party Currency, both adjusted for
+    the size of the party. Raises LevelError for levels that aren't between 1 and 20.
+    """
+
+    budget = treasure_budget(level, party_size)
+    level = parse_level(level)
+    low, high = (level, level) if isinstance(level, int) else sorted(level)
+    currency = get_treasure_table().party_currency(low, high, party_size)
+
+    return get_sampler(catalog).parcel(
+        budget,
+        low,
+        high + 1,
+        tolerance,
+        currency,
+        seed,
+        rarity_weights,
+        category_weights,
+    )
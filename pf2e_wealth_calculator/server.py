@@ -0,0 +1,255 @@
+"""
+Long-running pricing server, so the tables are loaded once rather than on every command.
+
+`pf2ewc serve` listens on a Unix socket or a localhost TCP port for lines of JSON, each
+a request like those made by `pf2ewc --remote`, and answers with a line of JSON holding
+what the command would have printed. See the client module for the format.
+
+Connections are served concurrently by an asyncio event loop, which reads and writes
+every client at once while requests are priced one at a time in a worker thread. Pricing
+is CPU bound and holds the GIL, so more threads wouldn't make it any faster, while a
+single one keeps the item caches and the redirection of stdout free of races.
+"""
+
+from pf2e_wealth_calculator.client import default_address, parse_address
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.loot import is_loot_file
+import pf2e_wealth_calculator.pf2ewc as pf
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import typing
+
+# Longest request line accepted, which bounds the loot that can be sent through stdin
+MAX_REQUEST_SIZE = 64 * 2**20
+
+
+class BadRequest(ValueError):
+    """A request with a field of the wrong type."""
+
+
+_MISSING = object()
+
+
+def _field(
+    request: dict[str, typing.Any],
+    name: str,
+    kinds: typing.Union[type, tuple[type, ...]],
+    default: typing.Any = _MISSING,
+) -> typing.Any:
+    # Fields without a default are required, and raise KeyError like a missing argument
+    value = request[name] if default is _MISSING else request.get(name, default)
+    if value is not default and not isinstance(value, kinds):
+        raise BadRequest(f"{name!r} can't be {value!r}")
+    return value
+
+
+def _item(request: dict[str, typing.Any]):
+    pf.find_single_item(
+        _field(request, "name", str), _field(request, "output", str, "text")
+    )
+
+
+def _loot(request: dict[str, typing.Any]):
+    files = _field(request, "files", list)
+    # Only loot files can be read, like on the command line
+    if not all(isinstance(file, str) and is_loot_file(file) for file in files):
+        print("Please input a valid text file or use the -i or -r options")
+        sys.exit(1)
+
+    # Files are always read in this thread: forking worker processes from a threaded
+    # server isn't safe, so the "jobs" of the request are ignored
+    pf.console_entry_point(
+        files,
+        _field(request, "level", str, None),
+        _field(request, "currency", int, 0),
+        _field(request, "detailed", bool, False),
+        _field(request, "no_conversion", bool, False),
+        1,
+        _field(request, "output", str, "text"),
+        _field(request, "incremental", bool, False),
+        _field(request, "party_size", int, 4),
+    )
+
+
+def _random(request: dict[str, typing.Any]):
+    pf.generate_random_items(
+        _field(request, "count", int),
+        _field(request, "level", str, None) or "0-100",
+        _field(request, "output", str, "text"),
+        _field(request, "seed", int, None),
+    )
+
+
+OPERATIONS: dict[str, typing.Callable[[dict[str, typing.Any]], None]] = {
+    "item": _item,
+    "loot": _loot,
+    "random": _random,
+}
+
+
+def handle_request(request: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """
+    Run a request and collect what it printed and its exit status.
+
+    Anything printed to stderr, like the warnings of structured output, is sent back
+    as the error of the response. Loot read from stdin is sent as the "stdin" field of
+    the request. Requests must not run concurrently, since they redirect the standard
+    streams of the process.
+    """
+
+    op = request.get("op", "")
+    operation = OPERATIONS.get(op) if isinstance(op, str) else None
+    if operation is None:
+        return {"status": 2, "output": "", "error": f"Unknown operation {request!r}"}
+    stdin_text = request.get("stdin", "")
+    if not isinstance(stdin_text, str):
+        return {"status": 2, "output": "", "error": "Bad request: 'stdin' isn't text"}
+
+    # Every request warns about its unknown items, like a separate command would
+    pf.forget_warnings()
+    output = io.StringIO()
+    errors = io.StringIO()
+    stdin = io.TextIOWrapper(io.BytesIO(stdin_text.encode("utf-8")))
+    old_stdin, sys.stdin = sys.stdin, stdin
+    response: dict[str, typing.Any] = {"status": 0}
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+            operation(request)
+    except SystemExit as err:
+        response["status"] = err.code if isinstance(err.code, int) else 1
+    except BadRequest as err:
+        response["status"] = 2
+        print(f"Bad request: {err}", file=errors)
+    except (LookupError, TypeError, ValueError, OSError) as err:
+        response["status"] = 1
+        print(repr(err), file=errors)
+    except Exception as err:
+        # A request must never take down the connection it came from
+        response["status"] = 2
+        print(f"Bad request: {err!r}", file=errors)
+    finally:
+        sys.stdin = old_stdin
+
+    response["output"] = output.getvalue()
+    if errors.getvalue():
+        response["error"] = errors.getvalue()
+    return response
+
+
+async def _serve_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    executor: ThreadPoolExecutor,
+):
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            try:
+                request = json.loads(line)
+            except ValueError as err:
+                response = {"status": 2, "output": "", "error": f"Bad request: {err}"}
+            else:
+                if isinstance(request, dict):
+                    response = await loop.run_in_executor(
+                        executor, handle_request, request
+                    )
+                else:
+                    response = {"status": 2, "output": "", "error": "Bad request"}
+
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+    except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(address: str) -> asyncio.AbstractServer:
+    """Start listening for requests at the given address."""
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pf2ewc")
+
+    async def serve_connection(reader, writer):
+        await _serve_connection(reader, writer, executor)
+
+    parsed = parse_address(address)
+    if isinstance(parsed, tuple):
+        return await asyncio.start_server(
+            serve_connection, *parsed, limit=MAX_REQUEST_SIZE
+        )
+
+    if os.path.exists(parsed):
+        with socket.socket(socket.AF_UNIX) as sock:
+            try:
+                sock.connect(parsed)
+            except OSError:
+                # A socket left behind by a server that didn't shut down cleanly
+                os.remove(parsed)
+            else:
+                raise OSError(f"A server is already listening at {parsed}")
+
+    os.makedirs(os.path.dirname(parsed) or ".", exist_ok=True)
+    return await asyncio.start_unix_server(
+        serve_connection, parsed, limit=MAX_REQUEST_SIZE
+    )
+
+
+async def serve(address: str):
+    """Serve requests at the given address until interrupted."""
+
+    server = await start_server(address)
+    loop = asyncio.get_running_loop()
+    with contextlib.suppress(NotImplementedError):
+        loop.add_signal_handler(signal.SIGTERM, server.close)
+
+    print(f"Pricing server listening at {address}", file=sys.stderr)
+    try:
+        async with server:
+            with contextlib.suppress(asyncio.CancelledError):
+                await server.serve_forever()
+    finally:
+        parsed = parse_address(address)
+        if not isinstance(parsed, tuple):
+            with contextlib.suppress(OSError):
+                os.remove(parsed)
+
+
+def serve_entry_point(argv: typing.Optional[list[str]] = None):
+    """Entry point of `pf2ewc serve`."""
+
+    parser = argparse.ArgumentParser(
+        prog="pf2ewc serve",
+        description="Keep the item tables loaded and price items for `pf2ewc --remote`.",
+    )
+    parser.add_argument(
+        "-a",
+        "--address",
+        type=str,
+        default=None,
+        help="the Unix socket path or the localhost port to listen on",
+    )
+    args = parser.parse_args(argv)
+
+    # Pay for pandas and the tables before the first request rather than during it
+    pf._item_table(get_catalog())
+
+    try:
+        asyncio.run(serve(args.address or default_address()))
+    except KeyboardInterrupt:
+        pass
+    except OSError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
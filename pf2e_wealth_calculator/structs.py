@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
 import typing
 
@@ -10,6 +10,22 @@ class OriginError(Exception):
         super().__init__(message)
 
 
+class LevelError(ValueError):
+    """Party level or range of levels that isn't valid or isn't in the table."""
+
+
+class ItemNotFoundError(LookupError):
+    """Item name that isn't in the tables, with the closest name that is."""
+
+    def __init__(self, name: str, suggestion: str = ""):
+        message = f'No item called "{name}"'
+        if suggestion and suggestion != name:
+            message += f'. Did you mean "{suggestion}"?'
+        super().__init__(message)
+        self.name = name
+        self.suggestion = suggestion
+
+
 class Origins(Enum):
     ITEM = "item"
     ART_OBJECT = "art object"
@@ -17,6 +33,36 @@ class Origins(Enum):
     TOTAL = "total"
 
 
+def _slotted(cls):
+    """
+    Recreate a dataclass with __slots__ instead of a per-instance __dict__.
+
+    This is what dataclass(slots=True) does on Python 3.10 and later.
+    """
+
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = names
+    # Class level defaults would clash with the slots, __init__ already has them
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+
+    if cls.__dataclass_params__.frozen:
+        # Frozen instances can't be unpickled through setattr
+        def __getstate__(self):
+            return tuple(getattr(self, name) for name in names)
+
+        def __setstate__(self, state):
+            for name, value in zip(names, state):
+                object.__setattr__(self, name, value)
+
+        namespace["__getstate__"] = __getstate__
+        namespace["__setstate__"] = __setstate__
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class Money:
     """Simple data structure for cp/sp/gp amounts."""
@@ -27,6 +73,36 @@ class Money:
     origin: Origins = Origins.ITEM
     check_origin: bool = True
 
+    @classmethod
+    def from_copper(
+        cls, copper: int, origin: Origins = Origins.ITEM, check_origin: bool = True
+    ) -> "Money":
+        """Make the Money worth the given copper, in as few coins as possible."""
+
+        gp, copper = divmod(copper, 100)
+        sp, cp = divmod(copper, 10)
+        return cls(cp, sp, gp, origin, check_origin)
+
+    @property
+    def copper(self) -> int:
+        """Total value in copper pieces."""
+        return self.cp + 10 * self.sp + 100 * self.gp
+
+    def converted(self) -> "Money":
+        """
+        Get a copy with as many cp and sp as possible exchanged for gp.
+
+        Each coin type is exchanged on its own, so leftover cp are not turned into sp.
+        """
+
+        return Money(
+            self.cp % 100,
+            self.sp % 10,
+            self.gp + self.cp // 100 + self.sp // 10,
+            self.origin,
+            self.check_origin,
+        )
+
     def __add__(self, val):
         if type(val) == int:
             return Money(
@@ -73,7 +149,31 @@ class Money:
     def __rmul__(self, val):
         return self.__mul__(val)
 
+    def accumulate(self, val: "Money") -> "Money":
+        """Add another Money to this one in place, with the same checks as a sum."""
+
+        if type(val) != Money:
+            raise TypeError(
+                f"Unsupported sum operation for type {type(val)} on class Money"
+            )
+        if self.check_origin and val.check_origin and self.origin != val.origin:
+            raise OriginError("Origins don't match")
+
+        self.cp += val.cp
+        self.sp += val.sp
+        self.gp += val.gp
+        return self
+
+    def add_coins(self, cp: int = 0, sp: int = 0, gp: int = 0) -> "Money":
+        """Add coins to this Money in place, keeping its origin."""
 
+        self.cp += cp
+        self.sp += sp
+        self.gp += gp
+        return self
+
+
+@_slotted
 @dataclass(frozen=True)
 class ItemInfo:
     """Data structure that contains information on a given item."""
@@ -85,3 +185,37 @@ class ItemInfo:
     level: int = 0
     rarity: str = "common"
     bulk: typing.Union[int, str] = 0
+
+
+def _empty_money() -> dict[Origins, Money]:
+    return {
+        Origins.ITEM: Money(origin=Origins.ITEM),
+        Origins.ART_OBJECT: Money(origin=Origins.ART_OBJECT),
+        Origins.CURRENCY: Money(origin=Origins.CURRENCY),
+    }
+
+
+@dataclass
+class LootStats:
+    """Money totals by origin and item counts by level, category, subcategory and rarity."""
+
+    money: dict[Origins, Money] = field(default_factory=_empty_money)
+    levels: dict[str, int] = field(default_factory=dict)
+    categories: dict[str, int] = field(default_factory=dict)
+    subcategories: dict[str, int] = field(default_factory=dict)
+    rarities: dict[str, int] = field(default_factory=dict)
+
+    def merge(self, other: "LootStats"):
+        """Add the totals and counts of another LootStats to this one, in its order."""
+
+        for origin, money in other.money.items():
+            self.money.setdefault(origin, Money(origin=origin)).accumulate(money)
+
+        for counts, other_counts in (
+            (self.levels, other.levels),
+            (self.categories, other.categories),
+            (self.subcategories, other.subcategories),
+            (self.rarities, other.rarities),
+        ):
+            for key, amount in other_counts.items():
+                counts[key] = counts.get(key, 0) + amount
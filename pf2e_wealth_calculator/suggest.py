@@ -0,0 +1,105 @@
+from difflib import SequenceMatcher, get_close_matches
+import heapq
+import typing
+
+
+def trigrams(word: str) -> set[str]:
+    """Get the set of three-character substrings of a word, padded at both ends."""
+
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class SuggestionIndex:
+    """
+    Trigram inverted index to suggest the closest name to a misspelled one.
+
+    Names sharing the most trigrams with the query are shortlisted through the index
+    and only those are scored with difflib's SequenceMatcher. When the best of them is
+    a poor match, which is when the shortlist is least reliable, every other name that
+    is long or short enough to beat it is checked too. This gives the same top
+    suggestion as get_close_matches in virtually every case, without comparing the
+    query against every name.
+    """
+
+    def __init__(
+        self,
+        names: typing.Iterable[str],
+        candidates: int = 32,
+        sweep_below: float = 0.75,
+    ):
+        self.names: list[str] = list(dict.fromkeys(names))
+        self.candidates = candidates
+        self.sweep_below = sweep_below
+
+        self._index: dict[str, list[int]] = {}
+        self._by_length: dict[int, list[str]] = {}
+        for i, name in enumerate(self.names):
+            for gram in trigrams(name):
+                self._index.setdefault(gram, []).append(i)
+            self._by_length.setdefault(len(name), []).append(name)
+
+    def _shortlist(self, word: str) -> list[str]:
+        counts: dict[int, int] = {}
+        for gram in trigrams(word):
+            for i in self._index.get(gram, ()):
+                counts[i] = counts.get(i, 0) + 1
+
+        best = heapq.nlargest(self.candidates, counts, key=counts.__getitem__)
+        return [self.names[i] for i in best]
+
+    def suggest(self, word: str, k: int = 1) -> list[tuple[str, float]]:
+        """
+        Get the k names closest to the given word, with their similarity scores.
+
+        Scores are SequenceMatcher ratios between 0 and 1, and ties are broken like in
+        difflib.get_close_matches.
+        """
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(word)
+        scored: list[tuple[float, str]] = []
+
+        def score(names: typing.Iterable[str]):
+            for name in names:
+                matcher.set_seq1(name)
+                # Skip names that can't make it into the top k, cheapest bound first
+                if len(scored) == k and matcher.quick_ratio() < scored[0][0]:
+                    continue
+
+                entry = (matcher.ratio(), name)
+                if len(scored) < k:
+                    heapq.heappush(scored, entry)
+                elif entry > scored[0]:
+                    heapq.heapreplace(scored, entry)
+
+        shortlist = self._shortlist(word)
+        score(shortlist)
+
+        if len(scored) < k or scored[0][0] < self.sweep_below:
+            # A ratio is at most 2 * min(len) / (sum of lengths), so only names
+            # within these lengths can beat the current worst suggestion
+            skip = set(shortlist)
+            worst = scored[0][0] if len(scored) == k else 0
+            # Names closest in length are checked first, as they're the likeliest matches
+            lengths = sorted(
+                self._by_length, key=lambda length: abs(length - len(word))
+            )
+            for length in lengths:
+                bound = 2 * min(length, len(word)) / (length + len(word) or 1)
+                if bound >= worst:
+                    score(name for name in self._by_length[length] if name not in skip)
+                    worst = scored[0][0] if len(scored) == k else 0
+
+        return [(name, score) for score, name in sorted(scored, reverse=True)]
+
+    def best(self, word: str) -> str:
+        """Get the name closest to the given word, or an empty string if there are none."""
+
+        suggestions = self.suggest(word, 1)
+        return suggestions[0][0] if suggestions else ""
+
+
+def closest_name(word: str, names: list[str]) -> str:
+    """Get the closest name by comparing the word against all of them with difflib."""
+    return "".join(get_close_matches(word, names, 1, 0))
@@ -0,0 +1,19 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the snapshots and caches of the tests out of the user cache directory."""
+
+    path = tmp_path / "cache"
+    monkeypatch.setenv("PF2EWC_CACHE_DIR", str(path))
+    return path
+
+
+@pytest.fixture(autouse=True)
+def warnings():
+    """Start every test as a new run, in which unknown items are warned about again."""
+
+    import pf2e_wealth_calculator.pf2ewc as pf
+
+    pf.forget_warnings()
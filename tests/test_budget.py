@@ -0,0 +1,71 @@
+from pf2e_wealth_calculator.budget import TreasureTable, get_treasure_table
+from pf2e_wealth_calculator.dataframes import tbl
+from pf2e_wealth_calculator.structs import LevelError
+
+import numpy as np
+import pytest
+
+LEVELS = [(1, 1), (1, 3), (5, 8), (20, 20), (1, 20), (8, 5)]
+
+
+@pytest.fixture
+def table():
+    return get_treasure_table()
+
+
+def test_ranges_match_the_table(table):
+    for low, high in LEVELS:
+        rows = tbl.iloc[min(low, high) - 1 : max(low, high)]
+        assert table.budget(low, high) == rows["Total Value"].sum()
+        assert table.party_currency(low, high) == rows["Party Currency"].sum()
+
+
+def test_party_size(table):
+    assert table.budget(1) == 175
+    assert table.budget(1, 3) == 975
+    # One PC more adds a fourth of the items and the Currency per Additional PC
+    assert table.budget(1, party_size=5) == 175 + (175 - 40) // 4 + 10
+    assert table.party_currency(1, party_size=5) == 50
+    # Fractions of items are rounded down
+    assert table.budget(1, party_size=3) == 40 - 10 + (175 - 40) * 3 // 4
+    assert table.budget(1, 20, 6) > table.budget(1, 20) > table.budget(1, 20, 2)
+
+
+def test_budgets_match_budget(table):
+    sizes = [1, 3, 4, 5, 8]
+    matrix = table.budgets(sizes, LEVELS + [7])
+    assert matrix.shape == (len(sizes), len(LEVELS) + 1)
+    for row, size in enumerate(sizes):
+        for column, (low, high) in enumerate(LEVELS + [(7, 7)]):
+            assert matrix[row, column] == table.budget(low, high, size)
+
+
+def test_compare_broadcasts(table):
+    budgets = table.budgets([3, 4], [1, (1, 3)])
+    assert (table.compare(100, [3, 4], [1, (1, 3)]) == budgets - 100).all()
+    per_party = np.array([[100], [2000]])
+    assert (table.compare(per_party, [3, 4], [1, (1, 3)]) == budgets - per_party).all()
+    # Loot worth more than the budget is negative
+    assert table.compare([[200]], [4], [1])[0, 0] == -25
+
+
+def test_errors(table):
+    with pytest.raises(LevelError):
+        table.budget(0)
+    with pytest.raises(LevelError):
+        table.budget(5, 21)
+    with pytest.raises(LevelError):
+        table.budgets([4], [(1, 3), (19, 21)])
+    with pytest.raises(ValueError):
+        table.budget(1, party_size=0)
+    with pytest.raises(ValueError):
+        table.budgets([4, 0], [1])
+
+
+def test_custom_table():
+    table = TreasureTable([(100, 20, 5), (200, 40, 10)])
+    assert table.max_level == 2
+    assert table.budget(1, 2) == 300
+    assert table.budget(2, party_size=5) == 200 + 160 // 4 + 10
+    with pytest.raises(LevelError):
+        table.budget(3)
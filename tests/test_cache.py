@@ -0,0 +1,109 @@
+from pf2e_wealth_calculator.cache import DiskCache, LRUCache
+
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+def test_lru_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.cache_info() == (3, 1, 1, 2, 2)
+
+
+def test_lru_clear():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_lru_invalid_size():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+
+def test_disk_cache_persists(tmp_path):
+    path = str(tmp_path / "items.sqlite3")
+    cache = DiskCache(path, namespace="v1")
+    cache.put("longsword", {"gp": 1})
+    assert cache.get("longsword") == {"gp": 1}
+    assert cache.get("shortsword") is None
+    cache.close()
+
+    cache = DiskCache(path, namespace="v1")
+    assert cache.get("longsword") == {"gp": 1}
+    assert cache.cache_info() == (2, 1, 0, 50_000, 1)
+    cache.close()
+
+    # Values computed from other tables are dropped
+    cache = DiskCache(path, namespace="v2")
+    assert cache.get("longsword") is None
+    assert cache.cache_info() == (0, 1, 0, 50_000, 0)
+    cache.close()
+
+
+def test_disk_cache_eviction(tmp_path):
+    path = str(tmp_path / "items.sqlite3")
+    cache = DiskCache(path, maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    cache.get("a")  # "b" is now the least recently used
+    cache.close()
+
+    cache = DiskCache(path, maxsize=2)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.cache_info().evictions == 1
+
+
+def test_disk_cache_broken_file(tmp_path):
+    path = tmp_path / "items.sqlite3"
+    path.write_bytes(b"not a database")
+    cache = DiskCache(str(path))
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_disk_cache_shared(tmp_path):
+    path = str(tmp_path / "items.sqlite3")
+    cache = DiskCache(path)
+    cache.put("b", 2)
+    cache.close()
+
+    # A long run that has read and stored entries doesn't lock out other processes
+    cache = DiskCache(path)
+    assert cache.get("b") == 2
+    cache.put("a", 1)
+    code = (
+        "from pf2e_wealth_calculator.cache import DiskCache\n"
+        f"cache = DiskCache({path!r})\n"
+        "assert cache.get('b') == 2\n"
+        "cache.put('c', 3)\n"
+        "cache.close()\n"
+    )
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+    assert result.returncode == 0, result.stderr
+    assert time.perf_counter() - start < 5
+    cache.close()
+
+    cache = DiskCache(path)
+    assert [cache.get(key) for key in "abc"] == [1, 2, 3]
+    assert cache.cache_info().currsize == 3
+    cache.close()
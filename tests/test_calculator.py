@@ -0,0 +1,139 @@
+from pf2e_wealth_calculator import (
+    ItemNotFoundError,
+    LevelError,
+    Money,
+    Origins,
+    WealthCalculator,
+)
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return WealthCalculator()
+
+
+def test_price(calculator):
+    item = calculator.price("+1 Striking Longsword", 2)
+
+    assert item.name == "+1 striking longsword"
+    assert item.price == Money(gp=202)
+    assert item.level == 4
+
+
+@pytest.mark.parametrize(
+    "name, suggestion",
+    [("longsward", "longsword"), ("+1 striking longsward", "")],
+)
+def test_price_unknown(calculator, name, suggestion, capsys):
+    with pytest.raises(ItemNotFoundError) as err:
+        calculator.price(name)
+
+    assert err.value.name == name
+    if suggestion:
+        assert err.value.suggestion == suggestion
+    # Nothing is printed, even the first time
+    assert capsys.readouterr().out == ""
+
+
+def test_price_many(calculator, capsys):
+    chunks = []
+    report = calculator.price_many(
+        ["Longsword", ("12 sp", 3), ("*20 gp", 1), "shortsward", "shortsward"],
+        currency=5,
+        on_priced=chunks.append,
+    )
+
+    assert report.money[Origins.ITEM] == Money(gp=1)
+    assert report.money[Origins.CURRENCY] == Money(sp=6, gp=8, origin=Origins.CURRENCY)
+    assert report.total == Money(sp=6, gp=29, origin=Origins.TOTAL, check_origin=False)
+    assert report.difference(30) == 1
+    assert report.unknown == ["shortsward"]
+    assert report.stats.categories == {
+        "weapons": 1,
+        "currency": 3,
+        "art objects": 1,
+        "error": 2,
+    }
+    assert len(chunks) == 1 and len(chunks[0]) == 5
+    assert capsys.readouterr().out == ""
+
+
+def test_price_file(calculator, tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsword, 2\n12 sp\n")
+    report = calculator.price_file(str(path), convert=False)
+
+    assert report.stats == pf.get_file_stats(str(path))
+    assert report.money[Origins.CURRENCY] == Money(sp=12, origin=Origins.CURRENCY)
+
+
+@pytest.mark.parametrize(
+    "level, budget", [(1, 175), ("1", 175), ("1-3", 975), ((3, 1), 975)]
+)
+def test_budget(calculator, level, budget):
+    assert calculator.budget(level) == budget
+
+
+@pytest.mark.parametrize("level", ["0", "21", "1-25", "one", "1-2-3", "", 2.5])
+def test_budget_invalid(calculator, level):
+    with pytest.raises(LevelError):
+        calculator.budget(level)
+
+
+def test_budgets(calculator):
+    budgets = calculator.budgets([3, 4, 6], ["1", "1-3", (5, 8)])
+
+    assert budgets.shape == (3, 3)
+    assert budgets[1, 0] == 175 and budgets[1, 1] == 975
+    assert budgets[2, 2] == calculator.budget("5-8", party_size=6)
+    differences = calculator.compare_budgets([[100], [200], [300]], [3, 4, 6], ["1"])
+    assert differences[1, 0] == -25
+    with pytest.raises(ValueError):
+        calculator.budget(1, party_size=0)
+
+
+def test_random_items(calculator):
+    first = calculator.random_items(5, "2-4", seed=7)
+    second = calculator.random_items(5, (2, 4), seed=7)
+
+    assert first == second
+    assert all(2 <= item.level <= 4 for item in first)
+    rare = calculator.random_items(20, 3, rarity_weights={"common": 0, "uncommon": 0})
+    assert all(item.rarity in ("rare", "unique") for item in rare)
+    with pytest.raises(LevelError):
+        calculator.random_items(1, "1000")
+
+
+def test_treasure_parcel(calculator):
+    parcel = calculator.treasure_parcel(4, seed=1)
+
+    assert parcel.budget.gp == 860
+    assert abs(parcel.value.gp - 860) <= 86
+    assert parcel.currency.gp >= 200
+    assert all(4 <= record.level <= 5 for record in parcel.items)
+    assert calculator.treasure_parcel(4, party_size=6).budget.gp == (
+        calculator.budget(4, party_size=6)
+    )
+
+
+def test_find_items(calculator):
+    page = calculator.find_items("4-7", 20, 150, ["consumables"], ["uncommon"], limit=5)
+
+    assert len(page.items) == 5 and page.total > 5
+    assert all(20 <= item.price.gp <= 150 for item in page.items)
+    assert all(item.rarity == "uncommon" for item in page.items)
+
+
+def test_cli_level_errors(capsys):
+    with pytest.raises(SystemExit) as err:
+        pf.get_value_from_level(pf.convert_input_level("30"))
+
+    assert err.value.code == 1
+    assert capsys.readouterr().out == "Please only insert a level between 1 and 20\n"
+
+    with pytest.raises(SystemExit):
+        pf.get_value_from_level(3, party_size=0)
+    assert capsys.readouterr().out == "A party needs at least one PC\n"
@@ -0,0 +1,115 @@
+from pf2e_wealth_calculator.catalog import (
+    ItemCatalog,
+    ItemRecord,
+    get_catalog,
+    load_catalog,
+    read_snapshot,
+    write_snapshot,
+)
+from pf2e_wealth_calculator.structs import Money
+import pytest
+
+
+@pytest.fixture
+def catalog():
+    return ItemCatalog(
+        [
+            ItemRecord(
+                "probing cane", "common", "assistive items", "none", 0, "5 sp", "L"
+            ),
+            ItemRecord(
+                "probing cane", "common", "weapons", "base weapons", 0, "5 sp", "L"
+            ),
+            ItemRecord("longsword", "common", "weapons", "base weapons", 0, "1 gp", 1),
+            ItemRecord("striking", "common", "runes", "none", 4, "65 gp", 0),
+        ],
+        ["silver"],
+    )
+
+
+def test_get(catalog):
+    assert catalog.get("longsword") == catalog["longsword"]
+    assert catalog.get("longsword").price == "1 gp"
+    assert catalog.get("shortsword") is None
+    assert "longsword" in catalog and "shortsword" not in catalog
+    with pytest.raises(KeyError):
+        catalog["shortsword"]
+
+
+def test_get_duplicates(catalog):
+    assert catalog.get("probing cane").category == "assistive items"
+    assert catalog.get("probing cane", category="weapons").category == "weapons"
+    assert catalog.get("longsword", category="runes") is None
+    assert len(catalog.get_all("probing cane")) == 2
+
+
+def test_secondary_indexes(catalog):
+    assert [r.name for r in catalog.by_category["runes"]] == ["striking"]
+    assert len(catalog.by_rarity["common"]) == 4
+    assert [r.name for r in catalog.in_level_range(1, 5)] == ["striking"]
+    assert len(catalog.in_level_range(0, 20)) == 4
+
+
+def test_bundled_catalog():
+    catalog = get_catalog()
+    assert catalog is get_catalog()
+    assert len(catalog) == len(catalog.names) > 4000
+    assert "cold iron" in catalog.materials
+    assert catalog.get("longsword").bulk == 1
+
+
+def test_snapshot_roundtrip(tmp_path):
+    path = str(tmp_path / "catalog.pickle")
+    catalog = get_catalog()
+
+    assert read_snapshot(path, key="abc") is None
+    write_snapshot(catalog, path, key="abc")
+
+    snapshot = read_snapshot(path, key="abc")
+    assert snapshot is not None
+    assert snapshot.records == catalog.records
+    assert snapshot.get("longsword") == catalog.get("longsword")
+
+    # A snapshot of different tables is stale
+    assert read_snapshot(path, key="def") is None
+
+
+def test_load_catalog_rebuilds_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setenv("PF2EWC_CACHE_DIR", str(tmp_path))
+    path = tmp_path / "catalog.pickle"
+
+    catalog = load_catalog()
+    assert path.exists()
+    assert read_snapshot(str(path)).records == catalog.records
+
+    path.write_bytes(b"not a pickle")
+    assert load_catalog().records == catalog.records
+    assert read_snapshot(str(path)) is not None
+
+
+def test_partitions(catalog):
+    weapons = catalog.partition("weapons")
+    assert weapons is catalog.partition("weapons")
+    assert [r.category for r in weapons.get_all("probing cane")] == ["weapons"]
+    assert weapons.get("striking") is None
+
+    # Categories that weren't partitioned at load time are built on demand
+    assist = catalog.partition("assist")
+    assert assist.names == ["probing cane"]
+    assert assist.materials == catalog.materials
+
+
+def test_bundled_partitions():
+    catalog = get_catalog()
+    runes = catalog.partition("runes")
+    assert len(runes) == len(catalog.by_category["runes"])
+    assert runes.get("striking (greater)").level == 12
+    assert runes.get("longsword") is None
+
+
+def test_price(catalog):
+    assert catalog.price(catalog["longsword"]) == Money(gp=1)
+    assert catalog.price(catalog["probing cane"], 3) == Money(sp=15)
+    # Records from elsewhere are parsed on the spot
+    record = ItemRecord("rope", "common", "gear", "none", 0, "1 gp 5 sp", 1)
+    assert catalog.price(record, 2) == Money(sp=10, gp=2)
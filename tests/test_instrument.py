@@ -0,0 +1,54 @@
+from pf2e_wealth_calculator import instrument
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pytest
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    pf.item_cache.clear()
+    monkeypatch.setattr(instrument, "timings", {})
+    monkeypatch.setattr(instrument, "entries", instrument.Counter())
+    monkeypatch.setattr(instrument, "counters", instrument.Counter())
+    monkeypatch.setattr(instrument, "enabled", False)
+    instrument.enable()
+    yield
+    pf.item_cache.clear()
+
+
+def test_disabled():
+    assert not instrument.enabled
+    with instrument.stage("nothing"):
+        instrument.count("nothing")
+
+    assert "nothing" not in instrument.timings
+    assert "nothing" not in instrument.counters
+
+
+def test_lookup_counters(enabled, tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text(
+        "longsword, 2\n12 sp\n+1 striking flaming longsword\ncold iron dagger low\n"
+    )
+    pf.get_file_stats(str(path))
+    pf.price_item("longsward", quiet=False)
+    pf.price_item("longsward", quiet=False)
+
+    assert instrument.counters["loot.rows"] == 4
+    assert instrument.counters["loot.currency"] == 1
+    assert instrument.counters["loot.joined"] == 1
+    assert instrument.counters["runes.tokens"] == 3
+    assert instrument.counters["lookup.material"] == 1
+    assert instrument.counters["lookup.fuzzy"] == 1
+    assert instrument.counters["cache.memory_hit"] == 1
+    assert set(instrument.timings) >= {"read", "price"}
+
+
+def test_summary(enabled, capsys):
+    with instrument.stage("price"):
+        instrument.count("lookup.exact", 3)
+    instrument.print_summary()
+
+    err = capsys.readouterr().err
+    assert err.startswith("Stages:\n  - price: ")
+    assert err.endswith("(1x)\nCounters:\n  - lookup.exact: 3\n")
@@ -0,0 +1,110 @@
+from pf2e_wealth_calculator.ledger import Ledger
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pandas as pd
+
+
+def same_stats(first, second) -> bool:
+    """Compare stats regardless of the order of their histograms."""
+
+    return pf.get_totals(first) == pf.get_totals(second) and all(
+        dict(sorted(getattr(first, name).items()))
+        == dict(sorted(getattr(second, name).items()))
+        for name in ("levels", "categories", "subcategories", "rarities")
+    )
+
+
+def test_ledger_updates(tmp_path, monkeypatch):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsword, 2\n12 sp\n+1 striking longsword\nlongsword, 2\n")
+    first = pf.get_ledger_stats(str(path))
+    assert first == pf.get_file_stats(str(path))
+
+    priced = []
+    price_loot = pf.price_loot
+
+    def counted_price_loot(loot, *args):
+        priced.extend(loot["name"])
+        return price_loot(loot, *args)
+
+    monkeypatch.setattr(pf, "price_loot", counted_price_loot)
+
+    # Nothing to do if the file didn't change
+    assert pf.get_ledger_stats(str(path)) == first
+    assert priced == []
+
+    path.write_text("longsword, 2\n*20 gp\n+1 striking longsword\nchain mail\n")
+    stats = pf.get_ledger_stats(str(path))
+    assert priced == ["*20 gp", "chain mail"]
+    assert same_stats(stats, pf.get_file_stats(str(path)))
+
+
+def test_ledger_warnings(tmp_path, capsys):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsward\nlongsword\n")
+    pf.get_ledger_stats(str(path))
+    warning = capsys.readouterr().out
+    assert "longsward" in warning
+
+    # Unknown items are warned about on every run, changed file or not
+    for text in ("longsward\nlongsword\n", "longsward\nlongsword\nkukri\n"):
+        path.write_text(text)
+        for _ in range(2):
+            pf.forget_warnings()
+            pf.get_ledger_stats(str(path))
+            assert capsys.readouterr().out == warning
+
+
+def test_ledger_removes_empty_keys(tmp_path):
+    ledger = Ledger(str(tmp_path / "loot.txt"))
+    loot = pd.DataFrame([("longsword", 2), ("12 sp", 1)], columns=["name", "amount"])
+    ledger.add_prices(pf.price_loot(loot))
+    assert ledger.update({("longsword", 2): 3, ("12 sp", 1): 1}) == 2
+    assert ledger.stats.categories == {"weapons": 6, "currency": 1}
+    assert ledger.stats.money[pf.Origins.ITEM] == pf.Money(gp=6)
+
+    assert ledger.update({("12 sp", 1): 1}) == 1
+    assert ledger.stats.categories == {"currency": 1}
+    assert ledger.stats.money[pf.Origins.ITEM] == pf.Money()
+    assert list(ledger.lines) == [("12 sp", 1)]
+
+
+def test_ledger_empty_lines(tmp_path, capsys):
+    path = tmp_path / "loot.txt"
+
+    def output(incremental: bool) -> str:
+        pf.console_entry_point(
+            [str(path)], None, 0, True, False, 1, "text", incremental
+        )
+        return capsys.readouterr().out
+
+    # Lines with no items still show up in the histograms, as they do without a ledger
+    for text in ("longsword\nchain mail, 0\n", "longsword\n", "chain mail, 0\n"):
+        path.write_text(text)
+        assert output(True) == output(False)
+    assert "Armor: 0" in output(True)
+
+
+def test_ledger_stale_tables(tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsword\n")
+    pf.get_ledger_stats(str(path))
+
+    assert Ledger.load(str(path)).counts == {("longsword", 1): 1}
+    assert Ledger.load(str(path), key="other tables").counts == {}
+
+
+def test_watch_files(tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsword\n")
+    runs = []
+
+    def run():
+        runs.append(path.read_text())
+        if len(runs) == 1:
+            path.write_text("longsword\nshortsword\n")
+        else:
+            raise KeyboardInterrupt
+
+    pf.watch_files([str(path)], run, interval=0.01)
+    assert runs == ["longsword\n", "longsword\nshortsword\n"]
@@ -0,0 +1,53 @@
+from pf2e_wealth_calculator.loot import iter_loot, iter_loot_chunks, parse_amount
+import gzip
+import pytest
+
+
+@pytest.mark.parametrize(
+    "amount, result",
+    [("", 1), (" ", 1), ("3", 3), (" 12 ", 12), ("2.5", 2), ("2x", 0), ("lots", 0)],
+)
+def test_parse_amount(amount, result):
+    assert parse_amount(amount) == result
+
+
+def test_iter_loot():
+    lines = [
+        "# Weapons\n",
+        "Longsword\n",
+        "\n",
+        "   \n",
+        "Sunrod, 5\n",
+        "oil of potency,\n",
+        "12gp, 2\n",
+        '"Lantern (Hooded)", 2\n',
+    ]
+    assert list(iter_loot(lines)) == [
+        ("longsword", 1),
+        ("sunrod", 5),
+        ("oil of potency", 1),
+        ("12gp", 2),
+        ("lantern (hooded)", 2),
+    ]
+
+
+def test_iter_loot_files(tmp_path):
+    text = "longsword, 2\n# comment\n+1 striking longsword\n"
+    plain = tmp_path / "loot.txt"
+    plain.write_text(text)
+    gzipped = tmp_path / "loot.txt.gz"
+    with gzip.open(gzipped, "wt") as file:
+        file.write(text)
+
+    expected = [("longsword", 2), ("+1 striking longsword", 1)]
+    assert list(iter_loot(str(plain))) == expected
+    assert list(iter_loot(str(gzipped))) == expected
+
+
+def test_iter_loot_chunks():
+    records = ((f"item {i}", i) for i in range(25))
+    chunks = list(iter_loot_chunks(records, size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[-1].columns.tolist() == ["name", "amount"]
+    assert chunks[-1]["amount"].tolist() == [20, 21, 22, 23, 24]
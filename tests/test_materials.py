@@ -0,0 +1,103 @@
+from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord
+from pf2e_wealth_calculator.materials import MaterialIndex, material_kind, parse_grade
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pytest
+
+
+def material(name, level, price):
+    return ItemRecord(name, "uncommon", "materials", "none", level, price, 0)
+
+
+@pytest.fixture
+def index():
+    catalog = ItemCatalog(
+        [
+            material("adamantine weapon (standard-grade)", 11, "1400 gp"),
+            material("adamantine weapon (high-grade)", 17, "13500 gp"),
+            material("adamantine object (standard-grade)", 8, "350 gp (per bulk)"),
+        ],
+        ["adamantine", "cold iron"],
+    )
+    return MaterialIndex(catalog)
+
+
+def test_get(index):
+    price = index.get("adamantine", "weapon", "high")
+    assert price.record.level == 17
+    assert price.coins == (0, 0, 13500)
+
+    assert index.get("adamantine", "weapon", "low") is None
+    assert index.get("adamantine", "dagger", "high") is None
+    assert index.get("mithral", "weapon", "high") is None
+    assert index.grades("adamantine", "weapon") == ["standard", "high"]
+
+
+@pytest.mark.parametrize(
+    "material, kind, grade, error",
+    [
+        (
+            "adamantine",
+            "weapon",
+            "low",
+            "Adamantine weapons can only be standard-grade or high-grade, not low-grade",
+        ),
+        (
+            "adamantine",
+            "object",
+            None,
+            "The grade of adamantine is missing, it can be standard-grade",
+        ),
+        ("cold iron", "armor", "low", "Cold iron can't be used for a armor"),
+    ],
+)
+def test_grade_error(index, material, kind, grade, error):
+    assert index.grade_error(material, kind, grade) == error
+
+
+@pytest.mark.parametrize(
+    "item_name, category, kind",
+    [
+        ("longsword", "weapons", "weapon"),
+        ("steel shield", "shields", "shield"),
+        ("buckler", "shields", "buckler"),
+        ("chain", "adventuring gear", "object"),
+    ],
+)
+def test_material_kind(item_name, category, kind):
+    assert material_kind(item_name, category) == kind
+
+
+@pytest.mark.parametrize(
+    "word, grade", [("low", "low"), ("(high-grade)", "high"), ("(lesser)", None)]
+)
+def test_parse_grade(word, grade):
+    assert parse_grade(word) == grade
+
+
+@pytest.mark.parametrize(
+    "item_name, warning",
+    [
+        (
+            "adamantine dagger low",
+            'WARNING: Ignoring item "adamantine dagger (low-grade)". Adamantine '
+            "weapons can only be standard-grade or high-grade, not low-grade.\n",
+        ),
+        (
+            "silver dagger",
+            'WARNING: Ignoring item "silver dagger". The grade of silver is missing, '
+            "it can be low-grade, standard-grade or high-grade.\n",
+        ),
+    ],
+)
+def test_parse_invalid_grade(item_name, warning, capsys):
+    assert pf.parse_database(item_name, 1).category == "error"
+    assert capsys.readouterr().out == warning
+
+
+@pytest.mark.parametrize(
+    "item_name, price",
+    [("darkwood lumber", 5000), ("cold iron blanch (lesser)", 10)],
+)
+def test_parse_material_named_items(item_name, price):
+    assert pf.parse_database(item_name, 1).price.gp == price
@@ -0,0 +1,138 @@
+from pf2e_wealth_calculator.calculator import WealthCalculator
+from pf2e_wealth_calculator.output import CsvWriter, JsonlWriter, JsonWriter
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import csv
+import io
+import json
+
+import pandas as pd
+import pytest
+
+LOOT = "longsword, 2\n12 sp\n*20 gp\n+1 striking longsword\nlongsward\n"
+
+
+@pytest.fixture
+def loot_file(tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text(LOOT)
+    return str(path)
+
+
+def test_writers_stream_items():
+    priced = pf.price_loot(
+        pd.DataFrame([("longsword", 2), ("*20 gp", 1)], columns=["name", "amount"])
+    )
+    streams = {}
+    for writer_cls in (JsonWriter, JsonlWriter, CsvWriter):
+        stream = io.StringIO()
+        with writer_cls(stream) as writer:
+            writer.write_priced(priced)
+            writer.write_priced(priced.iloc[:1])
+        streams[writer_cls] = stream.getvalue()
+
+    items = json.loads(streams[JsonWriter])["items"]
+    lines = [json.loads(line) for line in streams[JsonlWriter].splitlines()]
+    rows = list(csv.DictReader(io.StringIO(streams[CsvWriter])))
+
+    assert [item["name"] for item in items] == ["longsword", "*20 gp", "longsword"]
+    assert items[0]["gp"] == 2 and items[0]["copper"] == 200
+    assert items[1]["origin"] == "art object"
+    assert lines == [{"type": "item", **item} for item in items]
+    assert [row["name"] for row in rows] == ["longsword", "*20 gp", "longsword"]
+    # Every row has exactly the columns of the header
+    assert all(None not in row and None not in row.values() for row in rows)
+    assert rows[0]["bulk"] == "1" and items[0]["bulk"] == 1
+    assert rows[1]["copper"] == "2000" and rows[1]["bulk"] == "0"
+
+
+def test_empty_json():
+    stream = io.StringIO()
+    with JsonWriter(stream):
+        pass
+    assert json.loads(stream.getvalue()) == {"items": []}
+
+
+def test_console_json(loot_file, capsys):
+    pf.console_entry_point([loot_file], "1", 0, False, False, output="json")
+    out, err = capsys.readouterr()
+    result = json.loads(out)
+
+    stats = pf.get_files_stats([loot_file])
+    totals = pf.get_totals(stats)
+    assert [item["name"] for item in result["items"]] == [
+        "longsword",
+        "12 sp",
+        "*20 gp",
+        "+1 striking longsword",
+        "longsward",
+    ]
+    assert result["totals"]["total"]["gp"] == totals[pf.Origins.TOTAL].gp == 124
+    assert result["converted"] is True
+    assert result["expected_gp"] == 175 and result["difference_gp"] == 51
+    assert result["categories"] == stats.categories
+    # Warnings don't end up in the structured output
+    assert "longsward" in err
+
+
+def test_console_json_invalid_level(loot_file, capsys):
+    with pytest.raises(SystemExit):
+        pf.console_entry_point([loot_file], "30", 0, False, False, output="json")
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err == "Please only insert a level between 1 and 20\n"
+
+
+def test_console_csv_summary(loot_file, capsys):
+    pf.console_entry_point([loot_file], None, 5, False, True, output="csv")
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+
+    totals = {row["name"]: row for row in rows if row["type"] == "total"}
+    assert totals["currency"]["gp"] == "5" and totals["currency"]["sp"] == "12"
+    assert not any(row["type"] == "expected" for row in rows)
+    assert {"item": 5, "rarity": 1} == {
+        kind: sum(row["type"] == kind for row in rows) for kind in ("item", "rarity")
+    }
+
+
+def test_single_item_jsonl(capsys):
+    pf.find_single_item("+1 Striking Longsword", output="jsonl")
+    (line,) = capsys.readouterr().out.splitlines()
+
+    assert json.loads(line) == {
+        "type": "item",
+        "name": "+1 striking longsword",
+        "amount": 1,
+        "origin": "item",
+        "cp": 0,
+        "sp": 0,
+        "gp": 101,
+        "copper": 10100,
+        "level": 4,
+        "category": "weapons",
+        "subcategory": "base weapons",
+        "rarity": "common",
+        "bulk": 1,
+    }
+
+
+def test_random_items_json(capsys):
+    pf.generate_random_items(4, "3", output="json")
+    items = json.loads(capsys.readouterr().out)["items"]
+
+    assert len(items) == 4
+    assert all(item["level"] == 3 for item in items)
+
+
+def test_random_items_seed(capsys):
+    pf.generate_random_items(4, "3", output="json", seed=5)
+    first = capsys.readouterr().out
+    pf.generate_random_items(4, "3", output="json", seed=5)
+
+    assert capsys.readouterr().out == first
+    # The same seed gives the same items as the API
+    items = WealthCalculator().random_items(4, "3", seed=5)
+    assert [item["name"] for item in json.loads(first)["items"]] == [
+        item.name for item in items
+    ]
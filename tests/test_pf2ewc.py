@@ -1,4 +1,5 @@
 import pf2e_wealth_calculator.pf2ewc as pf
+import pandas as pd
 import pytest
 
 
@@ -575,3 +576,147 @@ def test_runes(item_name, amount, item_info):
 )
 def test_rarity_order(rar1, rar2, result):
     assert pf.get_higher_rarity(rar1, rar2) == result
+
+
+def test_price_loot():
+    loot = pd.DataFrame(
+        {
+            "name": ["longsword", "25 gp", "*12,300 sp", "+1 chain mail", "zzzz"],
+            "amount": [2, 1, 1, 1, 3],
+        }
+    )
+    priced = pf.price_loot(loot)
+
+    assert priced["origin"].tolist() == [
+        pf.Origins.ITEM,
+        pf.Origins.CURRENCY,
+        pf.Origins.ART_OBJECT,
+        pf.Origins.ITEM,
+        pf.Origins.ITEM,
+    ]
+    assert priced["gp"].tolist() == [2, 25, 0, 166, 0]
+    assert priced["sp"].tolist() == [0, 0, 12300, 0, 0]
+    assert priced["copper"].tolist() == [200, 2500, 123000, 16600, 0]
+    assert priced["level"].tolist() == [0, 0, 0, 5, 0]
+    assert priced["category"].tolist() == [
+        "weapons",
+        "currency",
+        "art objects",
+        "armor",
+        "error",
+    ]
+
+
+def test_loot_stats():
+    loot = pd.DataFrame(
+        {
+            "name": ["+1 chain mail", "longsword", "silver maul low", "12 sp", "kukri"],
+            "amount": [1, 2, 1, 4, 1],
+        }
+    )
+    money = {origin: pf.Money(origin=origin) for origin in pf.Origins}
+    levels, categories, subcategories, rarities = {}, {}, {}, {}
+    pf.get_loot_stats(loot, money, levels, categories, subcategories, rarities)
+
+    assert money[pf.Origins.ITEM] == pf.Money(sp=6, gp=216)
+    assert money[pf.Origins.CURRENCY] == pf.Money(sp=48, origin=pf.Origins.CURRENCY)
+    assert levels == {"5": 1, "0": 7, "2": 1}
+    assert list(categories.items()) == [("armor", 1), ("weapons", 4), ("currency", 4)]
+    assert subcategories == {"base armor": 1, "base weapons": 4, "none": 4}
+    assert rarities == {"common": 8, "uncommon": 1}
+
+
+@pytest.mark.parametrize(
+    "item_name, amount, price",
+    [
+        ("longsword", 3, pf.Money(gp=3)),
+        ("12 sp", 4, pf.Money(sp=48, origin=pf.Origins.CURRENCY)),
+        ("+1 striking longsword", 2, pf.Money(gp=202)),
+        ("silver maul low", 2, pf.Money(gp=96)),
+    ],
+)
+def test_price_item_amount(item_name, amount, price):
+    assert pf.price_item(item_name, amount, cache=None).price == price
+
+
+def test_price_item_cache():
+    cache = pf.LRUCache(maxsize=8)
+    first = pf.price_item("+1 Striking  Longsword", 1, cache=cache)
+    second = pf.price_item("+1 striking longsword", 2, cache=cache)
+
+    assert cache.cache_info().hits == 1 and cache.cache_info().misses == 1
+    assert first.name == second.name == "+1 striking longsword"
+    assert first.price == pf.Money(gp=101)
+    assert second.price == pf.Money(gp=202)
+
+
+def test_price_item_disk_cache(tmp_path, monkeypatch):
+    disk_cache = pf.DiskCache(str(tmp_path / "items.sqlite3"))
+    monkeypatch.setattr(pf, "disk_cache", disk_cache)
+    first = pf.price_item("+1 striking longsword", 1, cache=pf.LRUCache(maxsize=8))
+    pf.price_item("longsward", 1, cache=pf.LRUCache(maxsize=8))
+
+    # A hit on disk doesn't need the catalog
+    monkeypatch.setattr(pf, "get_catalog", None)
+    second = pf.price_item("+1 striking longsword", 2, cache=pf.LRUCache(maxsize=8))
+
+    assert second == pf.replace(first, price=pf.Money(gp=202))
+    assert disk_cache.cache_info()[:2] == (1, 2)
+    assert disk_cache.get("longsward") is None
+    disk_cache.close()
+
+
+def test_files_stats_parallel(tmp_path, capsys):
+    files = []
+    for i, lines in enumerate(
+        [
+            ["+1 chain mail", "longsword,2", "12 sp,4"],
+            ["kukri", "silver maul low", "longsward"],
+            ["*20 gp", "longsword,3", "lantern (hooded)"],
+        ]
+    ):
+        path = tmp_path / f"loot{i}.txt"
+        path.write_text("\n".join(lines))
+        files.append(str(path))
+
+    pf.item_cache.clear()
+    serial = pf.get_files_stats(files + files, jobs=1)
+    serial_output = capsys.readouterr().out
+    pf.item_cache.clear()
+    pf.forget_warnings()
+    parallel = pf.get_files_stats(files + files, jobs=2)
+
+    assert parallel == serial
+    assert list(parallel.categories) == list(serial.categories)
+    assert capsys.readouterr().out == serial_output
+    assert serial_output.count("longsward") == 1
+
+
+def test_loot_stats_merge():
+    first = pf.LootStats(levels={"0": 2, "3": 1}, rarities={"common": 3})
+    first.money[pf.Origins.ITEM] += pf.Money(gp=5)
+    second = pf.LootStats(levels={"3": 2, "1": 1}, rarities={"rare": 1})
+    second.money[pf.Origins.ITEM] += pf.Money(sp=4)
+
+    first.merge(second)
+    assert first.money[pf.Origins.ITEM] == pf.Money(sp=4, gp=5)
+    assert list(first.levels.items()) == [("0", 2), ("3", 3), ("1", 1)]
+    assert first.rarities == {"common": 3, "rare": 1}
+
+
+@pytest.mark.parametrize(
+    "item_name, gp, level",
+    [
+        # The called rune used to swallow the next word of the name
+        ("+1 called dagger", 385, 7),
+        ("+1 energy adaptive chain mail", 2766, 13),
+        ("+2 striking (greater) flaming (greater) longsword", 8501, 15),
+        # Specific items whose names start with the name of a rune
+        ("+2 holy avenger", 5435, 14),
+        ("+1 frost brand", 10035, 16),
+        ("+1 striking brilliant rapier", 4600, 14),
+    ],
+)
+def test_rune_names(item_name, gp, level):
+    item = pf.rune_calculator(item_name, 1)
+    assert (item.price.gp, item.level) == (gp, level)
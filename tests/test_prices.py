@@ -0,0 +1,41 @@
+from pf2e_wealth_calculator.prices import parse_coins, parse_currency
+from pf2e_wealth_calculator.structs import Money, Origins
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "price_str, coins",
+    [
+        ("12 gp", (0, 0, 12)),
+        ("3cp", (3, 0, 0)),
+        ("1,600 gp", (0, 0, 1600)),
+        ("1,200,000 gp", (0, 0, 1200000)),
+        ("2.5 gp", (0, 5, 2)),
+        ("12,5 sp", (5, 12, 0)),
+        ("0.25 gp", (5, 2, 0)),
+        ("1 gp 5 sp", (0, 5, 1)),
+        ("1 sp 7 cp (per 1000 bricks)", (7, 1, 0)),
+        ("5 sp (-5 gp see text)", (0, 5, 0)),
+        ("(Varies)", (0, 0, 0)),
+        (float("nan"), (0, 0, 0)),
+    ],
+)
+def test_parse_coins(price_str, coins):
+    assert parse_coins(price_str) == coins
+
+
+@pytest.mark.parametrize(
+    "item_name, amount, money",
+    [
+        ("12 gp", 1, Money(gp=12, origin=Origins.CURRENCY)),
+        ("1,200 sp", 2, Money(sp=2400, origin=Origins.CURRENCY)),
+        ("*  7gp", 1, Money(gp=7, origin=Origins.ART_OBJECT)),
+        ("*1.5 gp", 2, Money(sp=10, gp=2, origin=Origins.ART_OBJECT)),
+        ("10 gp 5 sp", 1, Money(sp=5, gp=10, origin=Origins.CURRENCY)),
+        ("longsword", 1, None),
+        ("gp", 1, None),
+    ],
+)
+def test_parse_currency(item_name, amount, money):
+    assert parse_currency(item_name, amount) == money
@@ -0,0 +1,129 @@
+from pf2e_wealth_calculator.catalog import ItemCatalog, ItemRecord, get_catalog
+from pf2e_wealth_calculator.query import (
+    ItemIndex,
+    get_item_index,
+    parse_price,
+    parse_range,
+    query_entry_point,
+)
+
+import json
+
+import pytest
+
+
+def item(name, level, price, category="consumables", rarity="common"):
+    return ItemRecord(name, rarity, category, "none", level, price, 0)
+
+
+@pytest.fixture
+def index():
+    return ItemIndex(
+        ItemCatalog(
+            [
+                item("potion", 1, "4 gp"),
+                item("elixir", 4, "20 gp", rarity="uncommon"),
+                item("bomb", 5, "25 gp"),
+                item("sword", 5, "25 gp", category="weapons"),
+                item("scroll", 7, "150 gp", rarity="uncommon"),
+                item("wand", 7, "160 gp", rarity="rare"),
+                item("torch", 0, "1 cp", category="adventuring gear"),
+            ]
+        )
+    )
+
+
+def names(page):
+    return [record.name for record in page.items]
+
+
+def test_query_ranges(index):
+    page = index.query((4, 7), (2000, 15000), ["consumables"])
+    assert names(page) == ["elixir", "bomb", "scroll"]
+    assert page.total == 3
+
+    assert names(index.query(rarities=["uncommon", "rare"])) == [
+        "elixir",
+        "scroll",
+        "wand",
+    ]
+    assert names(index.query((None, 1))) == ["torch", "potion"]
+    assert names(index.query(prices=(10_000, None))) == ["scroll", "wand"]
+    assert index.query(prices=(20_000, 10_000)).total == 0
+    assert index.query(categories=["nothing"]).total == 0
+
+
+def test_query_pages(index):
+    page = index.query(offset=2, limit=3)
+    assert names(page) == ["elixir", "bomb", "sword"]
+    assert (page.total, page.offset) == (7, 2)
+
+    assert names(index.query(descending=True, limit=2)) == ["wand", "scroll"]
+    assert names(index.query(sort="name", limit=3)) == ["bomb", "elixir", "potion"]
+    assert names(index.query(sort="level", descending=True, limit=2)) == [
+        "wand",
+        "scroll",
+    ]
+    assert index.query(offset=10).items == []
+    with pytest.raises(ValueError):
+        index.query(sort="bulk")
+
+
+def test_query_catalog():
+    catalog = get_catalog()
+    page = get_item_index().query((4, 7), (2000, 15000), ["consumables"], ["uncommon"])
+    expected = [
+        record
+        for record in catalog.records
+        if 4 <= record.level <= 7
+        and 2000 <= catalog.price(record).copper <= 15000
+        and record.category == "consumables"
+        and record.rarity == "uncommon"
+    ]
+
+    assert sorted(page.items) == sorted(expected)
+    prices = [catalog.price(record).copper for record in page.items]
+    assert prices == sorted(prices)
+
+
+@pytest.mark.parametrize(
+    "price, copper",
+    [
+        ("150", 15000),
+        ("1.5", 150),
+        ("1,200", 120000),
+        ("1,500", 150000),
+        ("1,5", 150),
+        ("1,234,567", 123456700),
+        ("20 gp", 2000),
+        ("1,200 gp", 120000),
+        ("5sp", 50),
+    ],
+)
+def test_parse_price(price, copper):
+    assert parse_price(price) == copper
+
+
+def test_parse_range():
+    assert parse_range("4-7", int) == (4, 7)
+    assert parse_range("4-", int) == (4, None)
+    assert parse_range("-7", int) == (None, 7)
+    assert parse_range("4", int) == (4, 4)
+    assert parse_range("7-4", int) == (4, 7)
+    assert parse_range(None, int) == (None, None)
+    assert parse_range("5 sp-2 gp", parse_price) == (50, 200)
+    with pytest.raises(ValueError):
+        parse_range("cheap-2", parse_price)
+
+
+def test_query_cli(capsys):
+    query_entry_point(
+        ["-l", "4-7", "-p", "20-150", "-c", "consumables", "--per-page", "3"]
+    )
+    out = capsys.readouterr().out
+    assert "Items 1-3 of " in out
+
+    query_entry_point(["-l", "4", "-r", "unique", "-s", "name", "-o", "jsonl"])
+    items = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert items
+    assert all(item["level"] == 4 and item["rarity"] == "unique" for item in items)
@@ -0,0 +1,96 @@
+from pf2e_wealth_calculator.catalog import ItemRecord
+from pf2e_wealth_calculator.runes import RuneIndex, pick, spellings
+
+import pytest
+
+
+def rune(name, level=1, price="1 gp"):
+    return ItemRecord(name, "common", "runes", "none", level, price, 0)
+
+
+@pytest.fixture
+def index():
+    return RuneIndex(
+        [
+            rune("striking"),
+            rune("striking (greater)", 12),
+            rune("ghost touch"),
+            rune("called (accessory rune)", 3),
+            rune("called (weapon rune)", 7),
+            rune("dragon's breath (2nd-level spell)", 5),
+            rune("dragon's breath (1st-level spell)", 3),
+            rune("weapon potency (+1)", 2, "35 gp"),
+            rune("armor potency (+1)", 5, "160 gp"),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "name, words",
+    [
+        ("striking", [("striking",)]),
+        ("striking (greater)", [("striking", "(greater)"), ("greater", "striking")]),
+        ("called (weapon rune)", [("called", "(weapon", "rune)"), ("called",)]),
+    ],
+)
+def test_spellings(name, words):
+    assert spellings(name) == words
+
+
+def test_parse(index):
+    words = "+2 greater striking ghost touch cold iron longsword low".split()
+    potency, runes, base = index.parse(words)
+
+    assert potency == "+2"
+    assert [index.price(key).record.name for key in runes] == [
+        "striking (greater)",
+        "ghost touch",
+    ]
+    assert base == ["cold", "iron", "longsword", "low"]
+
+
+def test_parse_items(index):
+    items = {"ghost touch blade", "touch blade", "blade"}
+    words = "+1 striking ghost touch blade".split()
+
+    _, runes, base = index.parse(words, items.__contains__)
+    assert len(runes) == 1 and base == ["ghost", "touch", "blade"]
+    # A shorter rune is tried when the longest one leaves no item
+    index = RuneIndex([rune("striking"), rune("ghost"), rune("ghost touch")])
+    _, runes, base = index.parse(words, {"touch blade"}.__contains__)
+    assert [index.price(key).record.name for key in runes] == ["striking", "ghost"]
+    assert base == ["touch", "blade"]
+    # Without any item to leave, the longest runes are taken
+    assert index.parse(words, set().__contains__) == index.parse(words)
+
+
+def test_parse_no_base(index):
+    potency, runes, base = index.parse(["+1", "striking", "(greater)"])
+    assert potency == "+1"
+    assert index.price(runes[0]).record.name == "striking (greater)"
+    assert base == []
+
+
+def test_potency(index):
+    assert index.match(["weapon", "potency"]) == (0, None)
+    assert index.price("+1", "weapons").coins == (0, 0, 35)
+    assert index.price("+1", "armor").record.name == "armor potency (+1)"
+    assert index.price("+1", "shields") is None
+    assert index.price("+1") is None
+
+
+def test_price_by_category(index):
+    _, called = index.match(["called"])
+    assert index.price(called, "weapons").record.name == "called (weapon rune)"
+    assert index.price(called, "armor").record.name == "called (accessory rune)"
+    assert index.price(called, "worn items").record.name == "called (accessory rune)"
+
+    _, breath = index.match(["dragon's", "breath"])
+    breath_rune = index.price(breath, "weapons")
+    assert breath_rune.record.name == "dragon's breath (1st-level spell)"
+    assert breath_rune.coins == (0, 0, 1)
+
+
+def test_pick():
+    plain, graded = rune("bane"), rune("bane (weapon rune)")
+    assert pick([graded, plain], "armor") is plain
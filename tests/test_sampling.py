@@ -0,0 +1,58 @@
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.sampling import get_sampler, treasure_parcel
+from pf2e_wealth_calculator.structs import LevelError
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def sampler():
+    return get_sampler()
+
+
+def test_level_slice(sampler):
+    catalog = get_catalog()
+    assert sampler.records[sampler.level_slice(2, 4)] == catalog.in_level_range(2, 4)
+    assert sampler.records[sampler.level_slice(7, 7)] == catalog.by_level[7]
+    assert sampler.records[sampler.level_slice(1000, 2000)] == []
+
+
+def test_sample_seeded(sampler):
+    first = sampler.sample(50, 2, 4, seed=3)
+
+    assert first == sampler.sample(50, 2, 4, seed=3)
+    assert first != sampler.sample(50, 2, 4, seed=4)
+    assert all(2 <= record.level <= 4 for record in first)
+    with pytest.raises(LevelError):
+        sampler.sample(1, 1000, 1000)
+
+
+def test_sample_weights(sampler):
+    weapons = sampler.sample(
+        200, category_weights={"weapons": 1e9}, rarity_weights={"unique": 0}, seed=1
+    )
+    assert {record.category for record in weapons} == {"weapons"}
+    assert "unique" not in {record.rarity for record in weapons}
+
+    with pytest.raises(ValueError):
+        sampler.sample(1, rarity_weights=dict.fromkeys(sampler.rarities, 0))
+
+
+@pytest.mark.parametrize("level", [1, 5, 20, "3-6"])
+@pytest.mark.parametrize("tolerance", [0.1, 0.01])
+def test_treasure_parcel(level, tolerance):
+    parcel = treasure_parcel(level, tolerance, seed=11)
+    items = sum(get_catalog().price(record).copper for record in parcel.items)
+
+    assert parcel.budget.gp == pf.treasure_budget(level)
+    assert parcel.value.copper == items + parcel.currency.copper
+    assert abs(parcel.value.copper - parcel.budget.copper) <= (
+        tolerance * parcel.budget.copper
+    )
+    assert parcel == treasure_parcel(level, tolerance, seed=11)
+
+
+def test_treasure_parcel_invalid():
+    with pytest.raises(LevelError):
+        treasure_parcel(21)
@@ -0,0 +1,136 @@
+from pf2e_wealth_calculator.client import parse_address, send_request
+from pf2e_wealth_calculator.server import handle_request, start_server
+import pf2e_wealth_calculator.pf2ewc as pf
+
+import asyncio
+import contextlib
+import io
+import socket
+
+import pytest
+
+
+def local_output(function, *args) -> str:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        function(*args)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "address, parsed",
+    [
+        ("8765", ("127.0.0.1", 8765)),
+        ("localhost:9000", ("localhost", 9000)),
+        ("/tmp/pf2ewc.sock", "/tmp/pf2ewc.sock"),
+        ("pf2ewc.sock", "pf2ewc.sock"),
+    ],
+)
+def test_parse_address(address, parsed):
+    assert parse_address(address) == parsed
+
+
+def test_handle_item():
+    response = handle_request({"op": "item", "name": "+1 striking longsword"})
+
+    assert response["status"] == 0
+    assert response["output"] == local_output(
+        pf.find_single_item, "+1 striking longsword"
+    )
+
+
+def test_handle_loot_stdin(tmp_path):
+    loot = "longsword, 2\n12 sp\n*20 gp\n"
+    path = tmp_path / "loot.txt"
+    path.write_text(loot)
+
+    response = handle_request({"op": "loot", "files": ["-"], "stdin": loot})
+
+    assert response["status"] == 0
+    assert response["output"] == local_output(
+        pf.console_entry_point, [str(path)], None, 0, False, False
+    )
+
+
+def test_handle_unknown_items(tmp_path):
+    path = tmp_path / "loot.txt"
+    path.write_text("longswrd\n")
+    warning = 'WARNING: Ignoring item "longswrd"'
+
+    # Every request warns about the typo, like a command run on its own would
+    for _ in range(2):
+        response = handle_request({"op": "item", "name": "longswrd"})
+        assert warning in response["output"]
+    response = handle_request({"op": "loot", "files": [str(path)]})
+    assert warning in response["output"]
+
+
+def test_handle_loot_files(tmp_path):
+    secret = tmp_path / "secret.csv"
+    secret.write_text("hunter2\n")
+
+    response = handle_request({"op": "loot", "files": [str(secret)]})
+    assert response["status"] == 1
+    assert "hunter2" not in response["output"]
+    assert handle_request({"op": "loot", "files": [1]})["status"] == 1
+
+
+def test_handle_errors():
+    assert handle_request({"op": "random", "count": 2, "level": "x"})["status"] == 1
+    assert handle_request({"op": "item"})["status"] == 1
+    assert handle_request({"op": "sell"})["status"] == 2
+    assert handle_request({"op": ["item"]})["status"] == 2
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"op": "item", "name": 5},
+        {"op": "random", "count": "3"},
+        {"op": "random", "count": 3, "level": 2},
+        {"op": "loot", "files": "loot.txt"},
+        {"op": "loot", "files": ["-"], "stdin": ["longsword"]},
+    ],
+)
+def test_handle_bad_types(request_):
+    response = handle_request(request_)
+    assert response["status"] == 2
+    assert "Bad request" in response["error"]
+
+
+def test_handle_loot_jobs(tmp_path, monkeypatch):
+    path = tmp_path / "loot.txt"
+    path.write_text("longsword\n")
+    calls = []
+    monkeypatch.setattr(pf, "console_entry_point", lambda *args: calls.append(args))
+
+    # The server never forks worker processes, whatever the request asks for
+    handle_request({"op": "loot", "files": [str(path)], "jobs": 4})
+    assert calls[0][5] == 1
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_server_roundtrip(tmp_path):
+    address = str(tmp_path / "pf2ewc.sock")
+
+    async def run():
+        server = await start_server(address)
+        async with server:
+            return await asyncio.gather(
+                *(
+                    asyncio.to_thread(send_request, request, address)
+                    for request in [
+                        {"op": "item", "name": "longsword"},
+                        {"op": "random", "count": 3, "level": "2"},
+                        "not a request",
+                        {"op": "item", "name": 5},
+                    ]
+                )
+            )
+
+    item, rand, bad, badly_typed = asyncio.run(run())
+
+    assert item == handle_request({"op": "item", "name": "longsword"})
+    assert rand["status"] == 0 and rand["output"].count("│ ") >= 3 * 7
+    assert bad["status"] == 2
+    assert badly_typed["status"] == 2
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def environment(tmp_path_factory):
+    """Environment of a cache directory with a catalog snapshot, like after a first run."""
+
+    env = {**os.environ, "PF2EWC_CACHE_DIR": str(tmp_path_factory.mktemp("cache"))}
+    subprocess.run(
+        [sys.executable, "-m", "pf2e_wealth_calculator.catalog"],
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    return env
+
+
+@pytest.mark.parametrize(
+    "args, modules",
+    [
+        (["--format"], ("pandas", "numpy")),
+        (["--tbl"], ("pandas", "numpy")),
+        (["-i", "+1 striking cold iron longsword (low)"], ("pandas", "numpy")),
+        # Random items are drawn by the vectorized sampler
+        (["-r", "3", "-l", "2-4"], ("pandas",)),
+    ],
+)
+def test_cli_modes_without_pandas(args, modules, environment):
+    code = (
+        "import sys\n"
+        "from pf2e_wealth_calculator.entry_point import entry_point\n"
+        f"sys.argv = ['pf2ewc', *{args!r}]\n"
+        "try:\n"
+        "    entry_point()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"loaded = [m for m in sys.modules if m.split('.')[0] in {modules!r}]\n"
+        "assert not loaded, loaded\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=environment
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout
@@ -0,0 +1,78 @@
+from pf2e_wealth_calculator.structs import (
+    ItemInfo,
+    LootStats,
+    Money,
+    OriginError,
+    Origins,
+)
+
+from dataclasses import FrozenInstanceError, replace
+import pickle
+import pytest
+
+
+def test_slots():
+    money = Money(1, 2, 3)
+    item = ItemInfo("longsword", money, "weapons")
+
+    assert not hasattr(money, "__dict__") and not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        money.pp = 1
+    with pytest.raises(FrozenInstanceError):
+        item.level = 1
+
+
+def test_pickle_and_replace():
+    item = ItemInfo("longsword", Money(gp=1), "weapons", "base weapons", 0, "common", 1)
+
+    assert pickle.loads(pickle.dumps(item)) == item
+    assert replace(item, price=item.price * 3).price == Money(gp=3)
+
+
+def test_accumulate():
+    total = Money(1, 2, 3)
+    same = total.accumulate(Money(gp=4))
+    assert same is total and total == Money(1, 2, 7)
+
+    assert total.add_coins(cp=5, gp=1) == Money(6, 2, 8)
+
+    with pytest.raises(OriginError):
+        total.accumulate(Money(origin=Origins.CURRENCY))
+    with pytest.raises(TypeError):
+        total.accumulate(1)
+
+    unchecked = Money(origin=Origins.TOTAL, check_origin=False)
+    unchecked.accumulate(Money(sp=1, origin=Origins.CURRENCY))
+    assert unchecked.sp == 1 and unchecked.origin == Origins.TOTAL
+
+
+def test_loot_stats_merge_copies():
+    first, second = LootStats(), LootStats()
+    second.money[Origins.ITEM].add_coins(gp=2)
+
+    first.merge(second)
+    first.merge(second)
+    assert first.money[Origins.ITEM] == Money(gp=4)
+    assert second.money[Origins.ITEM] == Money(gp=2)
+
+
+@pytest.mark.parametrize(
+    "money, copper",
+    [(Money(), 0), (Money(5, 3, 2), 235), (Money(150, 25), 400), (Money(gp=7), 700)],
+)
+def test_copper(money, copper):
+    assert money.copper == copper
+    assert Money.from_copper(copper).copper == copper
+
+
+def test_from_copper():
+    assert Money.from_copper(1234) == Money(4, 3, 12)
+    assert Money.from_copper(5, Origins.CURRENCY).origin == Origins.CURRENCY
+
+
+def test_converted():
+    money = Money(250, 35, 1, Origins.ART_OBJECT)
+    assert money.converted() == Money(50, 5, 6, Origins.ART_OBJECT)
+    # Coins are exchanged for gp only, never for each other
+    assert Money(99, 0, 0).converted() == Money(99, 0, 0)
+    assert money == Money(250, 35, 1, Origins.ART_OBJECT)
@@ -0,0 +1,28 @@
+from pf2e_wealth_calculator.catalog import get_catalog
+from pf2e_wealth_calculator.suggest import SuggestionIndex, closest_name
+from difflib import get_close_matches
+import pytest
+
+
+@pytest.mark.parametrize(
+    "word",
+    ["longsward", "composite", "weapon", "armor", "ceag", "smokestik (leser)", "zz"],
+)
+def test_same_as_difflib(word):
+    names = get_catalog().names
+    assert get_catalog().suggestions.best(word) == closest_name(word, names)
+
+
+def test_top_k():
+    names = ["longsword", "longbow", "shortsword"]
+    suggestions = SuggestionIndex(names + ["longsword"]).suggest("longswrd", 2)
+
+    assert [name for name, _ in suggestions] == get_close_matches(
+        "longswrd", names, 2, 0
+    )
+    assert [name for name, _ in suggestions] == ["longsword", "longbow"]
+    assert 1 > suggestions[0][1] > suggestions[1][1] > 0
+
+
+def test_empty_index():
+    assert SuggestionIndex([]).best("longsword") == ""